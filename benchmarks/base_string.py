@@ -0,0 +1,74 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Compare the signature base string engine against the previous oauthlib
+collect/normalize pipeline, for typical and large query strings.
+
+    python -m benchmarks.base_string
+"""
+from timeit import repeat
+from urllib import parse
+
+from oauthlib.oauth1.rfc5849 import signature as oauth
+from rndi.authentication.starlette.oauth10a.base_string import base_string_uri, signature_base_string
+from rndi.authentication.starlette.oauth10a.parser import parse_authorization_header
+
+HEADER = (
+    'OAuth '
+    'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+    'oauth_signature_method="HMAC-SHA1", '
+    'oauth_timestamp="1686919540", '
+    'oauth_nonce="RZQd4m3S0Iu", '
+    'oauth_version="1.0", '
+    'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"'
+)
+
+QUERIES = {
+    'no query': b'',
+    'typical query (3)': b'limit=10&offset=0&order=-created',
+    'large query (200)': '&'.join(f'key{i}=value%20{i}' for i in range(200)).encode('latin-1'),
+}
+
+
+def legacy(query_string: bytes) -> str:
+    # the previous adapter normalized the query with starlette QueryParams and
+    # let oauthlib collect the parameters from the query and the header.
+    query = parse.urlencode(parse.parse_qsl(query_string.decode('latin-1'), keep_blank_values=True))
+    parameters = oauth.normalize_parameters(oauth.collect_parameters(
+        uri_query=query,
+        headers={'authorization': HEADER},
+    ))
+    return oauth.signature_base_string('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections', parameters)
+
+
+def engine(query_string: bytes, protocol_parameters) -> str:
+    return signature_base_string(
+        'GET',
+        base_string_uri('https', 'cosmopolitan.aks.int.zone', '/aps/2/collections'),
+        query_string.decode('latin-1'),
+        protocol_parameters,
+    )
+
+
+def measure(function, number: int, *args) -> float:
+    return min(repeat(lambda: function(*args), number=number, repeat=5)) / number
+
+
+def main():
+    protocol_parameters = parse_authorization_header(HEADER).parameters
+
+    print(f"{'case':<22}{'oauthlib ops/sec':>18}{'engine ops/sec':>18}{'speedup':>10}")
+    for case, query_string in QUERIES.items():
+        assert legacy(query_string) == engine(query_string, protocol_parameters)
+
+        number = 200 if len(query_string) > 1000 else 5000
+        baseline = measure(legacy, number, query_string)
+        candidate = measure(engine, number, query_string, protocol_parameters)
+        print(f"{case:<22}{1 / baseline:>18.0f}{1 / candidate:>18.0f}{baseline / candidate:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
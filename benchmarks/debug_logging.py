@@ -0,0 +1,130 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Measure the per-request cost of the adapter logging with debug disabled, the
+lazy logging against the eager f-string formatting done before, and the cost
+of the debug and trace levels when enabled.
+
+    python -m benchmarks.debug_logging
+"""
+import logging
+from timeit import repeat
+from typing import Dict
+
+from starlette.requests import Request
+from rndi.authentication.starlette.adapters.oauth10a import OAuth10aRequestAuthenticatorAdapter
+from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.log import TRACE
+from rndi.authentication.starlette.oauth10a.base_string import signature_base_string
+from rndi.authentication.starlette.oauth10a.parser import parse_authorization_header
+
+AUTHORIZATION = (
+    'OAuth '
+    'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+    'oauth_signature_method="HMAC-SHA1", '
+    'oauth_timestamp="1686919540", '
+    'oauth_nonce="RZQd4m3S0Iu", '
+    'oauth_version="1.0",'
+    'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"'
+)
+
+CREDENTIALS = {
+    'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+    'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                     'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+    'resource_owner_secret': '',
+}
+
+URL = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+
+SCOPE = {
+    'type': 'http',
+    'method': 'GET',
+    'scheme': 'https',
+    'path': '/aps/2/collections/service-plans',
+    'root_path': '',
+    'query_string': b'',
+    'headers': [
+        (b'host', b'cosmopolitan.aks.int.zone'),
+        (b'authorization', AUTHORIZATION.encode('latin-1')),
+    ],
+}
+
+
+class StaticCredentialsRepository(CredentialsRepository):
+    def get(self, key: str) -> Dict[str, str]:
+        return CREDENTIALS
+
+
+AUTHORIZATION_PARAMETERS = parse_authorization_header(AUTHORIZATION)
+BASE_STRING = signature_base_string('GET', URL, '', AUTHORIZATION_PARAMETERS.parameters)
+
+
+def eager(logger: logging.LoggerAdapter):
+    # the f-strings the adapter used to build on every request, whatever the level.
+    authorization = AUTHORIZATION_PARAMETERS
+    logger.debug("OAuth10aRequestAuthenticatorAdapter: authenticating request with {driver} driver.".format(
+        driver='oauth10a',
+    ))
+    logger.debug(f"OAuth10aRequestAuthenticatorAdapter: {authorization}")
+    logger.debug(f"OAuth10aRequestAuthenticatorAdapter: method: {'GET'}")
+    logger.debug(f"OAuth10aRequestAuthenticatorAdapter: url: {URL}")
+    logger.debug(f"OAuth10aRequestAuthenticatorAdapter: query string: {''}")
+    logger.debug(f"OAuth10aRequestAuthenticatorAdapter: base string: {BASE_STRING}")
+    logger.debug(f"OAuth10aRequestAuthenticatorAdapter: received signature: {authorization.oauth_signature}")
+
+
+def lazy(logger: logging.LoggerAdapter):
+    # the logging calls the adapter does now on the successful path.
+    authorization = AUTHORIZATION_PARAMETERS
+    logger.debug("OAuth10aRequestAuthenticatorAdapter: authenticating request with %s driver.", 'oauth10a')
+    logger.log(TRACE, "OAuth10aRequestAuthenticatorAdapter: %r", authorization)
+    if logger.isEnabledFor(TRACE):
+        logger.log(
+            TRACE,
+            "OAuth10aRequestAuthenticatorAdapter: method: %s, url: %s, query string: %s, base string: %s, "
+            "received signature: %s",
+            'GET',
+            URL,
+            '',
+            BASE_STRING,
+            authorization.oauth_signature,
+        )
+
+
+def measure(name: str, function, number: int):
+    elapsed = min(repeat(function, number=number, repeat=5)) / number
+    print(f"{name:<34}{elapsed * 1e6:>12.3f}{1 / elapsed:>14.0f}")
+
+
+def main(number: int = 20000):
+    base = logging.getLogger('benchmark')
+    base.addHandler(logging.NullHandler())
+    base.propagate = False
+    logger = logging.LoggerAdapter(base, {})
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(logger, StaticCredentialsRepository())
+
+    def authenticate():
+        # a new scope per call, a reused one would return the memoized AuthResult.
+        authenticator.authenticate(Request(dict(SCOPE)))
+
+    print(f"{'case':<34}{'us/op':>12}{'ops/sec':>14}")
+
+    base.setLevel(logging.INFO)
+    measure('logging only, eager (info)', lambda: eager(logger), number)
+    measure('logging only, lazy (info)', lambda: lazy(logger), number)
+    measure('authenticate, lazy (info)', authenticate, number)
+
+    base.setLevel(logging.DEBUG)
+    measure('authenticate, lazy (debug)', authenticate, number)
+
+    base.setLevel(TRACE)
+    measure('authenticate, lazy (trace)', authenticate, number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Measure the cold start cost of the provider, each case runs in a fresh
+interpreter: the import of the provider alone, the first unauthorized and
+oauth10a authenticators, and the unauthorized authenticator after the
+previous eager import of every adapter module (with oauthlib). The
+starlette import is measured apart as the baseline any application pays
+anyway. Then compare the repeated provide_request_authenticator calls with
+and without the memoization.
+
+    python -m benchmarks.imports
+"""
+import json
+import statistics
+import subprocess
+import sys
+from logging import getLogger, LoggerAdapter
+from timeit import repeat
+from unittest.mock import MagicMock
+
+from rndi.authentication.starlette.provider import provide_request_authenticator, REQUEST_AUTH_DRIVER
+
+_PROVIDER = 'from rndi.authentication.starlette.provider import provide_request_authenticator'
+_BUILD = 'provide_request_authenticator({config}, MagicMock(), MagicMock())'
+_EAGER = (
+    'import oauthlib.oauth1, rndi.authentication.starlette.adapters.oauth10a, '
+    'rndi.authentication.starlette.adapters.composite'
+)
+
+CASES = {
+    'starlette.requests (baseline)': 'import starlette.requests',
+    'provider import': _PROVIDER,
+    'provider + unauthorized': f'{_PROVIDER}; {_BUILD.format(config="{}")}',
+    'provider + oauth10a': f'{_PROVIDER}; {_BUILD.format(config=repr({REQUEST_AUTH_DRIVER: "oauth10a"}))}',
+    'eager + unauthorized': f'{_PROVIDER}; {_EAGER}; {_BUILD.format(config="{}")}',
+}
+
+# the prelude is not measured, it is the same for all the cases.
+_MEASURE = """
+import sys, time, json
+from unittest.mock import MagicMock
+start = time.perf_counter()
+{code}
+print(json.dumps([time.perf_counter() - start, len(sys.modules)]))
+"""
+
+
+def cold(code: str, runs: int) -> tuple:
+    samples = []
+    modules = 0
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, '-c', _MEASURE.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, modules = json.loads(output)
+        samples.append(elapsed)
+    return statistics.median(samples), modules
+
+
+def main(runs: int = 15):
+    print(f"{'cold start':<32}{'ms (median)':>14}{'modules':>10}")
+    for name, code in CASES.items():
+        elapsed, modules = cold(code, runs)
+        print(f"{name:<32}{elapsed * 1e3:>14.2f}{modules:>10}")
+
+    logger = LoggerAdapter(getLogger('benchmark'), {})
+    repository = MagicMock()
+    config = {REQUEST_AUTH_DRIVER: 'oauth10a'}
+
+    print(f"\n{'provide_request_authenticator':<32}{'us/call':>14}")
+    for name, cache in (('memoized (cache=True)', True), ('rebuilt', False)):
+        number = 2000
+        elapsed = min(repeat(
+            lambda: provide_request_authenticator(config, logger, repository, cache=cache),  # noqa: B023
+            number=number,
+            repeat=5,
+        )) / number
+        print(f"{name:<32}{elapsed * 1e6:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Compare the jwt authenticator with and without the verified token cache, with
+an HS256 token and, if cryptography is installed, an RS256 one. Each call
+builds a new request, so the per request memoization of the AuthResult does
+not hide the verification.
+
+    python -m benchmarks.jwt
+"""
+import hashlib
+import hmac
+import json
+from base64 import urlsafe_b64encode
+from logging import getLogger, LoggerAdapter
+from time import time
+from timeit import repeat
+from typing import Callable, Dict, Optional
+
+from starlette.requests import Request
+from rndi.authentication.starlette.adapters.jwt import JWTRequestAuthenticatorAdapter
+from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.jwt.token import VerifiedTokenCache
+
+SECRET = 'Ylh2oDiCXh5ITeKXWGUvpWmgNDXJU0tC'
+CLAIMS = {'iss': 'https://issuer.example.com', 'sub': 'subscription-1', 'scope': 'read write', 'exp': 0}
+
+
+class InMemoryCredentialsRepository(CredentialsRepository):
+    def __init__(self, credentials: Dict[str, Dict[str, str]]):
+        self.__credentials = credentials
+
+    def get(self, key: str) -> Dict[str, str]:
+        return self.__credentials.get(key, {})
+
+
+def encode(value: bytes) -> str:
+    return urlsafe_b64encode(value).decode('ascii').rstrip('=')
+
+
+def token(kid: str, algorithm: str, sign: Callable[[bytes], bytes]) -> str:
+    header = encode(json.dumps({'alg': algorithm, 'typ': 'JWT', 'kid': kid}).encode('utf-8'))
+    claims = encode(json.dumps({**CLAIMS, 'exp': int(time()) + 3600}).encode('utf-8'))
+    return f'{header}.{claims}.{encode(sign(f"{header}.{claims}".encode("ascii")))}'
+
+
+def request(authorization: str) -> Request:
+    return Request({
+        'type': 'http',
+        'method': 'GET',
+        'path': '/aps/2/collections/service-plans',
+        'query_string': b'',
+        'headers': [(b'host', b'cosmopolitan.aks.int.zone'), (b'authorization', authorization.encode('latin-1'))],
+    })
+
+
+def rsa_case() -> Optional[tuple]:
+    try:
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding, rsa
+    except ImportError:
+        print('cryptography is not installed, skipping RS256.')
+        return None
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    public_key = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode('ascii')
+    return (
+        {'rsa_key': public_key},
+        token('rsa', 'RS256', lambda message: private_key.sign(message, padding.PKCS1v15(), hashes.SHA256())),
+    )
+
+
+def main(number: int = 20000):
+    logger = LoggerAdapter(getLogger('benchmark'), {})
+    credentials = {'jwt:hmac': {'client_secret': SECRET}}
+    tokens = {'HS256': token('hmac', 'HS256', lambda m: hmac.new(SECRET.encode(), m, hashlib.sha256).digest())}
+    rsa = rsa_case()
+    if rsa is not None:
+        credentials['jwt:rsa'], tokens['RS256'] = rsa
+    repository = InMemoryCredentialsRepository(credentials)
+
+    print(f"{'authenticate':<26}{'us/op':>12}{'ops/sec':>14}")
+    for algorithm, authorization in tokens.items():
+        for name, cache in (('verified', None), ('cached', VerifiedTokenCache())):
+            authenticator = JWTRequestAuthenticatorAdapter(logger, repository, token_cache=cache)
+            header = f'Bearer {authorization}'
+            elapsed = min(repeat(
+                lambda: authenticator.authenticate(request(header)),  # noqa: B023
+                number=number,
+                repeat=5,
+            )) / number
+            print(f"{f'{algorithm} ({name})':<26}{elapsed * 1e6:>12.3f}{1 / elapsed:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,344 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Offline end-to-end load test of a Starlette app protected by the authenticator
+from provide_request_authenticator (sync) or provide_async_request_authenticator
+(async), with an in-memory credentials repository with artificial latency.
+
+A corpus of correctly and incorrectly signed OAuth 1.0a requests is generated
+before the run, then sent concurrently through the httpx ASGI transport (or to
+a running server with --url). Reports the throughput, the latency percentiles,
+and the responses and rejection reasons by kind of request.
+
+    python -m benchmarks.loadtest --backend both --latency 5 --concurrency 64
+
+To load test a local uvicorn instead of the in-process transport:
+
+    LOADTEST_BACKEND=async LOADTEST_LATENCY=5 uvicorn --factory benchmarks.loadtest:make_app --workers 4
+    python -m benchmarks.loadtest --url http://127.0.0.1:8000
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+from oauthlib.oauth1.rfc5849 import signature as oauth
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from rndi.authentication.starlette.contract import (
+    AsyncCredentialsRepository,
+    AuthenticationObserver,
+    CredentialsRepository,
+)
+from rndi.authentication.starlette.middleware import RequestAuthenticatorMiddleware
+from rndi.authentication.starlette.oauth10a.base_string import base_string_uri, escape, signature_base_string
+from rndi.authentication.starlette.oauth10a.signature import Credential
+from rndi.authentication.starlette.provider import (
+    provide_async_request_authenticator,
+    provide_request_authenticator,
+)
+
+PATH = '/aps/2/collections/service-plans'
+BASE_URL = 'http://loadtest.local'
+
+VALID = 'valid'
+INVALID_SIGNATURE = 'invalid signature'
+UNKNOWN_KEY = 'unknown key'
+MISSING_HEADER = 'missing header'
+MALFORMED_HEADER = 'malformed header'
+
+INVALID_KINDS = (INVALID_SIGNATURE, UNKNOWN_KEY, MISSING_HEADER, MALFORMED_HEADER)
+
+SYNC = 'sync'
+ASYNC = 'async'
+
+
+@dataclass
+class SignedRequest:
+    kind: str
+    url: str
+    headers: Dict[str, str]
+
+
+def make_credentials(consumers: int) -> Dict[str, Dict[str, str]]:
+    credentials = {}
+    for i in range(consumers):
+        key = f'consumer-{i:04d}'
+        credentials[key] = {
+            'client_key': key,
+            'client_secret': f'{i:04d}-4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2',
+            'resource_owner_secret': '',
+        }
+    return credentials
+
+
+class InMemoryCredentialsRepository(CredentialsRepository):
+    def __init__(self, credentials: Dict[str, Dict[str, str]], latency: float = 0.0):
+        self.__credentials = credentials
+        self.__latency = latency
+
+    def get(self, key: str) -> Dict[str, str]:
+        if self.__latency > 0:
+            time.sleep(self.__latency)
+        return self.__credentials.get(key, {})
+
+
+class AsyncInMemoryCredentialsRepository(AsyncCredentialsRepository):
+    def __init__(self, credentials: Dict[str, Dict[str, str]], latency: float = 0.0):
+        self.__credentials = credentials
+        self.__latency = latency
+
+    async def get(self, key: str) -> Dict[str, str]:
+        if self.__latency > 0:
+            await asyncio.sleep(self.__latency)
+        return self.__credentials.get(key, {})
+
+
+class OutcomeCounter(AuthenticationObserver):
+    """
+    Count the authentication outcomes, accepted or the rejection reason.
+    """
+
+    def __init__(self):
+        self.outcomes: Counter = Counter()
+
+    def stage(self, driver: str, stage: str, seconds: float):
+        pass
+
+    def outcome(self, driver: str, outcome: str, seconds: float):
+        self.outcomes[outcome] += 1
+
+
+def make_app(
+        backend: Optional[str] = None,
+        latency: Optional[float] = None,
+        consumers: int = 100,
+        config: Optional[dict] = None,
+        observer: Optional[AuthenticationObserver] = None,
+) -> Starlette:
+    """
+    Build the protected Starlette app, the backend and the latency in
+    milliseconds default to the LOADTEST_BACKEND and LOADTEST_LATENCY
+    environment variables, so it can be used as uvicorn factory.
+
+    :param backend: Optional[str] The credentials repository backend, sync or async.
+    :param latency: Optional[float] The artificial latency of the credentials lookup in milliseconds.
+    :param consumers: int The number of known consumer keys.
+    :param config: Optional[dict] The authenticator configuration.
+    :param observer: Optional[AuthenticationObserver] The authentication observer.
+    :return: Starlette The protected app.
+    """
+    backend = backend or os.environ.get('LOADTEST_BACKEND', SYNC)
+    latency = float(os.environ.get('LOADTEST_LATENCY', 0) if latency is None else latency) / 1000
+    config = {'REQUEST_AUTH_DRIVER': 'oauth10a'} if config is None else config
+
+    base = logging.getLogger('loadtest')
+    base.addHandler(logging.NullHandler())
+    base.propagate = False
+    logger = logging.LoggerAdapter(base, {})
+
+    credentials = make_credentials(consumers)
+    if backend == ASYNC:
+        repository = AsyncInMemoryCredentialsRepository(credentials, latency)
+        authenticator = provide_async_request_authenticator(config, logger, repository, observer=observer)
+    else:
+        repository = InMemoryCredentialsRepository(credentials, latency)
+        authenticator = provide_request_authenticator(config, logger, repository, observer=observer)
+
+    async def collection(_: Request):
+        return PlainTextResponse('OK')
+
+    return Starlette(
+        routes=[Route(PATH, collection)],
+        middleware=[Middleware(RequestAuthenticatorMiddleware, authenticator=authenticator)],
+    )
+
+
+def _sign(
+        base_url: str,
+        query_string: str,
+        credential: Credential,
+        parameters: Dict[str, str],
+) -> str:
+    url = urlsplit(base_url)
+    uri = base_string_uri(url.scheme, url.netloc, url.path.rstrip('/') + PATH)
+    return oauth.sign_hmac_sha1_with_client(signature_base_string('GET', uri, query_string, parameters), credential)
+
+
+def make_request(
+        kind: str,
+        index: int,
+        base_url: str,
+        credentials: Dict[str, Dict[str, str]],
+        rng: random.Random,
+) -> SignedRequest:
+    """
+    Build one correctly or incorrectly signed OAuth 1.0a request.
+
+    :param kind: str The kind of request, valid or one of INVALID_KINDS.
+    :param index: int The request number, used for the unique nonce.
+    :param base_url: str The base url the request is sent to.
+    :param credentials: Dict[str, Dict[str, str]] The known credentials.
+    :param rng: random.Random The random generator.
+    :return: SignedRequest The request.
+    """
+    query_string = f'limit=10&offset={rng.randrange(1000)}&order=-created'
+    url = f"{base_url.rstrip('/')}{PATH}?{query_string}"
+    if kind == MISSING_HEADER:
+        return SignedRequest(kind, url, {})
+
+    data = credentials[rng.choice(sorted(credentials))]
+    credential = Credential(data['client_key'], data['client_secret'], data['resource_owner_secret'])
+    if kind == UNKNOWN_KEY:
+        credential = Credential('unknown-consumer', credential.client_secret, '')
+
+    parameters = {
+        'oauth_consumer_key': credential.client_key,
+        'oauth_signature_method': 'HMAC-SHA1',
+        'oauth_timestamp': str(int(time.time())),
+        'oauth_nonce': f'{index:08d}{rng.getrandbits(32):08x}',
+        'oauth_version': '1.0',
+    }
+    # an invalid signature is the signature of another query string.
+    signed = query_string + '&tampered=1' if kind == INVALID_SIGNATURE else query_string
+    parameters['oauth_signature'] = _sign(base_url, signed, credential, parameters)
+
+    header = 'OAuth ' + ', '.join(f'{name}="{escape(value)}"' for name, value in parameters.items())
+    if kind == MALFORMED_HEADER:
+        header = header.replace('=', ' ', 1)
+
+    return SignedRequest(kind, url, {'authorization': header})
+
+
+def make_corpus(
+        size: int,
+        invalid_ratio: float,
+        base_url: str,
+        credentials: Dict[str, Dict[str, str]],
+        seed: int = 0,
+) -> List[SignedRequest]:
+    """
+    Pre-generate the requests of the run, the invalid ones are evenly split
+    between the INVALID_KINDS.
+
+    :param size: int The number of requests.
+    :param invalid_ratio: float The ratio of incorrectly signed requests.
+    :param base_url: str The base url the requests are sent to.
+    :param credentials: Dict[str, Dict[str, str]] The known credentials.
+    :param seed: int The seed of the random generator.
+    :return: List[SignedRequest] The requests.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(size):
+        kind = rng.choice(INVALID_KINDS) if rng.random() < invalid_ratio else VALID
+        corpus.append(make_request(kind, index, base_url, credentials, rng))
+    return corpus
+
+
+async def drive(
+        client: httpx.AsyncClient,
+        corpus: List[SignedRequest],
+        concurrency: int,
+) -> Tuple[float, List[float], Counter]:
+    """
+    Send the corpus with the given number of concurrent clients.
+
+    :param client: httpx.AsyncClient The client.
+    :param corpus: List[SignedRequest] The requests.
+    :param concurrency: int The number of concurrent clients.
+    :return: Tuple[float, List[float], Counter] The elapsed seconds, the latencies and the (kind, status) counts.
+    """
+    latencies: List[float] = []
+    responses: Counter = Counter()
+    pending = iter(corpus)
+
+    async def worker():
+        for request in pending:
+            start = perf_counter()
+            response = await client.get(request.url, headers=request.headers)
+            latencies.append(perf_counter() - start)
+            responses[(request.kind, response.status_code)] += 1
+
+    start = perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return perf_counter() - start, latencies, responses
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def report(name: str, elapsed: float, latencies: List[float], responses: Counter, outcomes: Optional[Counter]):
+    print(f'\n{name}: {len(latencies)} requests in {elapsed:.2f}s, {len(latencies) / elapsed:.0f} requests/sec')
+    print('latency (ms): ' + ', '.join(
+        f'p{int(q * 100)} {percentile(latencies, q) * 1000:.2f}' for q in (0.50, 0.90, 0.99)
+    ) + f', max {max(latencies) * 1000:.2f}')
+
+    print(f"{'request kind':<20}{'status':>8}{'count':>10}")
+    for (kind, status), count in sorted(responses.items()):
+        print(f'{kind:<20}{status:>8}{count:>10}')
+
+    if outcomes:
+        print(f"{'outcome':<28}{'count':>10}")
+        for outcome, count in outcomes.most_common():
+            print(f'{outcome:<28}{count:>10}')
+
+
+async def run(args: argparse.Namespace, backend: str) -> Tuple[float, List[float], Counter, Optional[Counter]]:
+    credentials = make_credentials(args.consumers)
+    limits = httpx.Limits(max_connections=args.concurrency)
+
+    if args.url:
+        corpus = make_corpus(args.requests, args.invalid_ratio, args.url, credentials, args.seed)
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+            return (*await drive(client, corpus, args.concurrency), None)
+
+    counter = OutcomeCounter()
+    app = make_app(backend, args.latency, args.consumers, observer=counter)
+    corpus = make_corpus(args.requests, args.invalid_ratio, BASE_URL, credentials, args.seed)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url=BASE_URL, limits=limits) as client:
+        return (*await drive(client, corpus, args.concurrency), counter.outcomes)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.loadtest', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--backend', choices=(SYNC, ASYNC, 'both'), default='both')
+    parser.add_argument('--requests', type=int, default=5000, help='number of requests.')
+    parser.add_argument('--concurrency', type=int, default=32, help='concurrent clients.')
+    parser.add_argument('--latency', type=float, default=0.0, help='credentials lookup latency in milliseconds.')
+    parser.add_argument('--invalid-ratio', type=float, default=0.2, help='ratio of incorrectly signed requests.')
+    parser.add_argument('--consumers', type=int, default=100, help='number of known consumer keys.')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the corpus generator.')
+    parser.add_argument('--url', help='base url of a running server instead of the in-process ASGI transport.')
+    args = parser.parse_args(argv)
+
+    backends = [SYNC, ASYNC] if args.backend == 'both' else [args.backend]
+    if args.url:
+        backends = [args.url]
+
+    for backend in backends:
+        elapsed, latencies, responses, outcomes = asyncio.run(run(args, backend))
+        report(backend, elapsed, latencies, responses, outcomes)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
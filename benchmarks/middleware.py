@@ -0,0 +1,117 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Compare the per-request cost of the dependency style usage (endpoint calling
+the authenticator with the starlette Request) against RequestAuthenticatorMiddleware,
+with the unauthenticated app as reference. The valid requests cost about the same
+both ways, the rejected ones are cheaper through the middleware. Each request gets a fresh scope, so the
+AuthResult memoized in the scope state of a previous request is never reused.
+
+    python -m benchmarks.middleware
+"""
+import asyncio
+import logging
+from time import perf_counter
+from typing import Dict
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from rndi.authentication.starlette.adapters.oauth10a import AsyncOAuth10aRequestAuthenticatorAdapter
+from rndi.authentication.starlette.contract import AsyncCredentialsRepository
+from rndi.authentication.starlette.middleware import RequestAuthenticatorMiddleware
+
+AUTHORIZATION = (
+    b'OAuth '
+    b'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+    b'oauth_signature_method="HMAC-SHA1", '
+    b'oauth_timestamp="1686919540", '
+    b'oauth_nonce="RZQd4m3S0Iu", '
+    b'oauth_version="1.0",'
+    b'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"'
+)
+
+CREDENTIALS = {
+    'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8': {
+        'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                         'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+        'resource_owner_secret': '',
+    },
+}
+
+
+class InMemoryCredentialsRepository(AsyncCredentialsRepository):
+    async def get(self, key: str) -> Dict[str, str]:
+        return CREDENTIALS.get(key, {})
+
+
+def make_scope(authorization: bytes) -> dict:
+    return {
+        'type': 'http',
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'https',
+        'path': '/aps/2/collections/service-plans',
+        'root_path': '',
+        'query_string': b'',
+        'headers': [
+            (b'host', b'cosmopolitan.aks.int.zone'),
+            (b'accept', b'*/*'),
+            (b'authorization', authorization),
+        ],
+        'server': ('cosmopolitan.aks.int.zone', 443),
+    }
+
+
+async def run(app, scope: dict, iterations: int, repeat: int = 5) -> float:
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(_):
+        pass
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(iterations):
+            await app(dict(scope), receive, send)
+        best = min(best, (perf_counter() - start) / iterations)
+    return best
+
+
+def main(iterations: int = 5000):
+    logger = logging.LoggerAdapter(logging.getLogger('benchmark'), {})
+    authenticator = AsyncOAuth10aRequestAuthenticatorAdapter(logger, InMemoryCredentialsRepository())
+
+    async def protected(request: Request):
+        await authenticator.authenticate(request)
+        return PlainTextResponse('OK')
+
+    async def unprotected(_: Request):
+        return PlainTextResponse('OK')
+
+    path = '/aps/2/collections/service-plans'
+    unauthenticated = Starlette(routes=[Route(path, unprotected)])
+    dependency = Starlette(routes=[Route(path, protected)])
+    middleware = RequestAuthenticatorMiddleware(unauthenticated, authenticator)
+
+    scopes = {
+        'valid': make_scope(AUTHORIZATION),
+        'invalid': make_scope(AUTHORIZATION.replace(b'%3D', b'%33')),
+    }
+
+    print(f"{'case':<24}{'no auth (us)':>18}{'dependency (us)':>18}{'middleware (us)':>18}")
+    for case, scope in scopes.items():
+        reference = asyncio.run(run(unauthenticated, scope, iterations))
+        baseline = asyncio.run(run(dependency, scope, iterations))
+        candidate = asyncio.run(run(middleware, scope, iterations))
+        print(f"{case:<24}{reference * 1e6:>18.2f}{baseline * 1e6:>18.2f}{candidate * 1e6:>18.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Compare the Authorization header parser against the previous approach.
+
+The previous approach parsed the header twice per request, once with the
+replace/slice/split chain to get the consumer key and signature, and once more
+inside oauthlib collect_parameters to get the decoded protocol parameters for
+the signature base string. The new parser returns both in one call.
+
+    python -m benchmarks.parser
+"""
+from dataclasses import dataclass
+from timeit import repeat
+
+from oauthlib.oauth1.rfc5849 import utils
+from rndi.authentication.starlette.oauth10a.parser import parse_authorization_header
+
+HEADER = (
+    'OAuth '
+    'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+    'oauth_signature_method="HMAC-SHA1", '
+    'oauth_timestamp="1686919540", '
+    'oauth_nonce="RZQd4m3S0Iu", '
+    'oauth_version="1.0", '
+    'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"'
+)
+
+
+@dataclass
+class LegacyOAuth10aParameters:
+    oauth_consumer_key: str
+    oauth_signature_method: str
+    oauth_timestamp: str
+    oauth_nonce: str
+    oauth_version: str
+    oauth_signature: str
+
+
+def legacy_parse_authorization_header(header: str) -> LegacyOAuth10aParameters:
+    authorization = {}
+    for parameter in header.replace(' ', '').replace('"', '')[5:].split(','):
+        key_value = parameter.split('=')
+        authorization[key_value[0].strip()] = key_value[1].strip()
+    return LegacyOAuth10aParameters(**authorization)
+
+
+def legacy_parse_authorization_header_and_parameters(header: str):
+    parameters = [
+        (k, utils.unescape(v)) for k, v in utils.parse_authorization_header(header)
+        if k != 'realm' and k != 'oauth_signature'
+    ]
+    return legacy_parse_authorization_header(header), parameters
+
+
+def measure(function, number: int = 20000) -> float:
+    return min(repeat(lambda: function(HEADER), number=number, repeat=7)) / number
+
+
+def main():
+    cases = {
+        'legacy split only': legacy_parse_authorization_header,
+        'legacy split + oauthlib': legacy_parse_authorization_header_and_parameters,
+        'single pass': parse_authorization_header,
+    }
+
+    print(f"{'parser':<28}{'us/op':>12}{'ops/sec':>14}")
+    for name, function in cases.items():
+        elapsed = measure(function)
+        print(f"{name:<28}{elapsed * 1e6:>12.3f}{1 / elapsed:>14.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Compare the lookup cost of a naive SQLite CredentialsRepository (a connection
+per lookup and an unindexed table) against SQLiteCredentialsRepository, the
+memory-mapped JSON Lines repository and the in-memory snapshot, from a single
+thread and from several threads.
+
+    python -m benchmarks.repositories
+"""
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.repositories.mapped import dump_credentials, MappedJSONCredentialsRepository
+from rndi.authentication.starlette.repositories.snapshot import SnapshotCredentialsRepository
+from rndi.authentication.starlette.repositories.sqlite import SQLiteCredentialsRepository
+
+SIZE = 10000
+
+CREDENTIALS = {
+    f'consumer-{i:05d}': {
+        'client_key': f'consumer-{i:05d}',
+        'client_secret': f'{i:05d}-4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2',
+        'resource_owner_secret': '',
+    }
+    for i in range(SIZE)
+}
+
+
+class NaiveSQLiteCredentialsRepository(CredentialsRepository):
+    # what a quick implementation usually looks like.
+    def __init__(self, path: str):
+        self.path = path
+        with sqlite3.connect(path) as connection:
+            connection.execute('CREATE TABLE IF NOT EXISTS naive (key TEXT, credentials TEXT)')
+            connection.executemany(
+                'INSERT INTO naive (key, credentials) VALUES (?, ?)',
+                [(key, json.dumps(data)) for key, data in CREDENTIALS.items()],
+            )
+
+    def get(self, key: str) -> Dict[str, str]:
+        connection = sqlite3.connect(self.path)
+        try:
+            row = connection.execute(f"SELECT credentials FROM naive WHERE key = '{key}'").fetchone()
+        finally:
+            connection.close()
+        return {} if row is None else json.loads(row[0])
+
+
+def run(repository: CredentialsRepository, keys: List[str], threads: int) -> float:
+    if threads == 1:
+        start = perf_counter()
+        for key in keys:
+            repository.get(key)
+        return (perf_counter() - start) / len(keys)
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        # open the per-thread connections before measuring.
+        list(executor.map(repository.get, keys[:threads * 4]))
+        start = perf_counter()
+        list(executor.map(repository.get, keys, chunksize=64))
+        return (perf_counter() - start) / len(keys)
+
+
+def main(lookups: int = 20000, threads: int = 8):
+    directory = tempfile.mkdtemp()
+    keys = list(islice(cycle(list(CREDENTIALS)[::7] + ['unknown']), lookups))
+
+    sqlite = SQLiteCredentialsRepository(os.path.join(directory, 'credentials.db'))
+    sqlite.put_many(CREDENTIALS)
+    dump_credentials(os.path.join(directory, 'credentials.jsonl'), CREDENTIALS.values())
+
+    repositories: Dict[str, Callable[[], CredentialsRepository]] = {
+        'naive sqlite': lambda: NaiveSQLiteCredentialsRepository(os.path.join(directory, 'naive.db')),
+        'SQLiteCredentialsRepository': lambda: sqlite,
+        'MappedJSONCredentialsRepository': lambda: MappedJSONCredentialsRepository(
+            os.path.join(directory, 'credentials.jsonl'),
+        ),
+        'SnapshotCredentialsRepository': lambda: SnapshotCredentialsRepository(lambda: CREDENTIALS),
+    }
+
+    print(f"{'repository':<34}{'1 thread (us)':>16}{f'{threads} threads (us)':>18}{'lookups/sec':>14}")
+    for name, factory in repositories.items():
+        repository = factory()
+        assert repository.get(keys[0]) == CREDENTIALS[keys[0]]
+        number = lookups // 20 if name.startswith('naive') else lookups
+        single = run(repository, keys[:number], 1)
+        concurrent = run(repository, keys[:number], threads)
+        print(f"{name:<34}{single * 1e6:>16.2f}{concurrent * 1e6:>18.2f}{1 / min(single, concurrent):>14.0f}")
+
+    sqlite.close()
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
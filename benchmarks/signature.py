@@ -0,0 +1,108 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Compare the prepared HMAC verifier against signing with oauthlib and comparing
+the percent-quoted signatures as text, and measure the cost of every supported
+signature method. The RSA methods are only measured if cryptography is installed.
+
+    python -m benchmarks.signature
+"""
+from base64 import b64encode
+from timeit import repeat
+from typing import Callable
+from urllib import parse
+
+from oauthlib.oauth1.rfc5849 import signature as oauth
+from rndi.authentication.starlette.oauth10a.signature import (
+    Credential,
+    HMAC_SHA1,
+    HMAC_SHA256,
+    HMAC_SHA512,
+    provide_signature_verifiers,
+    RSA_SHA1,
+    RSA_SHA256,
+)
+
+CREDENTIAL = Credential(
+    client_key='wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+    client_secret='4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                  'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+    resource_owner_secret='',
+)
+
+BASE_STRING = (
+    'GET&https%3A%2F%2Fcosmopolitan.aks.int.zone%2Faps%2F2%2Fcollections%2Fservice-plans&'
+    'oauth_consumer_key%3DwotAQOwTUXZrkZqfOMrpEAtTC362SJi8%26oauth_nonce%3DRZQd4m3S0Iu%26'
+    'oauth_signature_method%3DHMAC-SHA1%26oauth_timestamp%3D1686919540%26oauth_version%3D1.0'
+)
+
+
+def legacy(signature: str) -> bool:
+    generated = parse.quote(oauth.sign_hmac_sha1_with_client(BASE_STRING, CREDENTIAL), safe='')
+    return parse.quote(signature, safe='') == generated
+
+
+def measure(name: str, function: Callable[[], bool], number: int):
+    assert function()
+    elapsed = min(repeat(function, number=number, repeat=5)) / number
+    print(f"{name:<26}{elapsed * 1e6:>12.3f}{1 / elapsed:>14.0f}")
+
+
+def rsa_cases(verifiers: dict) -> dict:
+    try:
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import padding, rsa
+        from rndi.authentication.starlette.oauth10a.rsa import load_rsa_public_key
+    except ImportError:
+        print('cryptography is not installed, skipping the RSA methods.')
+        return {}
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    credential = Credential(
+        client_key=CREDENTIAL.client_key,
+        rsa_key=private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode('ascii'),
+    )
+    message = BASE_STRING.encode('utf-8')
+    raw = private_key.sign(message, padding.PKCS1v15(), hashes.SHA1())
+    sha1 = b64encode(raw).decode('ascii')
+    sha256 = b64encode(private_key.sign(message, padding.PKCS1v15(), hashes.SHA256())).decode('ascii')
+
+    def parse_every_request() -> bool:
+        load_rsa_public_key(credential.rsa_key).verify(raw, message, padding.PKCS1v15(), hashes.SHA1())
+        return True
+
+    return {
+        f'{RSA_SHA1} (parse per req)': parse_every_request,
+        f'{RSA_SHA1} (cached key)': lambda: verifiers[RSA_SHA1].verify(credential, BASE_STRING, sha1),
+        f'{RSA_SHA256} (cached key)': lambda: verifiers[RSA_SHA256].verify(credential, BASE_STRING, sha256),
+    }
+
+
+def main(number: int = 20000):
+    verifiers = provide_signature_verifiers()
+    signature = oauth.sign_hmac_sha1_with_client(BASE_STRING, CREDENTIAL)
+    sha256 = oauth.sign_hmac_sha256_with_client(BASE_STRING, CREDENTIAL)
+    sha512 = oauth.sign_hmac_sha512_with_client(BASE_STRING, CREDENTIAL)
+
+    cases = {
+        'oauthlib + quote': lambda: legacy(signature),
+        f'{HMAC_SHA1} (prepared)': lambda: verifiers[HMAC_SHA1].verify(CREDENTIAL, BASE_STRING, signature),
+        f'{HMAC_SHA256} (prepared)': lambda: verifiers[HMAC_SHA256].verify(CREDENTIAL, BASE_STRING, sha256),
+        f'{HMAC_SHA512} (prepared)': lambda: verifiers[HMAC_SHA512].verify(CREDENTIAL, BASE_STRING, sha512),
+    }
+
+    print(f"{'verification':<26}{'us/op':>12}{'ops/sec':>14}")
+    for name, function in cases.items():
+        measure(name, function, number)
+    for name, function in rsa_cases(verifiers).items():
+        measure(name, function, number // 10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+"""
+Reproducible benchmark suite of the authentication pipeline: header parsing,
+base string construction, HMAC verification, full authenticate calls for valid
+and invalid requests (with several query string sizes, with and without the
+forwarded headers) and the provide_request_authenticator construction.
+
+Every case reports the ops/sec and the p50/p99 latency per operation. The
+results can be saved as a baseline and later runs compared against it, the
+suite exits with status 1 when the p50 of any case is slower than the baseline
+by more than the threshold.
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --save .benchmarks/baseline.json
+    python -m benchmarks.suite --compare .benchmarks/baseline.json --threshold 0.15
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+import oauthlib
+import starlette
+from oauthlib.oauth1.rfc5849 import signature as oauth
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from rndi.authentication.starlette.adapters.oauth10a import OAuth10aRequestAuthenticatorAdapter
+from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.oauth10a.base_string import base_string_uri, escape, signature_base_string
+from rndi.authentication.starlette.oauth10a.parser import parse_authorization_header
+from rndi.authentication.starlette.oauth10a.signature import Credential, HmacSignatureVerifier
+from rndi.authentication.starlette.provider import provide_request_authenticator
+
+CLIENT_KEY = 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8'
+
+CREDENTIALS = {
+    'client_key': CLIENT_KEY,
+    'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                     'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+    'resource_owner_secret': '',
+}
+
+CREDENTIAL = Credential(CLIENT_KEY, CREDENTIALS['client_secret'], '')
+
+PROTOCOL_PARAMETERS = {
+    'oauth_consumer_key': CLIENT_KEY,
+    'oauth_signature_method': 'HMAC-SHA1',
+    'oauth_timestamp': '1686919540',
+    'oauth_nonce': 'RZQd4m3S0Iu',
+    'oauth_version': '1.0',
+}
+
+HOST = 'cosmopolitan.aks.int.zone'
+PATH = '/aps/2/collections/service-plans'
+
+QUERIES = {
+    'no query': '',
+    'query (3)': 'limit=10&offset=0&order=-created',
+    'query (200)': '&'.join(f'key{i}=value%20{i}' for i in range(200)),
+}
+
+# p50 regression allowed against the baseline, 10% by default.
+DEFAULT_THRESHOLD = 0.10
+
+# incremented when the cases change what they measure, the older baselines
+# have to be saved again. 2: a new request per authenticate call.
+VERSION = 2
+
+
+class StaticCredentialsRepository(CredentialsRepository):
+    def get(self, key: str) -> Dict[str, str]:
+        return CREDENTIALS if key == CLIENT_KEY else {}
+
+
+def sign(query_string: str, scheme: str = 'https', host: str = HOST) -> str:
+    base_string = signature_base_string('GET', base_string_uri(scheme, host, PATH), query_string, PROTOCOL_PARAMETERS)
+    return oauth.sign_hmac_sha1_with_client(base_string, CREDENTIAL)
+
+
+def authorization(signature: str) -> str:
+    parameters = [f'{name}="{escape(value)}"' for name, value in PROTOCOL_PARAMETERS.items()]
+    parameters.append(f'oauth_signature="{escape(signature)}"')
+    return 'OAuth ' + ', '.join(parameters)
+
+
+def make_request(query_string: str, valid: bool, forwarded: bool) -> Callable[[], Request]:
+    # invalid requests carry the signature of another query string, and behind
+    # a proxy the adapter verifies against the forwarded scheme and host.
+    signed = query_string if valid else query_string + '&tampered=1'
+    signature = sign(signed, 'https', 'public.example.com') if forwarded else sign(signed)
+
+    headers = [
+        (b'host', HOST.encode('latin-1')),
+        (b'authorization', authorization(signature).encode('latin-1')),
+    ]
+    if forwarded:
+        headers.append((b'x-forwarded-proto', b'https'))
+        headers.append((b'x-forwarded-host', b'public.example.com'))
+
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'scheme': 'http' if forwarded else 'https',
+        'path': PATH,
+        'root_path': '',
+        'query_string': query_string.encode('latin-1'),
+        'headers': headers,
+    }
+
+    # a new scope per call, the AuthResult memoized in the state of a reused
+    # one would skip the whole verification.
+    return lambda: Request(dict(scope))
+
+
+def make_authenticate(
+        authenticator: OAuth10aRequestAuthenticatorAdapter,
+        make: Callable[[], Request],
+        valid: bool,
+) -> Callable:
+    def authenticate():
+        authenticator.authenticate(make())
+
+    def reject():
+        try:
+            authenticator.authenticate(make())
+        except HTTPException:
+            return
+        raise AssertionError('the request should be rejected')
+
+    return authenticate if valid else reject
+
+
+def make_cases(logger: logging.LoggerAdapter) -> Dict[str, Callable]:
+    header = authorization(sign(''))
+    uri = base_string_uri('https', HOST, PATH)
+    verifier = HmacSignatureVerifier()
+    authenticator = OAuth10aRequestAuthenticatorAdapter(logger, StaticCredentialsRepository())
+    repository = StaticCredentialsRepository()
+    config = {'REQUEST_AUTH_DRIVER': 'oauth10a'}
+
+    cases = {
+        'parse header': lambda: parse_authorization_header(header),
+        'provide request authenticator': lambda: provide_request_authenticator(config, logger, repository),
+        'provide request authenticator, uncached': lambda: provide_request_authenticator(
+            config,
+            logger,
+            repository,
+            cache=False,
+        ),
+    }
+
+    for name, query_string in QUERIES.items():
+        base_string = signature_base_string('GET', uri, query_string, PROTOCOL_PARAMETERS)
+        signature = oauth.sign_hmac_sha1_with_client(base_string, CREDENTIAL)
+        cases[f'base string, {name}'] = (
+            lambda q=query_string: signature_base_string('GET', uri, q, PROTOCOL_PARAMETERS)
+        )
+        cases[f'hmac verify, {name}'] = lambda b=base_string, s=signature: verifier.verify(CREDENTIAL, b, s)
+
+    for name, query_string in QUERIES.items():
+        for forwarded in (False, True):
+            for valid in (True, False):
+                case = f"authenticate {'valid' if valid else 'invalid'}, {name}{', forwarded' if forwarded else ''}"
+                cases[case] = make_authenticate(authenticator, make_request(query_string, valid, forwarded), valid)
+
+    return cases
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+
+def calibrate(function: Callable, target: float) -> int:
+    # operations per sample, so a sample lasts roughly target seconds.
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = perf_counter() - start
+        if elapsed >= target / 10 or number >= 1 << 20:
+            return max(1, int(number * target / max(elapsed, 1e-9)))
+        number *= 10
+
+
+def measure(function: Callable, samples: int, target: float) -> Dict[str, float]:
+    """
+    Measure the latency per operation of the given function.
+
+    :param function: Callable The operation to measure.
+    :param samples: int The number of timed samples.
+    :param target: float The approximate duration in seconds of each sample.
+    :return: Dict[str, float] The ops/sec, p50 and p99 in seconds per operation.
+    """
+    number = calibrate(function, target)
+    timings = []
+    for _ in range(samples):
+        start = perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((perf_counter() - start) / number)
+
+    p50 = percentile(timings, 0.50)
+    return {
+        'ops': 1 / p50,
+        'p50': p50,
+        'p99': percentile(timings, 0.99),
+        'number': number,
+        'samples': samples,
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """
+    Compare the p50 of the results against the baseline ones.
+
+    :param results: Dict[str, dict] The measured cases.
+    :param baseline: Dict[str, dict] The baseline cases.
+    :param threshold: float The allowed relative slowdown, 0.10 is 10%.
+    :return: List[str] The cases that regressed.
+    """
+    regressions = []
+    for case, result in results.items():
+        reference = baseline.get(case)
+        if reference is not None and result['p50'] > reference['p50'] * (1 + threshold):
+            regressions.append(case)
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'oauthlib': oauthlib.__version__,
+        'starlette': starlette.__version__,
+    }
+
+
+def report(results: Dict[str, dict], baseline: Optional[Dict[str, dict]]):
+    print(f"{'case':<48}{'ops/sec':>12}{'p50 (us)':>12}{'p99 (us)':>12}{'vs base':>10}")
+    for case, result in results.items():
+        change = ''
+        if baseline is not None and case in baseline:
+            change = f"{result['p50'] / baseline[case]['p50'] - 1:>+9.1%}"
+        print(f"{case:<48}{result['ops']:>12.0f}{result['p50'] * 1e6:>12.2f}{result['p99'] * 1e6:>12.2f}{change:>10}")
+
+
+def load_baseline(path: str) -> Dict[str, dict]:
+    with open(path) as baseline:
+        data = json.load(baseline)
+
+    if data.get('version') != VERSION:
+        raise SystemExit(f'the baseline {path} was recorded by another version of the suite, save it again.')
+
+    if data.get('environment') != environment():
+        print(f'warning: the baseline was recorded in another environment: {data.get("environment")}')
+    return data['results']
+
+
+def save_baseline(path: str, results: Dict[str, dict]):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as baseline:
+        json.dump(
+            {'version': VERSION, 'environment': environment(), 'results': results},
+            baseline,
+            indent=2,
+            sort_keys=True,
+        )
+    print(f'baseline saved to {path}')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--filter', default='', help='only run the cases containing this text.')
+    parser.add_argument('--samples', type=int, default=30, help='timed samples per case.')
+    parser.add_argument('--sample-time', type=float, default=0.02, help='approximate seconds per sample.')
+    parser.add_argument('--save', metavar='PATH', help='save the results as baseline.')
+    parser.add_argument('--compare', metavar='PATH', help='compare the results against the baseline.')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=float(os.environ.get('BENCHMARK_THRESHOLD', DEFAULT_THRESHOLD)),
+        help='allowed p50 slowdown against the baseline, 0.10 is 10%%.',
+    )
+    args = parser.parse_args(argv)
+
+    base = logging.getLogger('benchmark')
+    base.addHandler(logging.NullHandler())
+    base.propagate = False
+    logger = logging.LoggerAdapter(base, {})
+
+    baseline = load_baseline(args.compare) if args.compare else None
+
+    results = {}
+    for case, function in make_cases(logger).items():
+        if args.filter in case:
+            results[case] = measure(function, args.samples, args.sample_time)
+
+    report(results, baseline)
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for case in regressions:
+            print(f'regression: {case} is more than {args.threshold:.0%} slower than the baseline.')
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
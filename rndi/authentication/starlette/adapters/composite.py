@@ -0,0 +1,180 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from logging import LoggerAdapter
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar
+
+from starlette.requests import HTTPConnection
+from starlette.types import Scope
+from rndi.authentication.starlette.adapters.unauthorized import (
+    AsyncUnauthorizedRequestAuthenticatorAdapter,
+    UnauthorizedRequestAuthenticatorAdapter,
+)
+from rndi.authentication.starlette.contract import (
+    AsyncCredentialsRepository,
+    AsyncRequestAuthenticator,
+    CredentialsRepository,
+    RequestAuthenticator,
+)
+from rndi.authentication.starlette.result import AuthResult
+
+REQUEST_AUTH_COMPOSITE_SCHEMES = 'REQUEST_AUTH_COMPOSITE_SCHEMES'
+REQUEST_AUTH_COMPOSITE_HEADERS = 'REQUEST_AUTH_COMPOSITE_HEADERS'
+REQUEST_AUTH_COMPOSITE_FALLBACK = 'REQUEST_AUTH_COMPOSITE_FALLBACK'
+
+DEFAULT_FALLBACK = UnauthorizedRequestAuthenticatorAdapter.DRIVER
+
+_AUTHORIZATION = b'authorization'
+
+T = TypeVar('T')
+
+
+def provide_composite_request_authenticator(
+        config: dict,
+        logger: LoggerAdapter,
+        _: CredentialsRepository,
+        drivers: Optional[Mapping[str, Callable[[], RequestAuthenticator]]] = None,
+) -> RequestAuthenticator:
+    schemes, headers, fallback = _provide_routes(config, drivers)
+    return CompositeRequestAuthenticatorAdapter(logger, schemes, headers, fallback)
+
+
+def provide_async_composite_request_authenticator(
+        config: dict,
+        logger: LoggerAdapter,
+        _: AsyncCredentialsRepository,
+        drivers: Optional[Mapping[str, Callable[[], AsyncRequestAuthenticator]]] = None,
+) -> AsyncRequestAuthenticator:
+    schemes, headers, fallback = _provide_routes(config, drivers)
+    return AsyncCompositeRequestAuthenticatorAdapter(logger, schemes, headers, fallback)
+
+
+class CompositeRequestAuthenticatorAdapter(RequestAuthenticator):
+    """
+    Route each request to one authenticator in O(1): by the scheme of the
+    Authorization header (OAuth, Bearer...), then by the presence of one of
+    the configured headers (X-API-Key...), and to the fallback authenticator
+    otherwise. The headers are scanned once and no other authenticator is
+    tried after the selected one rejects the request.
+    """
+
+    DRIVER = 'composite'
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            schemes: Mapping[str, RequestAuthenticator],
+            headers: Optional[Mapping[str, RequestAuthenticator]] = None,
+            fallback: Optional[RequestAuthenticator] = None,
+    ):
+        if fallback is None:
+            fallback = UnauthorizedRequestAuthenticatorAdapter(logger)
+        self.__router = _Router(logger, schemes, headers, fallback)
+
+    def authenticate(self, request: HTTPConnection) -> Optional[AuthResult]:
+        return self.__router.route(request.scope).authenticate(request)
+
+
+class AsyncCompositeRequestAuthenticatorAdapter(AsyncRequestAuthenticator):
+    DRIVER = CompositeRequestAuthenticatorAdapter.DRIVER
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            schemes: Mapping[str, AsyncRequestAuthenticator],
+            headers: Optional[Mapping[str, AsyncRequestAuthenticator]] = None,
+            fallback: Optional[AsyncRequestAuthenticator] = None,
+    ):
+        if fallback is None:
+            fallback = AsyncUnauthorizedRequestAuthenticatorAdapter(logger)
+        self.__router = _Router(logger, schemes, headers, fallback)
+
+    async def authenticate(self, request: HTTPConnection) -> Optional[AuthResult]:
+        return await self.__router.route(request.scope).authenticate(request)
+
+
+class _Router:
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            schemes: Mapping[str, Any],
+            headers: Optional[Mapping[str, Any]],
+            fallback: Any,
+    ):
+        self.__logger = logger
+        # the schemes are case-insensitive (RFC 7235 section 2.1).
+        self.__schemes = {scheme.lower().encode('latin-1'): authenticator for scheme, authenticator in schemes.items()}
+        self.__headers = {
+            header.lower().encode('latin-1'): authenticator
+            for header, authenticator in (headers or {}).items()
+        }
+        self.__fallback = fallback
+
+    def route(self, scope: Scope) -> Any:
+        selected = None
+        for key, value in scope['headers']:
+            if key == _AUTHORIZATION:
+                authenticator = self.__schemes.get(value.split(b' ', 1)[0].lower())
+                if authenticator is not None:
+                    self.__logger.debug("CompositeRequestAuthenticatorAdapter: routing by authorization scheme.")
+                    return authenticator
+            elif selected is None:
+                selected = self.__headers.get(key)
+
+        if selected is not None:
+            self.__logger.debug("CompositeRequestAuthenticatorAdapter: routing by header.")
+            return selected
+
+        self.__logger.debug("CompositeRequestAuthenticatorAdapter: routing to the fallback driver.")
+        return self.__fallback
+
+
+def _parse_routes(value: str) -> Dict[str, str]:
+    """
+    Parse the routes configuration, comma separated name:driver pairs,
+    for example "OAuth:oauth10a, Bearer:jwt".
+    """
+    routes = {}
+    for entry in value.split(','):
+        if not entry.strip():
+            continue
+        name, separator, driver = entry.partition(':')
+        if not separator or not name.strip() or not driver.strip():
+            raise ValueError(f"Invalid composite route {entry.strip()}, expected name:driver.")
+        routes[name.strip()] = driver.strip()
+    return routes
+
+
+def _provide_routes(
+        config: dict,
+        drivers: Optional[Mapping[str, Callable[[], T]]],
+) -> Tuple[Dict[str, T], Dict[str, T], T]:
+    if drivers is None:
+        raise ValueError("The composite driver must be built through provide_request_authenticator.")
+
+    schemes = _parse_routes(config.get(REQUEST_AUTH_COMPOSITE_SCHEMES, ''))
+    headers = _parse_routes(config.get(REQUEST_AUTH_COMPOSITE_HEADERS, ''))
+    fallback = config.get(REQUEST_AUTH_COMPOSITE_FALLBACK, DEFAULT_FALLBACK)
+    if not schemes and not headers:
+        raise ValueError(f"The composite driver requires {REQUEST_AUTH_COMPOSITE_SCHEMES} or "
+                         f"{REQUEST_AUTH_COMPOSITE_HEADERS}.")
+
+    # each driver is built once, even if routed from several schemes.
+    built: Dict[str, T] = {}
+
+    def _driver(name: str) -> T:
+        if name == CompositeRequestAuthenticatorAdapter.DRIVER:
+            raise ValueError("The composite driver cannot route to itself.")
+        if name not in drivers:
+            raise ValueError(f"Unsupported request authenticator driver {name}.")
+        if name not in built:
+            built[name] = drivers[name]()
+        return built[name]
+
+    return (
+        {scheme: _driver(driver) for scheme, driver in schemes.items()},
+        {header: _driver(driver) for header, driver in headers.items()},
+        _driver(fallback),
+    )
@@ -0,0 +1,449 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from logging import LoggerAdapter
+from time import time
+from typing import Callable, Dict, Optional, Tuple
+
+from starlette.exceptions import HTTPException
+from starlette.requests import HTTPConnection
+from starlette.types import Scope
+from rndi.authentication.starlette.contract import (
+    AsyncCredentialsRepository,
+    AsyncRequestAuthenticator,
+    AuthenticationObserver,
+    CredentialsRepository,
+    RateLimiter,
+    RequestAuthenticator,
+)
+from rndi.authentication.starlette.instrumentation import (
+    ACCEPTED,
+    REJECTED,
+    STAGE_CLAIMS,
+    STAGE_CREDENTIALS,
+    STAGE_PARSE,
+    STAGE_RATE_LIMIT,
+    STAGE_SIGNATURE,
+    STAGE_TOKEN_CACHE,
+    StageTimer,
+    start_timer,
+)
+from rndi.authentication.starlette.jwt.signature import provide_jwt_signature_verifiers
+from rndi.authentication.starlette.jwt.token import (
+    bearer_token,
+    JWTError,
+    JWTToken,
+    MISSING_KEY_ID,
+    MISSING_TOKEN,
+    parse_token,
+    UNSUPPORTED_ALGORITHM,
+    validate_claims,
+    VerifiedTokenCache,
+)
+from rndi.authentication.starlette.log import provide_log_throttle_interval, throttle, TRACE
+from rndi.authentication.starlette.oauth10a.signature import Credential, SignatureVerifier
+from rndi.authentication.starlette.ratelimit import provide_rate_limiter
+from rndi.authentication.starlette.rejection import (
+    INVALID_CREDENTIALS,
+    INVALID_SIGNATURE,
+    MSG_UNAUTHENTICATED,
+    reject,
+    Rejection,
+    too_many_requests,
+)
+from rndi.authentication.starlette.result import authenticated, AuthResult, principal, remember
+
+
+def provide_jwt_request_authenticator_adapter(
+        config: dict,
+        logger: LoggerAdapter,
+        credentials_repository: CredentialsRepository,
+        observer: Optional[AuthenticationObserver] = None,
+) -> RequestAuthenticator:
+    return JWTRequestAuthenticatorAdapter(
+        logger=logger,
+        credentials_repository=credentials_repository,
+        signature_verifiers=provide_jwt_signature_verifiers(provide_jwt_algorithms(config)),
+        token_cache=provide_jwt_token_cache(config),
+        key_prefix=provide_jwt_key_prefix(config),
+        audience=provide_jwt_audience(config),
+        issuer=config.get(REQUEST_AUTH_JWT_ISSUER) or None,
+        leeway=float(config.get(REQUEST_AUTH_JWT_LEEWAY) or 0),
+        rate_limiter=provide_rate_limiter(config),
+        throttle_interval=provide_log_throttle_interval(config),
+        observer=observer,
+    )
+
+
+def provide_async_jwt_request_authenticator_adapter(
+        config: dict,
+        logger: LoggerAdapter,
+        credentials_repository: AsyncCredentialsRepository,
+        observer: Optional[AuthenticationObserver] = None,
+) -> AsyncRequestAuthenticator:
+    return AsyncJWTRequestAuthenticatorAdapter(
+        logger=logger,
+        credentials_repository=credentials_repository,
+        signature_verifiers=provide_jwt_signature_verifiers(provide_jwt_algorithms(config)),
+        token_cache=provide_jwt_token_cache(config),
+        key_prefix=provide_jwt_key_prefix(config),
+        audience=provide_jwt_audience(config),
+        issuer=config.get(REQUEST_AUTH_JWT_ISSUER) or None,
+        leeway=float(config.get(REQUEST_AUTH_JWT_LEEWAY) or 0),
+        rate_limiter=provide_rate_limiter(config),
+        throttle_interval=provide_log_throttle_interval(config),
+        observer=observer,
+    )
+
+
+def provide_jwt_algorithms(config: dict) -> Optional[Tuple[str, ...]]:
+    """
+    Read the comma separated accepted JWS algorithms, all the supported ones
+    if not configured.
+
+    :param config: dict The adapter configuration.
+    :return: Optional[Tuple[str, ...]] The algorithms or None.
+    """
+    algorithms = tuple(
+        algorithm.strip() for algorithm in (config.get(REQUEST_AUTH_JWT_ALGORITHMS) or '').split(',')
+        if algorithm.strip()
+    )
+    return algorithms or None
+
+
+def provide_jwt_key_prefix(config: dict) -> str:
+    """
+    Read the prefix of the repository keys of the token signing keys, "jwt:" by
+    default, so the OAuth 1.0a consumer secrets stored by consumer key are
+    never used as HMAC keys of the tokens. An empty prefix shares the keys.
+
+    :param config: dict The adapter configuration.
+    :return: str The key prefix.
+    """
+    key_prefix = config.get(REQUEST_AUTH_JWT_KEY_PREFIX)
+    return DEFAULT_KEY_PREFIX if key_prefix is None else key_prefix
+
+
+def provide_jwt_audience(config: dict) -> str:
+    """
+    Read the required audience, the tokens issued for other services are
+    rejected even if signed with the same key.
+
+    :param config: dict The adapter configuration.
+    :return: str The audience.
+    :raise ValueError: If the audience is not configured.
+    """
+    audience = config.get(REQUEST_AUTH_JWT_AUDIENCE)
+    if not audience:
+        raise ValueError(f"The jwt driver requires the {REQUEST_AUTH_JWT_AUDIENCE} configuration.")
+    return audience
+
+
+def provide_jwt_token_cache(config: dict) -> Optional[VerifiedTokenCache]:
+    """
+    Build the verified token cache, enabled by default, a cache size of 0
+    disables it.
+
+    :param config: dict The adapter configuration.
+    :return: Optional[VerifiedTokenCache] The verified token cache or None.
+    """
+    max_size = config.get(REQUEST_AUTH_JWT_CACHE_SIZE)
+    max_size = DEFAULT_TOKEN_CACHE_SIZE if max_size in (None, '') else int(max_size)
+    if max_size <= 0:
+        return None
+    max_ttl = config.get(REQUEST_AUTH_JWT_CACHE_TTL)
+    return VerifiedTokenCache(max_size, DEFAULT_TOKEN_CACHE_TTL if max_ttl in (None, '') else float(max_ttl))
+
+
+REQUEST_AUTH_JWT_ALGORITHMS = 'REQUEST_AUTH_JWT_ALGORITHMS'
+REQUEST_AUTH_JWT_AUDIENCE = 'REQUEST_AUTH_JWT_AUDIENCE'
+REQUEST_AUTH_JWT_ISSUER = 'REQUEST_AUTH_JWT_ISSUER'
+REQUEST_AUTH_JWT_LEEWAY = 'REQUEST_AUTH_JWT_LEEWAY'
+REQUEST_AUTH_JWT_CACHE_SIZE = 'REQUEST_AUTH_JWT_CACHE_SIZE'
+REQUEST_AUTH_JWT_CACHE_TTL = 'REQUEST_AUTH_JWT_CACHE_TTL'
+REQUEST_AUTH_JWT_KEY_PREFIX = 'REQUEST_AUTH_JWT_KEY_PREFIX'
+
+DEFAULT_KEY_PREFIX = 'jwt:'
+
+DEFAULT_TOKEN_CACHE_SIZE = 4096
+DEFAULT_TOKEN_CACHE_TTL = 300.0
+
+# the attribute of the AuthResult holding the verified claims.
+CLAIMS = 'claims'
+
+_AUTHORIZATION = b'authorization'
+
+
+class JWTRequestAuthenticatorAdapter(RequestAuthenticator):
+    """
+    Authenticate the requests carrying a JWS signed JWT as Bearer token. The
+    verification key is recovered from the credentials repository by the kid
+    header (or the iss claim) after the key_prefix: the client_secret for the
+    HMAC algorithms and the rsa_key (PEM public key or certificate) for the
+    RSA ones.
+
+    The verified tokens are remembered until they expire, so the tokens
+    presented again skip the key lookup and the signature verification. The
+    optional rate limiter is keyed by the key id of the token, cached or not.
+    """
+
+    DRIVER = 'jwt'
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            credentials_repository: CredentialsRepository,
+            signature_verifiers: Optional[Dict[str, SignatureVerifier]] = None,
+            token_cache: Optional[VerifiedTokenCache] = None,
+            key_prefix: str = DEFAULT_KEY_PREFIX,
+            audience: Optional[str] = None,
+            issuer: Optional[str] = None,
+            leeway: float = 0,
+            rate_limiter: Optional[RateLimiter] = None,
+            throttle_interval: Optional[float] = None,
+            observer: Optional[AuthenticationObserver] = None,
+            clock: Callable[[], float] = time,
+    ):
+        self.__credential_repository = credentials_repository
+        self.__key_prefix = key_prefix
+        self.__observer = observer
+        self.__verification = _JWTVerification(
+            logger,
+            self.DRIVER,
+            signature_verifiers,
+            token_cache,
+            audience,
+            issuer,
+            leeway,
+            rate_limiter,
+            throttle_interval,
+            clock,
+        )
+
+    def authenticate(self, request: HTTPConnection) -> AuthResult:
+        result = authenticated(request, self.DRIVER, self)
+        if result is not None:
+            return result
+
+        timer = start_timer(self.__observer, self.DRIVER)
+        try:
+            token, result = self.__verification.cached(request.scope, timer)
+            if result is None:
+                parsed, expires = self.__verification.before_lookup(token, timer)
+                result = self.__verification.after_lookup(
+                    token,
+                    parsed,
+                    expires,
+                    self.__credential_repository.get(self.__key_prefix + parsed.key_id),
+                    timer,
+                )
+        except HTTPException as e:
+            if timer is not None:
+                timer.done(getattr(e, 'reason', REJECTED))
+            raise
+
+        if timer is not None:
+            timer.done(ACCEPTED)
+        return remember(request, result, self)
+
+
+class AsyncJWTRequestAuthenticatorAdapter(AsyncRequestAuthenticator):
+    DRIVER = JWTRequestAuthenticatorAdapter.DRIVER
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            credentials_repository: AsyncCredentialsRepository,
+            signature_verifiers: Optional[Dict[str, SignatureVerifier]] = None,
+            token_cache: Optional[VerifiedTokenCache] = None,
+            key_prefix: str = DEFAULT_KEY_PREFIX,
+            audience: Optional[str] = None,
+            issuer: Optional[str] = None,
+            leeway: float = 0,
+            rate_limiter: Optional[RateLimiter] = None,
+            throttle_interval: Optional[float] = None,
+            observer: Optional[AuthenticationObserver] = None,
+            clock: Callable[[], float] = time,
+    ):
+        self.__credential_repository = credentials_repository
+        self.__key_prefix = key_prefix
+        self.__observer = observer
+        self.__verification = _JWTVerification(
+            logger,
+            self.DRIVER,
+            signature_verifiers,
+            token_cache,
+            audience,
+            issuer,
+            leeway,
+            rate_limiter,
+            throttle_interval,
+            clock,
+        )
+
+    async def authenticate(self, request: HTTPConnection) -> AuthResult:
+        result = authenticated(request, self.DRIVER, self)
+        if result is not None:
+            return result
+
+        timer = start_timer(self.__observer, self.DRIVER)
+        try:
+            token, result = self.__verification.cached(request.scope, timer)
+            if result is None:
+                parsed, expires = self.__verification.before_lookup(token, timer)
+                result = self.__verification.after_lookup(
+                    token,
+                    parsed,
+                    expires,
+                    await self.__credential_repository.get(self.__key_prefix + parsed.key_id),
+                    timer,
+                )
+        except HTTPException as e:
+            if timer is not None:
+                timer.done(getattr(e, 'reason', REJECTED))
+            raise
+
+        if timer is not None:
+            timer.done(ACCEPTED)
+        return remember(request, result, self)
+
+
+def _unauthenticated(reason: str, detail: str) -> Rejection:
+    # RFC 6750 section 3, the error is only given if a token was presented.
+    challenge = 'Bearer' if reason == MISSING_TOKEN else 'Bearer error="invalid_token"'
+    return reject(reason, MSG_UNAUTHENTICATED.format(detail=detail), headers={'WWW-Authenticate': challenge})
+
+
+class _JWTVerification:
+    """
+    The token checks of the sync and async adapters: cached() answers the
+    tokens already verified, before_lookup() decodes the token and checks its
+    claims, and after_lookup() verifies the signature with the key fetched by
+    the adapter in between, awaited or not.
+    """
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            driver: str,
+            signature_verifiers: Optional[Dict[str, SignatureVerifier]],
+            token_cache: Optional[VerifiedTokenCache],
+            audience: Optional[str],
+            issuer: Optional[str],
+            leeway: float,
+            rate_limiter: Optional[RateLimiter],
+            throttle_interval: Optional[float],
+            clock: Callable[[], float],
+    ):
+        self.__logger = logger
+        self.__driver = driver
+        # a replayed expired or forged token is rejected on every request, the
+        # rejection logs are aggregated per interval.
+        self.__failures = throttle(logger, throttle_interval)
+        self.__rate_limiter = rate_limiter
+        self.__signature_verifiers = (
+            provide_jwt_signature_verifiers() if signature_verifiers is None else signature_verifiers
+        )
+        self.__token_cache = token_cache
+        self.__audience = audience
+        self.__issuer = issuer
+        self.__leeway = leeway
+        self.__clock = clock
+
+    def cached(self, scope: Scope, timer: Optional[StageTimer]) -> Tuple[str, Optional[AuthResult]]:
+        self.__logger.debug("JWTRequestAuthenticatorAdapter: authenticating request with %s driver.", self.__driver)
+
+        authorization = None
+        for key, value in scope['headers']:
+            if key == _AUTHORIZATION:
+                authorization = value.decode('latin-1')
+                break
+
+        try:
+            token = bearer_token(authorization)
+        except JWTError as e:
+            raise self.__rejection(e)
+
+        result = None if self.__token_cache is None else self.__token_cache.get(token)
+        if timer is not None:
+            timer.lap(STAGE_TOKEN_CACHE)
+        if result is not None:
+            self.__logger.log(TRACE, "JWTRequestAuthenticatorAdapter: accepted already verified token.")
+            self.__rate_limit(result.consumer_key, timer)
+        return token, result
+
+    def before_lookup(self, token: str, timer: Optional[StageTimer]) -> Tuple[JWTToken, float]:
+        try:
+            parsed = parse_token(token)
+            if parsed.algorithm not in self.__signature_verifiers:
+                raise JWTError(UNSUPPORTED_ALGORITHM, f"Unsupported JWT algorithm {parsed.algorithm}.")
+            if parsed.key_id is None:
+                raise JWTError(MISSING_KEY_ID, "The token has no kid header nor iss claim.")
+            if timer is not None:
+                timer.lap(STAGE_PARSE)
+
+            # the claims are checked before the key lookup, the expired tokens
+            # are rejected without any I/O.
+            expires = validate_claims(parsed.claims, self.__clock(), self.__leeway, self.__audience, self.__issuer)
+            if timer is not None:
+                timer.lap(STAGE_CLAIMS)
+        except JWTError as e:
+            raise self.__rejection(e)
+
+        self.__logger.log(TRACE, "JWTRequestAuthenticatorAdapter: %r", parsed)
+        self.__rate_limit(parsed.key_id, timer)
+        return parsed, expires
+
+    def after_lookup(
+            self,
+            token: str,
+            parsed: JWTToken,
+            expires: float,
+            data: Optional[Dict[str, str]],
+            timer: Optional[StageTimer],
+    ) -> AuthResult:
+        if timer is not None:
+            timer.lap(STAGE_CREDENTIALS)
+        if not data:
+            self.__failures.debug("JWTRequestAuthenticatorAdapter: unknown key %s.", parsed.key_id)
+            raise _unauthenticated(INVALID_CREDENTIALS, 'unknown token key')
+
+        credential = Credential(
+            client_key=parsed.key_id,
+            client_secret=data.get('client_secret'),
+            rsa_key=data.get('rsa_key'),
+        )
+        verified = self.__signature_verifiers[parsed.algorithm].verify_digest(
+            credential,
+            parsed.signing_input,
+            parsed.signature,
+        )
+        if timer is not None:
+            timer.lap(STAGE_SIGNATURE)
+        if not verified:
+            self.__failures.debug("JWTRequestAuthenticatorAdapter: invalid signature for key %s.", parsed.key_id)
+            raise _unauthenticated(INVALID_SIGNATURE, 'the provided signature is not valid')
+
+        result = principal(parsed.key_id, self.__driver, {**data, CLAIMS: parsed.claims})
+        if self.__token_cache is not None:
+            self.__token_cache.put(token, expires, result)
+        return result
+
+    def __rate_limit(self, key_id: str, timer: Optional[StageTimer]):
+        if self.__rate_limiter is None:
+            return
+
+        wait = self.__rate_limiter.acquire(key_id)
+        if wait > 0:
+            self.__failures.debug("JWTRequestAuthenticatorAdapter: rate limit exceeded for key %s.", key_id)
+            raise too_many_requests(wait)
+        if timer is not None:
+            timer.lap(STAGE_RATE_LIMIT)
+
+    def __rejection(self, error: JWTError) -> HTTPException:
+        self.__failures.debug("JWTRequestAuthenticatorAdapter: rejected bearer token due to %s.", error)
+        return _unauthenticated(error.reason, error.detail)
@@ -5,146 +5,725 @@
 #
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import Executor
+from dataclasses import fields
+from itertools import repeat
 from logging import LoggerAdapter
-from urllib import parse
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import quote
 
 from starlette.exceptions import HTTPException
-from starlette.requests import Request
-from oauthlib.oauth1.rfc5849 import signature as oauth
-from rndi.authentication.starlette.contract import CredentialsRepository, RequestAuthenticator
+from starlette.requests import HTTPConnection, Request
+from starlette.types import Scope
+from rndi.authentication.starlette.batch import descriptor_scope, RequestDescriptor, VerificationResult
+from rndi.authentication.starlette.contract import (
+    AsyncCredentialsRepository,
+    AsyncRequestAuthenticator,
+    AuthenticationObserver,
+    CredentialsRepository,
+    NonceStore,
+    RateLimiter,
+    RequestAuthenticator,
+)
+from rndi.authentication.starlette.instrumentation import (
+    ACCEPTED,
+    REJECTED,
+    STAGE_BASE_STRING,
+    STAGE_BODY,
+    STAGE_CREDENTIALS,
+    STAGE_NONCE,
+    STAGE_PARSE,
+    STAGE_RATE_LIMIT,
+    STAGE_SIGNATURE,
+    STAGE_URI,
+    StageTimer,
+    start_timer,
+)
+from rndi.authentication.starlette.log import provide_log_throttle_interval, throttle, TRACE
+from rndi.authentication.starlette.oauth10a.base_string import base_string_uri, signature_base_string
+from rndi.authentication.starlette.oauth10a.body import (
+    body_request,
+    BODY_TOO_LARGE,
+    DEFAULT_MAX_BODY_SIZE,
+    is_form_content_type,
+    OAuth10aBodyError,
+    parse_form,
+    read_form,
+    read_form_from_thread,
+)
+from rndi.authentication.starlette.oauth10a.nonce import InMemoryNonceStore
+from rndi.authentication.starlette.oauth10a.parser import OAuth10aParameters
+from rndi.authentication.starlette.oauth10a.prevalidation import (
+    OAuth10aPreValidationError,
+    OAuth10aPreValidator,
+    provide_pre_checks,
+    UNSUPPORTED_SIGNATURE_METHOD,
+)
+from rndi.authentication.starlette.oauth10a.signature import (
+    Credential,
+    provide_signature_verifiers,
+    SignatureVerifier,
+)
+from rndi.authentication.starlette.ratelimit import provide_rate_limiter
+from rndi.authentication.starlette.rejection import (
+    INVALID_CREDENTIALS,
+    INVALID_SIGNATURE,
+    MSG_UNAUTHENTICATED,
+    reject,
+    too_many_requests,
+)
+from rndi.authentication.starlette.result import authenticated, AuthResult, principal, remember
 
 
 def provide_oauth10a_request_authenticator_adapter(
-        _: dict,
+        config: dict,
         logger: LoggerAdapter,
         credentials_repository: CredentialsRepository,
+        observer: Optional[AuthenticationObserver] = None,
 ) -> RequestAuthenticator:
     return OAuth10aRequestAuthenticatorAdapter(
         logger=logger,
         credentials_repository=credentials_repository,
+        nonce_store=provide_oauth10a_nonce_store(config),
+        rate_limiter=provide_rate_limiter(config),
+        throttle_interval=provide_log_throttle_interval(config),
+        observer=observer,
+        max_body_size=provide_oauth10a_max_body_size(config),
     )
 
 
-@dataclass
-class Credential:
-    client_key: str
-    client_secret: str
-    resource_owner_secret: str
+def provide_async_oauth10a_request_authenticator_adapter(
+        config: dict,
+        logger: LoggerAdapter,
+        credentials_repository: AsyncCredentialsRepository,
+        observer: Optional[AuthenticationObserver] = None,
+) -> AsyncRequestAuthenticator:
+    return AsyncOAuth10aRequestAuthenticatorAdapter(
+        logger=logger,
+        credentials_repository=credentials_repository,
+        nonce_store=provide_oauth10a_nonce_store(config),
+        rate_limiter=provide_rate_limiter(config),
+        throttle_interval=provide_log_throttle_interval(config),
+        observer=observer,
+        max_body_size=provide_oauth10a_max_body_size(config),
+    )
+
+
+def provide_oauth10a_nonce_store(config: dict) -> Optional[NonceStore]:
+    """
+    Build the in-memory nonce store if the timestamp skew is configured, the
+    replay protection is disabled otherwise.
 
+    :param config: dict The adapter configuration.
+    :return: Optional[NonceStore] The nonce store or None.
+    """
+    skew = int(config.get(REQUEST_AUTH_OAUTH10A_TIMESTAMP_SKEW) or 0)
+    if skew <= 0:
+        return None
+    return InMemoryNonceStore(skew=skew)
 
-@dataclass
-class OAuth10aParameters:
-    oauth_consumer_key: str
-    oauth_signature_method: str
-    oauth_timestamp: str
-    oauth_nonce: str
-    oauth_version: str
-    oauth_signature: str
 
+def provide_oauth10a_max_body_size(config: dict) -> int:
+    """
+    Read the maximum size of the form encoded bodies included in the signature,
+    1 MiB by default.
+
+    :param config: dict The adapter configuration.
+    :return: int The maximum body size in bytes.
+    """
+    max_body_size = config.get(REQUEST_AUTH_OAUTH10A_MAX_BODY_SIZE)
+    return DEFAULT_MAX_BODY_SIZE if max_body_size in (None, '') else int(max_body_size)
+
+
+REQUEST_AUTH_OAUTH10A_TIMESTAMP_SKEW = 'REQUEST_AUTH_OAUTH10A_TIMESTAMP_SKEW'
+REQUEST_AUTH_OAUTH10A_MAX_BODY_SIZE = 'REQUEST_AUTH_OAUTH10A_MAX_BODY_SIZE'
 
 X_FORWARDED_PROTO = 'X-Forwarded-Proto'
 X_FORWARDED_HOST = 'X-Forwarded-Host'
 
-MSG_UNAUTHENTICATED = 'Unauthenticated, {detail}.'
+_AUTHORIZATION = b'authorization'
+_HOST = b'host'
+_CONTENT_TYPE = b'content-type'
+_X_FORWARDED_PROTO = X_FORWARDED_PROTO.lower().encode('latin-1')
+_X_FORWARDED_HOST = X_FORWARDED_HOST.lower().encode('latin-1')
+_HEADERS = frozenset([_AUTHORIZATION, _HOST, _CONTENT_TYPE, _X_FORWARDED_PROTO, _X_FORWARDED_HOST])
+# the characters allowed in a path segment (RFC 3986 section 3.3) besides the
+# unreserved ones.
+_PATH_SAFE = "/:@!$&'()*+,;="
+_CREDENTIAL_FIELDS = tuple(field.name for field in fields(Credential))
+
+# rejection reasons reported to the observer besides the pre-validation and
+# the shared ones.
+REPLAYED_NONCE = 'replayed_nonce'
+INVALID_DESCRIPTOR = 'invalid_descriptor'
 
 
 class OAuth10aRequestAuthenticatorAdapter(RequestAuthenticator):
     DRIVER = 'oauth10a'
 
-    def __init__(self, logger: LoggerAdapter, credentials_repository: CredentialsRepository):
-        self.__logger = logger
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            credentials_repository: CredentialsRepository,
+            signature_verifiers: Optional[Dict[str, SignatureVerifier]] = None,
+            nonce_store: Optional[NonceStore] = None,
+            prevalidator: Optional[OAuth10aPreValidator] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            throttle_interval: Optional[float] = None,
+            observer: Optional[AuthenticationObserver] = None,
+            max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
         self.__credential_repository = credentials_repository
+        self.__observer = observer
+        self.__verification = _OAuth10aVerification(
+            logger,
+            self.DRIVER,
+            signature_verifiers,
+            nonce_store,
+            prevalidator,
+            rate_limiter,
+            throttle_interval,
+            max_body_size,
+        )
 
-    def authenticate(self, request: Request):
-        self.__logger.debug("OAuth10aRequestAuthenticatorAdapter: authenticating request with {driver} driver.".format(
-            driver=self.DRIVER,
-        ))
+    @property
+    def rejections(self) -> Dict[str, int]:
+        return self.__verification.rejections
 
-        header = request.headers.get('authorization')
-        if header is None:
-            raise HTTPException(
-                status_code=401,
-                detail=MSG_UNAUTHENTICATED.format(detail='missing oauth 1.0a signature'),
-            )
+    def authenticate(self, request: HTTPConnection) -> AuthResult:
+        result = authenticated(request, self.DRIVER, self)
+        if result is not None:
+            return result
 
+        scope = request.scope
+        timer = start_timer(self.__observer, self.DRIVER)
         try:
-            authorization = {}
-            # 1. Remove the spaces (" ").
-            # 2. Remove the double quotes ('"').
-            # 3. Remove the first 5 characters of the string (the word "OAuth").
-            # 4. Split the string by coma (,).
-            for parameter in header.replace(' ', '').replace('"', '')[5:].split(','):
-                # split each parameter by equal ("=") to get key-value items.
-                key_value = parameter.split('=')
-                authorization[key_value[0].strip()] = key_value[1].strip()
-
-            authorization = OAuth10aParameters(**authorization)
-            self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: {authorization}")
-        except (IndexError, TypeError) as e:
-            self.__logger.debug(f'OAuth10aRequestAuthenticatorAdapter: unable to parse OAuth 1.0a header {header}'
-                                f' due to {e}.')
-            raise HTTPException(
-                status_code=401,
-                detail=MSG_UNAUTHENTICATED.format(detail='malformed oauth 1.0a signature'),
+            headers, authorization, signature_verifier = self.__verification.before_lookup(scope, timer)
+            form = ()
+            body = self.__verification.signed_body(request, headers)
+            if body is not None:
+                try:
+                    form = read_form_from_thread(body, self.__verification.max_body_size)
+                except OAuth10aBodyError as e:
+                    raise self.__verification.body_rejection(e)
+                if timer is not None:
+                    timer.lap(STAGE_BODY)
+            result = self.__verification.after_lookup(
+                scope,
+                headers,
+                authorization,
+                signature_verifier,
+                self.__credential_repository.get(authorization.oauth_consumer_key),
+                timer,
+                form,
             )
+        except HTTPException as e:
+            if timer is not None:
+                timer.done(getattr(e, 'reason', REJECTED))
+            raise
+
+        if timer is not None:
+            timer.done(ACCEPTED)
+        return remember(request, result, self)
+
 
+class AsyncOAuth10aRequestAuthenticatorAdapter(AsyncRequestAuthenticator):
+    DRIVER = OAuth10aRequestAuthenticatorAdapter.DRIVER
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            credentials_repository: AsyncCredentialsRepository,
+            signature_verifiers: Optional[Dict[str, SignatureVerifier]] = None,
+            nonce_store: Optional[NonceStore] = None,
+            prevalidator: Optional[OAuth10aPreValidator] = None,
+            rate_limiter: Optional[RateLimiter] = None,
+            throttle_interval: Optional[float] = None,
+            observer: Optional[AuthenticationObserver] = None,
+            max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        self.__credential_repository = credentials_repository
+        self.__observer = observer
+        self.__verification = _OAuth10aVerification(
+            logger,
+            self.DRIVER,
+            signature_verifiers,
+            nonce_store,
+            prevalidator,
+            rate_limiter,
+            throttle_interval,
+            max_body_size,
+        )
+
+    @property
+    def rejections(self) -> Dict[str, int]:
+        return self.__verification.rejections
+
+    async def authenticate(self, request: HTTPConnection) -> AuthResult:
+        result = authenticated(request, self.DRIVER, self)
+        if result is not None:
+            return result
+
+        scope = request.scope
+        timer = start_timer(self.__observer, self.DRIVER)
         try:
-            credentials = Credential(**self.__credential_repository.get(authorization.oauth_consumer_key))
-        except TypeError as e:
-            self.__logger.debug(f'OAuth10aRequestAuthenticatorAdapter: unable to retrieve OAuth 1.0a '
-                                f'credentials for client_key {authorization.oauth_consumer_key} due to {e}.')
-            raise HTTPException(
-                status_code=401,
-                detail=MSG_UNAUTHENTICATED.format(detail='invalid client/consumer key'),
+            headers, authorization, signature_verifier = self.__verification.before_lookup(scope, timer)
+            form = ()
+            body = self.__verification.signed_body(request, headers)
+            if body is not None:
+                try:
+                    form = await read_form(body, self.__verification.max_body_size)
+                except OAuth10aBodyError as e:
+                    raise self.__verification.body_rejection(e)
+                if timer is not None:
+                    timer.lap(STAGE_BODY)
+            result = self.__verification.after_lookup(
+                scope,
+                headers,
+                authorization,
+                signature_verifier,
+                await self.__credential_repository.get(authorization.oauth_consumer_key),
+                timer,
+                form,
             )
+        except HTTPException as e:
+            if timer is not None:
+                timer.done(getattr(e, 'reason', REJECTED))
+            raise
+
+        if timer is not None:
+            timer.done(ACCEPTED)
+        return remember(request, result, self)
+
 
-        method = str(request.method)
-        url = str(request.url)
-        query_string = str(request.query_params)
-
-        self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: method: {method}")
-        self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: url: {url}")
-        self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: query string: {query_string}")
-
-        # extract the headers from the request
-        headers = request.headers.mutablecopy()
-
-        # connect uses a load balancer to handle the requests. this changes the
-        # url of the request. the real url can be computed from the X-Forwarded-Proto
-        # and X-Forwarded-Host headers.
-        if X_FORWARDED_PROTO in request.headers and X_FORWARDED_HOST in request.headers:
-            url = '{proto}://{host}{path}'.format(
-                proto=headers[X_FORWARDED_PROTO],
-                host=headers[X_FORWARDED_HOST],
-                path=request.url.path,
+class OAuth10aBatchVerifier:
+    """
+    Verify batches of stored or queued OAuth 1.0a requests (audits, webhook
+    reprocessing) described by RequestDescriptor, returning one result per
+    request instead of raising HTTPException.
+
+    The requests are grouped by consumer key and the credentials of all of
+    them are fetched with a single get_many call, and the signatures of each
+    group are verified in chunks on the given executor (inline by default).
+    The signature verifiers can be pickled, so a ProcessPoolExecutor can be
+    used, each worker process prepares its own state. Stored requests are
+    verified long after being signed, so there is no timestamp, nonce or rate
+    limit check. The form encoded bodies are included in the signature as the
+    authenticators do.
+    """
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            credentials_repository: CredentialsRepository,
+            signature_verifiers: Optional[Dict[str, SignatureVerifier]] = None,
+            prevalidator: Optional[OAuth10aPreValidator] = None,
+            executor: Optional[Executor] = None,
+            chunk_size: int = 256,
+            throttle_interval: Optional[float] = None,
+            max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        self.__credential_repository = credentials_repository
+        self.__executor = executor
+        self.__chunk_size = chunk_size
+        self.__verification = _OAuth10aVerification(
+            logger,
+            OAuth10aRequestAuthenticatorAdapter.DRIVER,
+            signature_verifiers,
+            None,
+            prevalidator,
+            None,
+            throttle_interval,
+            max_body_size,
+        )
+
+    def verify(self, descriptors: Iterable[RequestDescriptor]) -> List[VerificationResult]:
+        """
+        Verify the given requests.
+
+        :param descriptors: Iterable[RequestDescriptor] The requests to verify.
+        :return: List[VerificationResult] The results in the same order as the requests.
+        """
+        results: List[Optional[VerificationResult]] = []
+        groups: Dict[str, List[Tuple[int, OAuth10aParameters, Scope, Dict[bytes, str], List[Tuple[str, str]]]]] = {}
+
+        for index, descriptor in enumerate(descriptors):
+            results.append(None)
+            try:
+                scope = descriptor_scope(descriptor)
+                headers, authorization, _ = self.__verification.before_lookup(scope, None)
+                form = self.__form(descriptor, headers)
+            except UnicodeEncodeError:
+                # a server never receives such a request, the rest of the batch is still verified.
+                results[index] = _failed(None, reject(
+                    INVALID_DESCRIPTOR,
+                    MSG_UNAUTHENTICATED.format(detail='the url and headers must be latin-1 encodable'),
+                    status_code=400,
+                ))
+                continue
+            except HTTPException as e:
+                results[index] = _failed(None, e)
+                continue
+            groups.setdefault(authorization.oauth_consumer_key, []).append(
+                (index, authorization, scope, headers, form),
             )
-            self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: computed url from forwarded headers: {url}")
 
-            # replace the host with the real one computed from headers.
-            headers.update({'host': url})
+        # a single round trip for all the consumer keys of the batch.
+        data = self.__credential_repository.get_many(list(groups)) if groups else {}
+
+        chunks = []
+        credentials = []
+        for client_key, group in groups.items():
+            try:
+                credential = self.__verification.credential(group[0][1], data.get(client_key, {}))
+            except HTTPException as e:
+                for index, *_ in group:
+                    results[index] = _failed(client_key, e)
+                continue
+
+            for start in range(0, len(group), self.__chunk_size):
+                chunks.append([
+                    (index, authorization, self.__verification.base_string(scope, headers, authorization, form=form))
+                    for index, authorization, scope, headers, form in group[start:start + self.__chunk_size]
+                ])
+                credentials.append(credential)
+
+        for chunk, verified in zip(chunks, self.__verify(credentials, chunks)):
+            for (index, authorization, _), valid in zip(chunk, verified):
+                results[index] = (
+                    VerificationResult(True, authorization.oauth_consumer_key) if valid
+                    else _failed(authorization.oauth_consumer_key, self.__verification.invalid_signature(authorization))
+                )
+
+        return results
 
-        parameters = oauth.normalize_parameters(oauth.collect_parameters(
-            uri_query=query_string,
-            body=request.body,
-            headers=headers,
-        ))
+    def __form(self, descriptor: RequestDescriptor, headers: Dict[bytes, str]) -> List[Tuple[str, str]]:
+        if not descriptor.body or not is_form_content_type(headers.get(_CONTENT_TYPE)):
+            return []
+        if len(descriptor.body) > self.__verification.max_body_size:
+            raise self.__verification.body_rejection(OAuth10aBodyError(
+                BODY_TOO_LARGE,
+                f"Body of {len(descriptor.body)} bytes exceeds {self.__verification.max_body_size}.",
+                413,
+            ))
+        return parse_form(descriptor.body)
 
-        self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: parameters: {parameters}")
+    def __verify(self, credentials: List[Credential], chunks: List[list]) -> Iterable[List[bool]]:
+        signatures = [
+            [(authorization.oauth_signature_method, base_string, authorization.oauth_signature)
+             for _, authorization, base_string in chunk]
+            for chunk in chunks
+        ]
+        verifiers = self.__verification.signature_verifiers
+        if self.__executor is None:
+            return map(_verify_signatures, repeat(verifiers), credentials, signatures)
+        return self.__executor.map(_verify_signatures, repeat(verifiers), credentials, signatures)
 
-        signature_generated = parse.quote(
-            string=oauth.sign_hmac_sha1_with_client(
-                sig_base_str=oauth.signature_base_string(method, url, parameters),
-                client=credentials,
-            ),
-            safe="",
+
+def _verify_signatures(
+        signature_verifiers: Dict[str, SignatureVerifier],
+        credential: Credential,
+        signatures: List[Tuple[str, str, str]],
+) -> List[bool]:
+    # module level so it can run in a process pool.
+    return [
+        signature_verifiers[method].verify(credential, base_string, signature)
+        for method, base_string, signature in signatures
+    ]
+
+
+def _failed(client_key: Optional[str], exception: HTTPException) -> VerificationResult:
+    return VerificationResult(
+        valid=False,
+        consumer_key=client_key,
+        reason=getattr(exception, 'reason', REJECTED),
+        detail=exception.detail,
+        status_code=exception.status_code,
+    )
+
+
+class _OAuth10aVerification:
+    """
+    The verification shared by the sync and async adapters, split around the
+    credentials lookup, the only stage that differs between them.
+    """
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            driver: str,
+            signature_verifiers: Optional[Dict[str, SignatureVerifier]],
+            nonce_store: Optional[NonceStore],
+            prevalidator: Optional[OAuth10aPreValidator],
+            rate_limiter: Optional[RateLimiter],
+            throttle_interval: Optional[float],
+            max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        self.__logger = logger
+        self.__driver = driver
+        self.__max_body_size = max_body_size
+        # the failures may be logged once per request of a flood, those can be
+        # aggregated per interval.
+        self.__failures = throttle(logger, throttle_interval)
+        self.__nonce_store = nonce_store
+        self.__rate_limiter = rate_limiter
+        self.__signature_verifiers = (
+            provide_signature_verifiers() if signature_verifiers is None else signature_verifiers
+        )
+        self.__prevalidator = (
+            OAuth10aPreValidator(provide_pre_checks(self.__signature_verifiers, nonce_store))
+            if prevalidator is None else prevalidator
         )
 
-        self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: generated signature: {signature_generated}")
-        self.__logger.debug(f"OAuth10aRequestAuthenticatorAdapter: received signature: {authorization.oauth_signature}")
+    @property
+    def rejections(self) -> Dict[str, int]:
+        return self.__prevalidator.rejections
+
+    @property
+    def max_body_size(self) -> int:
+        return self.__max_body_size
+
+    def before_lookup(
+            self,
+            scope: Scope,
+            timer: Optional[StageTimer],
+    ) -> Tuple[Dict[bytes, str], OAuth10aParameters, SignatureVerifier]:
+        headers = _extract_headers(scope)
+        authorization = _prevalidate(self.__logger, self.__failures, self.__driver, self.__prevalidator, headers)
+        signature_verifier = _signature_verifier(self.__failures, self.__signature_verifiers, authorization)
+        if timer is not None:
+            timer.lap(STAGE_PARSE)
 
-        if authorization.oauth_signature != signature_generated:
-            raise HTTPException(
-                status_code=401,
-                detail=MSG_UNAUTHENTICATED.format(detail='the provided signature is not valid'),
+        if self.__rate_limiter is not None:
+            _rate_limit(self.__failures, self.__rate_limiter, authorization.oauth_consumer_key)
+            if timer is not None:
+                timer.lap(STAGE_RATE_LIMIT)
+
+        return headers, authorization, signature_verifier
+
+    def after_lookup(
+            self,
+            scope: Scope,
+            headers: Dict[bytes, str],
+            authorization: OAuth10aParameters,
+            signature_verifier: SignatureVerifier,
+            data: Dict[str, str],
+            timer: Optional[StageTimer],
+            form: Sequence[Tuple[str, str]] = (),
+    ) -> AuthResult:
+        if timer is not None:
+            timer.lap(STAGE_CREDENTIALS)
+        credentials = self.credential(authorization, data)
+
+        base_string = self.base_string(scope, headers, authorization, timer, form)
+
+        verified = signature_verifier.verify(credentials, base_string, authorization.oauth_signature)
+        if timer is not None:
+            timer.lap(STAGE_SIGNATURE)
+        if not verified:
+            raise self.invalid_signature(authorization)
+
+        if self.__nonce_store is not None:
+            _remember_nonce(self.__failures, self.__nonce_store, authorization)
+            if timer is not None:
+                timer.lap(STAGE_NONCE)
+
+        return principal(authorization.oauth_consumer_key, self.__driver, data)
+
+    @property
+    def signature_verifiers(self) -> Dict[str, SignatureVerifier]:
+        return self.__signature_verifiers
+
+    def credential(self, authorization: OAuth10aParameters, data: Dict[str, str]) -> Credential:
+        return _make_credential(self.__failures, authorization, data)
+
+    def signed_body(self, request: HTTPConnection, headers: Dict[bytes, str]) -> Optional[Request]:
+        # only the form encoded bodies are part of the signature (RFC 5849
+        # section 3.4.1.3.1), the rest are never read.
+        if not is_form_content_type(headers.get(_CONTENT_TYPE)):
+            return None
+        return body_request(request)
+
+    def body_rejection(self, error: OAuth10aBodyError) -> HTTPException:
+        self.__failures.debug("OAuth10aRequestAuthenticatorAdapter: rejected request body due to %s.", error)
+        return reject(error.reason, MSG_UNAUTHENTICATED.format(detail=error.detail), status_code=error.status_code)
+
+    def base_string(
+            self,
+            scope: Scope,
+            headers: Dict[bytes, str],
+            authorization: OAuth10aParameters,
+            timer: Optional[StageTimer] = None,
+            form: Sequence[Tuple[str, str]] = (),
+    ) -> str:
+        url = _request_uri(scope, headers)
+        if timer is not None:
+            timer.lap(STAGE_URI)
+
+        # the protocol parameters are taken from the already parsed authorization
+        # header and the form parameters were decoded while reading the body,
+        # only the query string is decoded here.
+        method = scope['method']
+        query_string = scope.get('query_string', b'').decode('latin-1')
+        base_string = signature_base_string(method, url, query_string, authorization.parameters, form)
+        if timer is not None:
+            timer.lap(STAGE_BASE_STRING)
+
+        # the full detail is only logged in trace mode, the arguments are
+        # formatted by the logging module only if the level is enabled.
+        if self.__logger.isEnabledFor(TRACE):
+            self.__logger.log(
+                TRACE,
+                "OAuth10aRequestAuthenticatorAdapter: method: %s, url: %s, query string: %s, base string: %s, "
+                "received signature: %s",
+                method,
+                url,
+                query_string,
+                base_string,
+                authorization.oauth_signature,
             )
+
+        return base_string
+
+    def invalid_signature(self, authorization: OAuth10aParameters) -> HTTPException:
+        self.__failures.debug(
+            "OAuth10aRequestAuthenticatorAdapter: invalid signature for client_key %s.",
+            authorization.oauth_consumer_key,
+        )
+        return reject(INVALID_SIGNATURE, MSG_UNAUTHENTICATED.format(detail='the provided signature is not valid'))
+
+
+def _extract_headers(scope: Scope) -> Dict[bytes, str]:
+    """
+    Collect the headers required by the OAuth 1.0a verification in a single
+    pass over the raw ASGI headers, the rest of headers are never decoded.
+    """
+    headers = {}
+    for key, value in scope['headers']:
+        if key in _HEADERS:
+            headers[key] = value.decode('latin-1')
+    return headers
+
+
+def _prevalidate(
+        logger: LoggerAdapter,
+        failures: LoggerAdapter,
+        driver: str,
+        prevalidator: OAuth10aPreValidator,
+        headers: Dict[bytes, str],
+) -> OAuth10aParameters:
+    logger.debug("OAuth10aRequestAuthenticatorAdapter: authenticating request with %s driver.", driver)
+
+    # the cheap checks run before the credentials lookup and the signature
+    # verification.
+    try:
+        authorization = prevalidator.validate(headers.get(_AUTHORIZATION))
+    except OAuth10aPreValidationError as e:
+        failures.debug("OAuth10aRequestAuthenticatorAdapter: rejected OAuth 1.0a header due to %s.", e)
+        failures.log(TRACE, "OAuth10aRequestAuthenticatorAdapter: rejected header %s.", headers.get(_AUTHORIZATION))
+        raise reject(e.reason, MSG_UNAUTHENTICATED.format(detail=e.detail))
+
+    logger.log(TRACE, "OAuth10aRequestAuthenticatorAdapter: %r", authorization)
+    return authorization
+
+
+def _rate_limit(logger: LoggerAdapter, rate_limiter: RateLimiter, client_key: str):
+    wait = rate_limiter.acquire(client_key)
+    if wait > 0:
+        logger.debug("OAuth10aRequestAuthenticatorAdapter: rate limit exceeded for client_key %s.", client_key)
+        raise too_many_requests(wait)
+
+
+def _remember_nonce(
+        logger: LoggerAdapter,
+        nonce_store: NonceStore,
+        authorization: OAuth10aParameters,
+):
+    # the nonces are only recorded for correctly signed requests, so forged
+    # requests cannot fill the store or burn the nonces of the client.
+    timestamp = authorization.oauth_timestamp
+    if (
+            timestamp.isascii() and timestamp.isdigit()
+            and nonce_store.remember(authorization.oauth_consumer_key, int(timestamp), authorization.oauth_nonce)
+    ):
+        return
+
+    logger.debug(
+        "OAuth10aRequestAuthenticatorAdapter: replayed oauth_nonce %s for client_key %s.",
+        authorization.oauth_nonce,
+        authorization.oauth_consumer_key,
+    )
+    raise reject(REPLAYED_NONCE, MSG_UNAUTHENTICATED.format(detail='the nonce has already been used'))
+
+
+def _signature_verifier(
+        logger: LoggerAdapter,
+        signature_verifiers: Dict[str, SignatureVerifier],
+        authorization: OAuth10aParameters,
+) -> SignatureVerifier:
+    # the default pre-checks already reject the unsupported methods.
+    signature_verifier = signature_verifiers.get(authorization.oauth_signature_method)
+    if signature_verifier is None:
+        logger.debug(
+            "OAuth10aRequestAuthenticatorAdapter: unsupported signature method %s.",
+            authorization.oauth_signature_method,
+        )
+        raise reject(UNSUPPORTED_SIGNATURE_METHOD, MSG_UNAUTHENTICATED.format(detail='unsupported signature method'))
+    return signature_verifier
+
+
+def _make_credential(logger: LoggerAdapter, authorization: OAuth10aParameters, data: Dict[str, str]) -> Credential:
+    # the rest of the attributes (tenant, tier...) only go to the AuthResult.
+    try:
+        return Credential(**{name: data[name] for name in _CREDENTIAL_FIELDS if name in data})
+    except TypeError as e:
+        logger.debug(
+            "OAuth10aRequestAuthenticatorAdapter: unable to retrieve OAuth 1.0a credentials for client_key %s "
+            "due to %s.",
+            authorization.oauth_consumer_key,
+            e,
+        )
+        raise reject(INVALID_CREDENTIALS, MSG_UNAUTHENTICATED.format(detail='invalid client/consumer key'))
+
+
+def _request_path(scope: Scope) -> str:
+    """
+    Recover the path as sent by the client from the raw_path of the scope, the
+    decoded path is only encoded again for the servers not giving raw_path, as
+    decoding loses the difference between "/" and "%2F" (or "+" and "%2B").
+    """
+    root_path = scope.get('root_path', '')
+    raw_path = scope.get('raw_path')
+    if raw_path is None:
+        return quote(root_path + scope['path'], safe=_PATH_SAFE)
+
+    # the raw_path includes the root_path of the mounted applications, but not
+    # the one stripped by a proxy in front of the server.
+    path = raw_path.decode('latin-1')
+    if root_path:
+        root_path = quote(root_path, safe=_PATH_SAFE)
+        if not path.startswith(root_path):
+            path = root_path + path
+    return path
+
+
+def _request_uri(scope: Scope, headers: Dict[bytes, str]) -> str:
+    """
+    Compute the base string URI straight from the ASGI scope, taking the host
+    the same way starlette.datastructures.URL does.
+    """
+    scheme = scope.get('scheme', 'http')
+    path = _request_path(scope)
+
+    # connect uses a load balancer to handle the requests. this changes the
+    # url of the request. the real url can be computed from the X-Forwarded-Proto
+    # and X-Forwarded-Host headers.
+    if _X_FORWARDED_PROTO in headers and _X_FORWARDED_HOST in headers:
+        return base_string_uri(headers[_X_FORWARDED_PROTO], headers[_X_FORWARDED_HOST], path)
+
+    host = headers.get(_HOST)
+    if host is None:
+        server = scope.get('server')
+        host = '' if server is None else f'{server[0]}:{server[1]}'
+
+    return base_string_uri(scheme, host, path)
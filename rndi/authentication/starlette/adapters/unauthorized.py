@@ -4,30 +4,81 @@
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
 from logging import LoggerAdapter
+from typing import Optional
 
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from rndi.authentication.starlette.contract import CredentialsRepository, RequestAuthenticator
+from rndi.authentication.starlette.contract import (
+    AsyncCredentialsRepository,
+    AsyncRequestAuthenticator,
+    AuthenticationObserver,
+    CredentialsRepository,
+    RequestAuthenticator,
+)
+from rndi.authentication.starlette.instrumentation import REJECTED, start_timer
+from rndi.authentication.starlette.log import provide_log_throttle_interval, throttle
+
+# the fallback driver may answer every request of a busy service, so its
+# warnings are aggregated by default.
+DEFAULT_THROTTLE_INTERVAL = 60.0
 
 
 def provide_unauthorized_request_authenticator(
-        _: dict,
+        config: dict,
         logger: LoggerAdapter,
-        __: CredentialsRepository,
+        _: CredentialsRepository,
+        observer: Optional[AuthenticationObserver] = None,
 ) -> RequestAuthenticator:
     return UnauthorizedRequestAuthenticatorAdapter(
         logger=logger,
+        throttle_interval=provide_log_throttle_interval(config, DEFAULT_THROTTLE_INTERVAL),
+        observer=observer,
+    )
+
+
+def provide_async_unauthorized_request_authenticator(
+        config: dict,
+        logger: LoggerAdapter,
+        _: AsyncCredentialsRepository,
+        observer: Optional[AuthenticationObserver] = None,
+) -> AsyncRequestAuthenticator:
+    return AsyncUnauthorizedRequestAuthenticatorAdapter(
+        logger=logger,
+        throttle_interval=provide_log_throttle_interval(config, DEFAULT_THROTTLE_INTERVAL),
+        observer=observer,
     )
 
 
 class UnauthorizedRequestAuthenticatorAdapter(RequestAuthenticator):
     DRIVER = 'unauthorized'
 
-    def __init__(self, logger: LoggerAdapter):
-        self.__logger = logger
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            throttle_interval: Optional[float] = DEFAULT_THROTTLE_INTERVAL,
+            observer: Optional[AuthenticationObserver] = None,
+    ):
+        self.__logger = throttle(logger, throttle_interval)
+        self.__observer = observer
 
     def authenticate(self, request: Request):
-        self.__logger.warning("UnauthorizedRequestAuthenticatorAdapter: Unauthorized request with {driver}.".format(
-            driver=self.DRIVER,
-        ))
+        timer = start_timer(self.__observer, self.DRIVER)
+        self.__logger.warning("UnauthorizedRequestAuthenticatorAdapter: Unauthorized request with %s.", self.DRIVER)
+        if timer is not None:
+            timer.done(REJECTED)
         raise HTTPException(status_code=401, detail="Unauthenticated.")
+
+
+class AsyncUnauthorizedRequestAuthenticatorAdapter(AsyncRequestAuthenticator):
+    DRIVER = UnauthorizedRequestAuthenticatorAdapter.DRIVER
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            throttle_interval: Optional[float] = DEFAULT_THROTTLE_INTERVAL,
+            observer: Optional[AuthenticationObserver] = None,
+    ):
+        self.__adapter = UnauthorizedRequestAuthenticatorAdapter(logger, throttle_interval, observer)
+
+    async def authenticate(self, request: Request):
+        self.__adapter.authenticate(request)
@@ -0,0 +1,68 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from dataclasses import dataclass, field
+from typing import Mapping, Optional
+from urllib.parse import unquote, urlsplit
+
+from starlette.types import Scope
+
+
+@dataclass
+class RequestDescriptor:
+    """
+    Lightweight description of a stored or queued request to verify without
+    building a starlette Request, the query string is taken from the url
+    unless query is given.
+    """
+    method: str
+    url: str
+    headers: Mapping[str, str] = field(default_factory=dict)
+    query: Optional[str] = None
+    body: bytes = b''
+
+
+@dataclass
+class VerificationResult:
+    """
+    The verification result of one request, the rejection reason, detail and
+    status code are the ones the authenticator would have raised.
+    """
+    valid: bool
+    consumer_key: Optional[str] = None
+    reason: Optional[str] = None
+    detail: Optional[str] = None
+    status_code: int = 200
+
+
+def descriptor_scope(descriptor: RequestDescriptor) -> Scope:
+    """
+    Build the minimal ASGI http scope a server would have built for the given
+    request descriptor.
+
+    :param descriptor: RequestDescriptor The request descriptor.
+    :return: Scope The ASGI scope.
+    :raise UnicodeEncodeError: If the url or the headers are not latin-1 encodable.
+    """
+    url = urlsplit(descriptor.url)
+    headers = [
+        (name.lower().encode('latin-1'), value.encode('latin-1'))
+        for name, value in descriptor.headers.items()
+    ]
+    if url.netloc and not any(name == b'host' for name, _ in headers):
+        headers.append((b'host', url.netloc.encode('latin-1')))
+
+    query = url.query if descriptor.query is None else descriptor.query
+
+    return {
+        'type': 'http',
+        'method': descriptor.method.upper(),
+        'scheme': url.scheme or 'http',
+        'path': unquote(url.path) or '/',
+        'raw_path': (url.path or '/').encode('latin-1'),
+        'root_path': '',
+        'query_string': query.encode('latin-1'),
+        'headers': headers,
+    }
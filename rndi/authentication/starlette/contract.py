@@ -3,21 +3,27 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
+import asyncio
 from abc import ABC, abstractmethod
 from logging import LoggerAdapter
-from typing import Callable, Dict
+from typing import Callable, Dict, Iterable, Optional
 
 from starlette.requests import Request
+from rndi.authentication.starlette.result import AuthResult
 
 
 class RequestAuthenticator(ABC):
     @abstractmethod
-    def authenticate(self, request: Request):
+    def authenticate(self, request: Request) -> Optional[AuthResult]:
         """
         Authenticate the given request.
 
+        The built-in authenticators memoize the AuthResult in the request
+        state, so authenticating the same request again is O(1).
+
         :param request: The Starlette Request Object.
-        :return: None if the request is successfully authenticated, raise HTTPException otherwise.
+        :return: Optional[AuthResult] The principal if the request is successfully authenticated (None for
+                 authenticators without principal), raise HTTPException otherwise.
         """
 
 
@@ -43,5 +49,126 @@ class CredentialsRepository(ABC):
         :return: Dict[str, str] A key-value dictionary with the credentials.
         """
 
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Get the credentials for all the given keys at once.
+
+        The default implementation calls get for each key, repositories able
+        to recover several keys in a single round trip should override it.
+
+        :param keys: Iterable[str] The given keys.
+        :return: Dict[str, Dict[str, str]] The credentials by key, empty dictionary for the unknown keys.
+        """
+        return {key: self.get(key) for key in keys}
+
+
+class AsyncRequestAuthenticator(ABC):
+    @abstractmethod
+    async def authenticate(self, request: Request) -> Optional[AuthResult]:
+        """
+        Authenticate the given request without blocking the event loop.
+
+        :param request: The Starlette Request Object.
+        :return: Optional[AuthResult] The principal if the request is successfully authenticated (None for
+                 authenticators without principal), raise HTTPException otherwise.
+        """
+
+
+class AsyncCredentialsRepository(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Dict[str, str]:
+        """
+        Get the credentials for the given key or id without blocking the event loop.
+
+        Same semantics as CredentialsRepository.get, if the credentials cannot be
+        recovered by key, the service MUST return empty dictionary.
+
+        :param key: str The given key or ir can be a consumer key or a client id.
+        :return: Dict[str, str] A key-value dictionary with the credentials.
+        """
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Get the credentials for all the given keys at once without blocking
+        the event loop.
+
+        The default implementation awaits get for each key concurrently,
+        repositories able to recover several keys in a single round trip
+        should override it.
+
+        :param keys: Iterable[str] The given keys.
+        :return: Dict[str, Dict[str, str]] The credentials by key, empty dictionary for the unknown keys.
+        """
+        keys = list(dict.fromkeys(keys))
+        return dict(zip(keys, await asyncio.gather(*[self.get(key) for key in keys])))
+
+
+class NonceStore(ABC):
+    @abstractmethod
+    def is_fresh(self, timestamp: int) -> bool:
+        """
+        Check if the given request timestamp is inside the accepted window.
+
+        This check MUST be cheap, it is done before any credentials lookup or
+        signature verification.
+
+        :param timestamp: int The request timestamp in seconds since the epoch.
+        :return: bool True if the timestamp is accepted, False otherwise.
+        """
+
+    @abstractmethod
+    def remember(self, client_key: str, timestamp: int, nonce: str) -> bool:
+        """
+        Atomically record the given nonce for the client key and timestamp.
+
+        Implementations shared by several workers (redis, memcached...) MUST do
+        the check and the insertion as a single operation, expiring the nonces
+        once their timestamp leaves the accepted window.
+
+        :param client_key: str The client/consumer key.
+        :param timestamp: int The request timestamp in seconds since the epoch.
+        :param nonce: str The request nonce.
+        :return: bool True if the nonce was not used before, False if the request is a replay.
+        """
+
+
+class RateLimiter(ABC):
+    @abstractmethod
+    def acquire(self, key: str) -> float:
+        """
+        Consume one request from the allowance of the given key.
+
+        This check MUST be cheap, it is done before the credentials lookup.
+
+        :param key: str The limited key, usually the consumer key or client id.
+        :return: float 0 if the request is allowed, otherwise the seconds to wait before retrying.
+        """
+
+
+class AuthenticationObserver(ABC):
+    @abstractmethod
+    def stage(self, driver: str, stage: str, seconds: float):
+        """
+        Observe the time spent in one stage of the authentication.
+
+        :param driver: str The authenticator driver.
+        :param stage: str The stage name, for example "parse", "credentials" or "signature".
+        :param seconds: float The monotonic duration of the stage in seconds.
+        """
+
+    @abstractmethod
+    def outcome(self, driver: str, outcome: str, seconds: float):
+        """
+        Observe the outcome of the authentication.
+
+        :param driver: str The authenticator driver.
+        :param outcome: str "accepted" or the rejection reason.
+        :param seconds: float The monotonic duration of the whole authentication in seconds.
+        """
+
 
 RequestAuthenticatorDriverProvider = Callable[[dict, LoggerAdapter, CredentialsRepository], RequestAuthenticator]
+AsyncRequestAuthenticatorDriverProvider = Callable[
+    [dict, LoggerAdapter, AsyncCredentialsRepository],
+    AsyncRequestAuthenticator,
+]
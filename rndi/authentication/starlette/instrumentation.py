@@ -0,0 +1,169 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from rndi.authentication.starlette.contract import AuthenticationObserver
+
+ACCEPTED = 'accepted'
+REJECTED = 'rejected'
+
+# stages of the built-in drivers.
+STAGE_PARSE = 'parse'
+STAGE_RATE_LIMIT = 'rate_limit'
+STAGE_BODY = 'body'
+STAGE_CREDENTIALS = 'credentials'
+STAGE_URI = 'uri'
+STAGE_BASE_STRING = 'base_string'
+STAGE_SIGNATURE = 'signature'
+STAGE_NONCE = 'nonce'
+STAGE_TOKEN_CACHE = 'token_cache'
+STAGE_CLAIMS = 'claims'
+
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+)
+
+
+class NullAuthenticationObserver(AuthenticationObserver):
+    """
+    Observer that discards everything. The built-in adapters skip the timing
+    entirely when no observer is given, this one is only useful as a
+    placeholder.
+    """
+
+    def stage(self, driver: str, stage: str, seconds: float):
+        pass
+
+    def outcome(self, driver: str, outcome: str, seconds: float):
+        pass
+
+
+class StageTimer:
+    """
+    Measure consecutive stages of one authentication with a monotonic clock.
+    """
+
+    __slots__ = ('__observer', '__driver', '__start', '__last')
+
+    def __init__(self, observer: AuthenticationObserver, driver: str):
+        self.__observer = observer
+        self.__driver = driver
+        self.__start = self.__last = perf_counter()
+
+    def lap(self, stage: str):
+        """
+        Report the time since the previous lap (or the start) as the given stage.
+
+        :param stage: str The stage name.
+        """
+        now = perf_counter()
+        self.__observer.stage(self.__driver, stage, now - self.__last)
+        self.__last = now
+
+    def done(self, outcome: str):
+        """
+        Report the outcome and the time since the start.
+
+        :param outcome: str "accepted" or the rejection reason.
+        """
+        self.__observer.outcome(self.__driver, outcome, perf_counter() - self.__start)
+
+
+def start_timer(observer: Optional[AuthenticationObserver], driver: str) -> Optional[StageTimer]:
+    """
+    Start a StageTimer if there is an observer, the adapters skip the timing
+    entirely otherwise.
+
+    :param observer: Optional[AuthenticationObserver] The observer.
+    :param driver: str The authenticator driver.
+    :return: Optional[StageTimer] The timer or None.
+    """
+    return None if observer is None else StageTimer(observer, driver)
+
+
+class _Histogram:
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class HistogramAuthenticationObserver(AuthenticationObserver):
+    """
+    In-process histograms of the stage and the authentication durations,
+    labelled by driver and stage or outcome, that can be exported in the
+    Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = 'rndi_authentication'):
+        self.__buckets = tuple(sorted(buckets))
+        self.__prefix = prefix
+        self.__stages: Dict[Tuple[str, str], _Histogram] = {}
+        self.__outcomes: Dict[Tuple[str, str], _Histogram] = {}
+        self.__lock = Lock()
+
+    def stage(self, driver: str, stage: str, seconds: float):
+        self.__observe(self.__stages, (driver, stage), seconds)
+
+    def outcome(self, driver: str, outcome: str, seconds: float):
+        self.__observe(self.__outcomes, (driver, outcome), seconds)
+
+    def export(self) -> str:
+        """
+        Export the histograms in the Prometheus text exposition format.
+
+        :return: str The exposition text.
+        """
+        lines: List[str] = []
+        with self.__lock:
+            self.__export(lines, 'stage_seconds', 'Time spent in each authentication stage.', 'stage', self.__stages)
+            self.__export(lines, 'seconds', 'Time spent authenticating requests.', 'outcome', self.__outcomes)
+        return '\n'.join(lines) + '\n'
+
+    def __observe(self, histograms: Dict[Tuple[str, str], _Histogram], key: Tuple[str, str], seconds: float):
+        # the +Inf bucket is the last one.
+        index = bisect_left(self.__buckets, seconds)
+        with self.__lock:
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = _Histogram(len(self.__buckets) + 1)
+            histogram.counts[index] += 1
+            histogram.sum += seconds
+            histogram.count += 1
+
+    def __export(
+            self,
+            lines: List[str],
+            name: str,
+            description: str,
+            label: str,
+            histograms: Dict[Tuple[str, str], _Histogram],
+    ):
+        metric = f'{self.__prefix}_{name}'
+        lines.append(f'# HELP {metric} {description}')
+        lines.append(f'# TYPE {metric} histogram')
+
+        bounds = [repr(bound) for bound in self.__buckets] + ['+Inf']
+        for (driver, value), histogram in sorted(histograms.items()):
+            labels = f'driver="{_escape(driver)}",{label}="{_escape(value)}"'
+            cumulative = 0
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{{labels}}} {histogram.sum!r}')
+            lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,82 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import hashlib
+import hmac
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+from rndi.authentication.starlette.oauth10a.signature import Credential, SignatureVerifier
+
+HS256 = 'HS256'
+HS384 = 'HS384'
+HS512 = 'HS512'
+RS256 = 'RS256'
+RS384 = 'RS384'
+RS512 = 'RS512'
+
+
+class JWTHmacSignatureVerifier(SignatureVerifier):
+    """
+    Verify the HMAC JWS signatures (RFC 7518 section 3.2) with the
+    client_secret of the credential as the raw key, the prepared hmac object is
+    copied for each token. The RSA keys of the credential are never used as
+    HMAC secrets, so a token cannot switch the algorithm of an RSA key.
+    """
+
+    def __init__(self, digestmod: Callable = hashlib.sha256, max_size: int = 1024):
+        super().__init__(max_size)
+        self.__digestmod = digestmod
+
+    def _material(self, credential: Credential) -> Optional[Hashable]:
+        return credential.client_secret
+
+    def _prepare(self, material: str) -> hmac.HMAC:
+        return hmac.new(material.encode('utf-8'), digestmod=self.__digestmod)
+
+    def _verify(self, prepared: hmac.HMAC, message: bytes, signature: bytes) -> bool:
+        generated = prepared.copy()
+        generated.update(message)
+        return hmac.compare_digest(generated.digest(), signature)
+
+
+def provide_jwt_signature_verifiers(
+        algorithms: Optional[Iterable[str]] = None,
+        max_size: int = 1024,
+) -> Dict[str, SignatureVerifier]:
+    """
+    Build the signature verifiers of the given JWS algorithms, all the
+    supported ones by default. The RSA algorithms (RSASSA-PKCS1-v1_5, the
+    same as the OAuth 1.0a RSA methods) are only available if the optional
+    cryptography package is installed.
+
+    :param algorithms: Optional[Iterable[str]] The accepted alg header values.
+    :param max_size: int The maximum number of keys prepared per algorithm.
+    :return: Dict[str, SignatureVerifier] The verifiers by alg header value.
+    :raise ValueError: If any of the given algorithms is not available.
+    """
+    verifiers: Dict[str, SignatureVerifier] = {
+        HS256: JWTHmacSignatureVerifier(hashlib.sha256, max_size),
+        HS384: JWTHmacSignatureVerifier(hashlib.sha384, max_size),
+        HS512: JWTHmacSignatureVerifier(hashlib.sha512, max_size),
+    }
+
+    try:
+        from rndi.authentication.starlette.oauth10a.rsa import RsaSignatureVerifier
+    except ImportError:  # pragma: no cover
+        pass
+    else:
+        verifiers[RS256] = RsaSignatureVerifier('SHA256', max_size)
+        verifiers[RS384] = RsaSignatureVerifier('SHA384', max_size)
+        verifiers[RS512] = RsaSignatureVerifier('SHA512', max_size)
+
+    if algorithms is None:
+        return verifiers
+
+    unavailable = [algorithm for algorithm in algorithms if algorithm not in verifiers]
+    if unavailable:
+        raise ValueError(f"Unavailable JWT algorithms {', '.join(unavailable)}.")
+    return {algorithm: verifiers[algorithm] for algorithm in algorithms}
@@ -0,0 +1,270 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from base64 import urlsafe_b64decode
+from collections import OrderedDict
+from math import isfinite
+from threading import Lock
+from time import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from rndi.authentication.starlette.rejection import ReasonError
+from rndi.authentication.starlette.result import AuthResult
+
+MISSING_TOKEN = 'missing_token'
+TOKEN_TOO_LONG = 'token_too_long'
+MALFORMED_TOKEN = 'malformed_token'
+UNSUPPORTED_ALGORITHM = 'unsupported_algorithm'
+MISSING_KEY_ID = 'missing_key_id'
+MISSING_CLAIM = 'missing_claim'
+INVALID_CLAIM = 'invalid_claim'
+EXPIRED_TOKEN = 'expired_token'
+IMMATURE_TOKEN = 'immature_token'
+INVALID_AUDIENCE = 'invalid_audience'
+INVALID_ISSUER = 'invalid_issuer'
+
+# the detail given in the 401 of each token failure, every failure to decode
+# the token is a "malformed bearer token" so the response does not tell which
+# segment or claim was wrong.
+DETAILS = {
+    MISSING_TOKEN: 'missing bearer token',
+    TOKEN_TOO_LONG: 'malformed bearer token',
+    MALFORMED_TOKEN: 'malformed bearer token',
+    UNSUPPORTED_ALGORITHM: 'unsupported token algorithm',
+    MISSING_KEY_ID: 'malformed bearer token',
+    MISSING_CLAIM: 'malformed bearer token',
+    INVALID_CLAIM: 'malformed bearer token',
+    EXPIRED_TOKEN: 'expired token',
+    IMMATURE_TOKEN: 'the token is not valid yet',
+    INVALID_AUDIENCE: 'invalid token audience',
+    INVALID_ISSUER: 'invalid token issuer',
+}
+
+# the tokens are carried in a header, the longer ones are rejected before
+# decoding anything.
+MAX_TOKEN_LENGTH = 8192
+
+# compact JWS serialization (RFC 7515 section 7.1), base64url segments without
+# padding.
+_COMPACT = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+')
+_BEARER = 'bearer '
+
+
+class JWTError(ReasonError):
+    DETAILS = DETAILS
+
+
+class JWTToken:
+    """
+    A decoded, not yet verified, JWS compact serialized token.
+
+    The key_id is the kid header, or the iss claim for the issuers that sign
+    all their tokens with a single key.
+    """
+
+    __slots__ = ('header', 'claims', 'signing_input', 'signature')
+
+    def __init__(self, header: Dict[str, Any], claims: Dict[str, Any], signing_input: bytes, signature: bytes):
+        self.header = header
+        self.claims = claims
+        self.signing_input = signing_input
+        self.signature = signature
+
+    @property
+    def algorithm(self) -> str:
+        return self.header['alg']
+
+    @property
+    def key_id(self) -> Optional[str]:
+        key_id = self.header.get('kid', self.claims.get('iss'))
+        return key_id if isinstance(key_id, str) and key_id else None
+
+    def __repr__(self) -> str:
+        return f'JWTToken(header={self.header!r}, claims={self.claims!r})'
+
+
+def bearer_token(authorization: Optional[str]) -> str:
+    """
+    Extract the token of the given Bearer Authorization header (RFC 6750
+    section 2.1), the scheme is case-insensitive.
+
+    :param authorization: Optional[str] The Authorization header.
+    :return: str The token.
+    :raise JWTError: If the header is missing or it is not a Bearer one.
+    """
+    if authorization is None or authorization[:len(_BEARER)].lower() != _BEARER:
+        raise JWTError(MISSING_TOKEN, "Missing Bearer Authorization header.")
+    return authorization[len(_BEARER):].strip()
+
+
+def parse_token(token: str) -> JWTToken:
+    """
+    Decode the header and the claims of the given JWS compact serialized
+    token, the signature is not verified.
+
+    :param token: str The token.
+    :return: JWTToken The decoded token.
+    :raise JWTError: If the token is malformed.
+    """
+    if len(token) > MAX_TOKEN_LENGTH:
+        raise JWTError(TOKEN_TOO_LONG, f"Token of {len(token)} characters exceeds {MAX_TOKEN_LENGTH}.")
+    if _COMPACT.fullmatch(token) is None:
+        raise JWTError(MALFORMED_TOKEN, "The token is not a JWS compact serialization.")
+
+    encoded_header, encoded_claims, encoded_signature = token.split('.')
+    header = _decode_object(encoded_header, 'header')
+    claims = _decode_object(encoded_claims, 'claims')
+    if not isinstance(header.get('alg'), str):
+        raise JWTError(MALFORMED_TOKEN, "The token header has no alg.")
+
+    return JWTToken(
+        header,
+        claims,
+        f'{encoded_header}.{encoded_claims}'.encode('ascii'),
+        _decode(encoded_signature, 'signature'),
+    )
+
+
+def validate_claims(
+        claims: Dict[str, Any],
+        now: float,
+        leeway: float = 0,
+        audience: Optional[str] = None,
+        issuer: Optional[str] = None,
+) -> float:
+    """
+    Validate the registered claims (RFC 7519 section 4.1) of a token, the exp
+    claim is required.
+
+    :param claims: Dict[str, Any] The token claims.
+    :param now: float The current unix time.
+    :param leeway: float The allowed clock skew in seconds.
+    :param audience: Optional[str] The expected aud, not checked if None.
+    :param issuer: Optional[str] The expected iss, not checked if None.
+    :return: float The unix time the token expires at, leeway included.
+    :raise JWTError: If any claim is not valid.
+    """
+    if 'exp' not in claims:
+        raise JWTError(MISSING_CLAIM, "The token has no exp claim.")
+    expires = _numeric_date(claims, 'exp') + leeway
+    if now >= expires:
+        raise JWTError(EXPIRED_TOKEN, f"The token expired at {claims['exp']}.")
+
+    if 'nbf' in claims and now + leeway < _numeric_date(claims, 'nbf'):
+        raise JWTError(IMMATURE_TOKEN, f"The token is not valid before {claims['nbf']}.")
+
+    if audience is not None:
+        received = claims.get('aud')
+        if received != audience and not (isinstance(received, list) and audience in received):
+            raise JWTError(INVALID_AUDIENCE, f"The token audience {received!r} is not {audience}.")
+
+    if issuer is not None and claims.get('iss') != issuer:
+        raise JWTError(INVALID_ISSUER, f"The token issuer {claims.get('iss')!r} is not {issuer}.")
+
+    return expires
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of the AuthResult of the already verified tokens, so a
+    token presented again is accepted without decoding it, looking up its key
+    or verifying its signature.
+
+    The entries are keyed by the SHA-256 digest of the token, the tokens are
+    not kept in memory, and expire with the token or after max_ttl seconds, so
+    a revoked key stops being accepted in bounded time.
+    """
+
+    def __init__(self, max_size: int = 4096, max_ttl: float = 300.0, clock: Callable[[], float] = time):
+        if max_size < 1 or max_ttl <= 0:
+            raise ValueError("Invalid token cache configuration, max size and max ttl must be positive.")
+
+        self.__max_size = max_size
+        self.__max_ttl = max_ttl
+        self.__clock = clock
+        self.__entries: OrderedDict[bytes, Tuple[float, AuthResult]] = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, token: str) -> Optional[AuthResult]:
+        """
+        Get the AuthResult of the given token if it was verified and has not
+        expired yet.
+
+        :param token: str The token.
+        :return: Optional[AuthResult] The AuthResult or None.
+        """
+        digest = _digest(token)
+        with self.__lock:
+            entry = self.__entries.get(digest)
+            if entry is None:
+                return None
+            if self.__clock() >= entry[0]:
+                del self.__entries[digest]
+                return None
+            self.__entries.move_to_end(digest)
+            return entry[1]
+
+    def put(self, token: str, expires: float, result: AuthResult):
+        """
+        Remember the AuthResult of the given verified token.
+
+        :param token: str The token.
+        :param expires: float The unix time the token expires at.
+        :param result: AuthResult The AuthResult of the token.
+        """
+        expires = min(expires, self.__clock() + self.__max_ttl)
+        digest = _digest(token)
+        with self.__lock:
+            self.__entries[digest] = (expires, result)
+            self.__entries.move_to_end(digest)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+
+def _digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+def _decode(segment: str, name: str) -> bytes:
+    try:
+        return urlsafe_b64decode(segment + '=' * (-len(segment) % 4))
+    except ValueError:
+        # binascii.Error on impossible lengths.
+        raise JWTError(MALFORMED_TOKEN, f"The token {name} is not valid base64url.")
+
+
+def _decode_object(segment: str, name: str) -> Dict[str, Any]:
+    raw = _decode(segment, name)
+    try:
+        decoded = json.loads(raw)
+    except ValueError:
+        # json.JSONDecodeError and UnicodeDecodeError.
+        decoded = None
+    if not isinstance(decoded, dict):
+        raise JWTError(MALFORMED_TOKEN, f"The token {name} is not a JSON object.")
+    return decoded
+
+
+def _numeric_date(claims: Dict[str, Any], name: str) -> float:
+    value = claims[name]
+    # bool is an int subclass, it is not a NumericDate. json also decodes NaN
+    # and Infinity, an exp of NaN would never expire as it never compares.
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or (
+            isinstance(value, float) and not isfinite(value)
+    ):
+        raise JWTError(INVALID_CLAIM, f"The {name} claim is not a NumericDate.")
+    return value
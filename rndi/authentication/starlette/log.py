@@ -0,0 +1,160 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from logging import addLevelName, LoggerAdapter
+from threading import Lock, Timer
+from time import monotonic
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# below DEBUG, the full request detail (headers, base strings, signatures...)
+# is only logged when a logger is explicitly set to this level.
+TRACE = 5
+
+addLevelName(TRACE, 'TRACE')
+
+REQUEST_AUTH_LOG_THROTTLE_INTERVAL = 'REQUEST_AUTH_LOG_THROTTLE_INTERVAL'
+
+_SUPPRESSED = ' (%d similar messages suppressed in the last %.0f seconds)'
+_REPEATED = ' (repeated %d times in the last %.0f seconds)'
+
+
+def provide_log_throttle_interval(config: dict, default: Optional[float] = None) -> Optional[float]:
+    """
+    Get the log throttle interval from the configuration.
+
+    :param config: dict The adapter configuration.
+    :param default: Optional[float] The interval in seconds if it is not configured.
+    :return: Optional[float] The interval in seconds or None if the throttling is disabled.
+    """
+    interval = float(config.get(REQUEST_AUTH_LOG_THROTTLE_INTERVAL, default) or 0)
+    return interval if interval > 0 else None
+
+
+def throttle(logger: LoggerAdapter, interval: Optional[float]) -> LoggerAdapter:
+    """
+    Wrap the given logger in a ThrottledLoggerAdapter, unless the interval is None.
+
+    :param logger: LoggerAdapter The logger to throttle.
+    :param interval: Optional[float] The interval in seconds.
+    :return: LoggerAdapter The throttled logger or the given one.
+    """
+    return logger if interval is None else ThrottledLoggerAdapter(logger, interval)
+
+
+class ThrottledLoggerAdapter(LoggerAdapter):
+    """
+    LoggerAdapter that logs the first occurrence of each message (level and
+    unformatted message) and then at most one message per interval, with the
+    count of the ones suppressed since the previous one.
+
+    The suppressed messages are never formatted. Their count is logged when
+    the interval elapses, even if no other message arrives, and the pending
+    counts can be logged at any time with flush.
+    """
+
+    def __init__(
+            self,
+            logger: LoggerAdapter,
+            interval: float = 60.0,
+            max_keys: int = 1024,
+            clock: Callable[[], float] = monotonic,
+            schedule: Optional[Callable[[float, Callable[[], None]], Any]] = None,
+    ):
+        super().__init__(logger, {})
+        self.__interval = interval
+        self.__max_keys = max_keys
+        self.__clock = clock
+        self.__schedule = _schedule if schedule is None else schedule
+
+        # (level, msg) -> [last emission, suppressed count, last args].
+        self.__entries: Dict[Tuple[int, str], List] = {}
+        self.__scheduled = False
+        self.__lock = Lock()
+
+    def process(self, msg, kwargs):
+        # the wrapped logger adds its own extra.
+        return msg, kwargs
+
+    def log(self, level, msg, *args, **kwargs):
+        if not self.isEnabledFor(level):
+            return
+
+        key = (level, msg)
+        now = self.__clock()
+        delay = None
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                if len(self.__entries) >= self.__max_keys:
+                    self.__entries.pop(next(iter(self.__entries)))
+                self.__entries[key] = [now, 0, args]
+                suppressed = 0
+            elif now - entry[0] < self.__interval:
+                entry[1] += 1
+                entry[2] = args
+                suppressed = None
+                if not self.__scheduled:
+                    # the count is reported at the end of the interval, even
+                    # if the burst is followed by silence.
+                    self.__scheduled = True
+                    delay = entry[0] + self.__interval - now
+            else:
+                suppressed = entry[1]
+                elapsed = now - entry[0]
+                entry[0], entry[1], entry[2] = now, 0, args
+
+        if suppressed is None:
+            if delay is not None:
+                self.__schedule(delay, self.__report_elapsed)
+            return
+
+        if suppressed:
+            self.logger.log(level, msg + _SUPPRESSED, *args, suppressed, elapsed, **kwargs)
+        else:
+            self.logger.log(level, msg, *args, **kwargs)
+
+    def flush(self):
+        """
+        Log the count of the suppressed messages pending to be reported.
+        """
+        self.__report(False)
+
+    def __report_elapsed(self):
+        self.__report(True)
+
+    def __report(self, elapsed_only: bool):
+        now = self.__clock()
+        delay = None
+
+        with self.__lock:
+            pending = [
+                (key, entry[1], now - entry[0], entry[2]) for key, entry in self.__entries.items()
+                if entry[1] and (not elapsed_only or now - entry[0] >= self.__interval)
+            ]
+            for key, _, _, _ in pending:
+                self.__entries[key][0:2] = [now, 0]
+
+            if elapsed_only:
+                # the timer may fire before the interval of the other keys.
+                remaining = [entry[0] + self.__interval - now for entry in self.__entries.values() if entry[1]]
+                self.__scheduled = bool(remaining)
+                if remaining:
+                    delay = max(0.0, min(remaining))
+
+        for (level, msg), suppressed, elapsed, args in pending:
+            self.logger.log(level, msg + _REPEATED, *args, suppressed, elapsed)
+
+        if delay is not None:
+            self.__schedule(delay, self.__report_elapsed)
+
+
+def _schedule(delay: float, callback: Callable[[], None]):
+    timer = Timer(delay, callback)
+    # a pending summary never keeps the process alive.
+    timer.daemon = True
+    timer.start()
@@ -0,0 +1,107 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import json
+from typing import Optional, Sequence, Union
+
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+from rndi.authentication.starlette.contract import AsyncRequestAuthenticator, RequestAuthenticator
+from rndi.authentication.starlette.oauth10a.body import BODY_SCOPE_KEY, DeferredRequest, replay_body
+
+
+class RequestAuthenticatorMiddleware:
+    """
+    Pure ASGI middleware that authenticates the incoming requests with the given
+    RequestAuthenticator (or AsyncRequestAuthenticator) before reaching the app.
+
+    Paths are matched by prefix on segment boundaries, "/api" matches "/api"
+    and "/api/items" but not "/apiary". A request is authenticated if its path
+    matches any of the include prefixes (all paths by default) and none of the
+    exclude prefixes. Rejected requests are answered directly
+    from the middleware with the status code and detail of the HTTPException.
+
+    The authenticators get an HTTPConnection of the scope, the http requests a
+    DeferredRequest whose Request is only built to read a signed body. A body
+    read by the authenticator is replayed to the app.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            authenticator: Union[RequestAuthenticator, AsyncRequestAuthenticator],
+            include: Optional[Sequence[str]] = None,
+            exclude: Optional[Sequence[str]] = None,
+            threadpool: bool = True,
+    ):
+        self.app = app
+        self.__authenticator = authenticator
+        self.__asynchronous = isinstance(authenticator, AsyncRequestAuthenticator)
+        self.__include = None if include is None else _Prefixes(include)
+        self.__exclude = _Prefixes(exclude or ())
+        self.__threadpool = threadpool
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] not in ('http', 'websocket') or not self.__protected(scope['path']):
+            await self.app(scope, receive, send)
+            return
+
+        connection = DeferredRequest(scope, receive) if scope['type'] == 'http' else HTTPConnection(scope)
+
+        try:
+            if self.__asynchronous:
+                await self.__authenticator.authenticate(connection)
+            elif self.__threadpool:
+                await run_in_threadpool(self.__authenticator.authenticate, connection)
+            else:
+                self.__authenticator.authenticate(connection)
+        except HTTPException as e:
+            await _reject(scope, send, e)
+            return
+
+        body = scope.get(BODY_SCOPE_KEY)
+        if body is not None:
+            receive = replay_body(body, receive)
+
+        await self.app(scope, receive, send)
+
+    def __protected(self, path: str) -> bool:
+        if self.__include is not None and not self.__include.match(path):
+            return False
+        return not self.__exclude.match(path)
+
+
+class _Prefixes:
+    """
+    Path prefixes matched on segment boundaries, as a set of exact paths and
+    a tuple of directory prefixes for a single str.startswith call.
+    """
+
+    def __init__(self, prefixes: Sequence[str]):
+        self.__paths = frozenset(prefix.rstrip('/') or '/' for prefix in prefixes)
+        self.__directories = tuple(prefix.rstrip('/') + '/' for prefix in prefixes)
+
+    def match(self, path: str) -> bool:
+        return path in self.__paths or path.startswith(self.__directories)
+
+
+async def _reject(scope: Scope, send: Send, exception: HTTPException):
+    if scope['type'] == 'websocket':
+        # closing before accepting the connection is answered with 403 by the server.
+        await send({'type': 'websocket.close', 'code': 1008})
+        return
+
+    body = json.dumps({'detail': exception.detail}).encode('utf-8')
+    headers = [
+        (b'content-type', b'application/json'),
+        (b'content-length', str(len(body)).encode('latin-1')),
+    ]
+    if exception.headers:
+        headers.extend((k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in exception.headers.items())
+
+    await send({'type': 'http.response.start', 'status': exception.status_code, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': body})
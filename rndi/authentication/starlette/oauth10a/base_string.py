@@ -0,0 +1,109 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import parse_qsl
+
+_UNRESERVED = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~'
+
+# https://tools.ietf.org/html/rfc5849#section-3.6, precomputed percent-encoding
+# of every UTF-8 byte, the unreserved characters are kept as they are.
+_ESCAPE_TABLE = [chr(b) if chr(b) in _UNRESERVED else f'%{b:02X}' for b in range(256)]
+
+_DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+
+def escape(value: str) -> str:
+    """
+    Percent-encode the given value as required by RFC 5849 section 3.6.
+
+    :param value: str The value to encode.
+    :return: str The encoded value.
+    """
+    # most of the values (keys, nonces, timestamps...) do not need encoding.
+    if not value.strip(_UNRESERVED):
+        return value
+    return ''.join([_ESCAPE_TABLE[b] for b in value.encode('utf-8')])
+
+
+def base_string_uri(scheme: str, host: str, path: str) -> str:
+    """
+    Compute the base string URI (RFC 5849 section 3.4.1.2) from the request
+    scheme, the Host header value (optionally with port) and the path. The
+    path is taken as sent by the client, percent-encoded, it is never decoded
+    nor encoded again.
+
+    :param scheme: str The request scheme.
+    :param host: str The host with optional port, separated by a colon.
+    :param path: str The percent-encoded request path without query string.
+    :return: str The base string URI.
+    """
+    scheme = scheme.lower()
+    host = host.lower()
+
+    # the port must be excluded when it is the default one for the scheme.
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port is not None and host.endswith(':' + default_port):
+        host = host[:-len(default_port) - 1]
+
+    if not path:
+        path = '/'
+
+    return f'{scheme}://{host}{path}'
+
+
+def query_parameters(query_string: str) -> List[Tuple[str, str]]:
+    """
+    Decode the query string into a list of name/value pairs as defined by
+    RFC 5849 section 3.4.1.3.1.
+
+    :param query_string: str The raw query string.
+    :return: List[Tuple[str, str]] The decoded name/value pairs.
+    """
+    if not query_string:
+        return []
+    return parse_qsl(query_string, keep_blank_values=True)
+
+
+def normalize_parameters(parameters: Iterable[Tuple[str, str]]) -> str:
+    """
+    Normalize the request parameters as defined by RFC 5849 section 3.4.1.3.2.
+
+    :param parameters: Iterable[Tuple[str, str]] The decoded name/value pairs.
+    :return: str The normalized request parameters.
+    """
+    encoded = [(escape(name), escape(value)) for name, value in parameters]
+    encoded.sort()
+    return '&'.join([f'{name}={value}' for name, value in encoded])
+
+
+def signature_base_string(
+        method: str,
+        uri: str,
+        query_string: str,
+        protocol_parameters: Dict[str, str],
+        body_parameters: Iterable[Tuple[str, str]] = (),
+) -> str:
+    """
+    Build the signature base string (RFC 5849 section 3.4.1.1) from the already
+    parsed Authorization header protocol parameters, the raw query string and
+    the decoded form body parameters.
+
+    :param method: str The HTTP request method.
+    :param uri: str The base string URI.
+    :param query_string: str The raw query string.
+    :param protocol_parameters: Dict[str, str] The decoded protocol parameters, without realm and oauth_signature.
+    :param body_parameters: Iterable[Tuple[str, str]] The decoded form encoded body parameters.
+    :return: str The signature base string.
+    """
+    parameters = query_parameters(query_string)
+    parameters.extend(protocol_parameters.items())
+    parameters.extend(body_parameters)
+
+    # the normalized parameters only contain unreserved characters, "%", "="
+    # and "&", so encoding them again only needs to replace those three.
+    normalized = normalize_parameters(parameters).replace('%', '%25').replace('=', '%3D').replace('&', '%26')
+
+    return f'{escape(method.upper())}&{escape(uri)}&{normalized}'
@@ -0,0 +1,239 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from anyio import from_thread
+from starlette.requests import ClientDisconnect, HTTPConnection, Request
+from starlette.types import Message, Receive, Scope
+from rndi.authentication.starlette.oauth10a.base_string import query_parameters
+from rndi.authentication.starlette.rejection import ReasonError
+
+FORM_CONTENT_TYPE = 'application/x-www-form-urlencoded'
+
+DEFAULT_MAX_BODY_SIZE = 1024 * 1024
+
+# the body read during the authentication is kept in the ASGI scope, so it can
+# be replayed to the application by the middleware.
+BODY_SCOPE_KEY = 'rndi.authentication.body'
+
+BODY_TOO_LARGE = 'body_too_large'
+UNREADABLE_BODY = 'unreadable_body'
+
+DETAILS = {
+    BODY_TOO_LARGE: 'the request body is too large',
+    UNREADABLE_BODY: 'unable to read the request body',
+}
+
+
+class OAuth10aBodyError(ReasonError):
+    DETAILS = DETAILS
+
+    def __init__(self, reason: str, message: str, status_code: int = 400):
+        super().__init__(reason, message, status_code)
+        self.status_code = status_code
+
+
+class FormParser:
+    """
+    Incremental application/x-www-form-urlencoded parser, each chunk is decoded
+    up to its last complete name/value pair as it is received. Only the new
+    chunk is searched for the separator and the incomplete pair is extended in
+    place, so a long pair streamed in small chunks is not copied on each chunk.
+    """
+
+    def __init__(self):
+        self.__pending = bytearray()
+        self.__parameters: List[Tuple[str, str]] = []
+
+    def feed(self, chunk: bytes):
+        separator = chunk.rfind(b'&')
+        if separator < 0:
+            self.__pending += chunk
+            return
+        self.__pending += chunk[:separator]
+        self.__parameters.extend(query_parameters(self.__pending.decode('latin-1')))
+        self.__pending = bytearray(chunk[separator + 1:])
+
+    def close(self) -> List[Tuple[str, str]]:
+        """
+        Decode the last pair and return all the decoded name/value pairs.
+
+        :return: List[Tuple[str, str]] The decoded name/value pairs.
+        """
+        self.__parameters.extend(query_parameters(self.__pending.decode('latin-1')))
+        self.__pending = bytearray()
+        return self.__parameters
+
+
+class DeferredRequest(HTTPConnection):
+    """
+    HTTPConnection the middleware authenticates the http requests with, built
+    from the ASGI scope alone. The Request to read the body from is only built
+    for the requests whose body is part of the signature.
+    """
+
+    def __init__(self, scope: Scope, receive: Receive):
+        super().__init__(scope)
+        self.__receive = receive
+        self.__request: Optional[Request] = None
+
+    @property
+    def request(self) -> Request:
+        if self.__request is None:
+            self.__request = Request(self.scope, self.__receive)
+        return self.__request
+
+
+def body_request(connection: HTTPConnection) -> Optional[Request]:
+    """
+    Get the Request to read the body of the given connection from.
+
+    :param connection: HTTPConnection The connection being authenticated.
+    :return: Optional[Request] The Request, None for the websocket connections.
+    """
+    if isinstance(connection, Request):
+        return connection
+    if isinstance(connection, DeferredRequest):
+        return connection.request
+    return None
+
+
+def is_form_content_type(content_type: Optional[str]) -> bool:
+    """
+    Tell if the given Content-Type header value is the form encoding, the only
+    one whose body parameters are signed (RFC 5849 section 3.4.1.3.1).
+
+    :param content_type: Optional[str] The Content-Type header value.
+    :return: bool True if the body is form encoded.
+    """
+    if not content_type:
+        return False
+    return content_type.split(';', 1)[0].strip().lower() == FORM_CONTENT_TYPE
+
+
+def parse_form(body: bytes) -> List[Tuple[str, str]]:
+    """
+    Decode an already read form encoded body.
+
+    :param body: bytes The request body.
+    :return: List[Tuple[str, str]] The decoded name/value pairs.
+    """
+    parser = FormParser()
+    parser.feed(body)
+    return parser.close()
+
+
+async def read_form(request: Request, max_size: int) -> List[Tuple[str, str]]:
+    """
+    Read and decode the form encoded body of the given request, rejecting it
+    as soon as it exceeds max_size bytes. The body is kept in the scope, so it
+    is not read twice and the middleware replays it to the application.
+
+    A body with Content-Length is read with Request.body(), so the application
+    can read it again from the same Request. A chunked body is decoded as it is
+    streamed, only the middleware can replay it.
+
+    :param request: Request The request.
+    :param max_size: int The maximum body size in bytes.
+    :return: List[Tuple[str, str]] The decoded name/value pairs.
+    """
+    cached = read_body(request)
+    if cached is not None:
+        return parse_form(cached)
+
+    content_length = request.headers.get('content-length', '')
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise OAuth10aBodyError(BODY_TOO_LARGE, f"Content-Length {content_length} exceeds {max_size}.", 413)
+
+    try:
+        if content_length.isdigit():
+            # the server never delivers more bytes than the declared length.
+            body = await request.body()
+            parameters = parse_form(body)
+        else:
+            body, parameters = await _stream_form(request, max_size)
+    except (ClientDisconnect, RuntimeError) as e:
+        # disconnected client, or the stream already consumed by someone else.
+        raise OAuth10aBodyError(UNREADABLE_BODY, f"Unable to read the body due to {e!r}.")
+
+    request.scope[BODY_SCOPE_KEY] = body
+    return parameters
+
+
+async def _stream_form(request: Request, max_size: int) -> Tuple[bytes, List[Tuple[str, str]]]:
+    parser = FormParser()
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_size:
+            raise OAuth10aBodyError(BODY_TOO_LARGE, f"Body exceeds {max_size} bytes.", 413)
+        parser.feed(chunk)
+        chunks.append(chunk)
+    return b''.join(chunks), parser.close()
+
+
+def read_body(request: Request) -> Optional[bytes]:
+    """
+    Return the body of the given request if it has already been read, by the
+    authentication (the scope) or by the application (Request.body()).
+
+    :param request: Request The request.
+    :return: Optional[bytes] The body, None if not read yet.
+    """
+    cached = request.scope.get(BODY_SCOPE_KEY)
+    if cached is None:
+        cached = getattr(request, '_body', None)
+    return cached
+
+
+def read_form_from_thread(request: Request, max_size: int) -> List[Tuple[str, str]]:
+    """
+    Synchronous version of read_form, the stream is read in the event loop
+    from the worker thread the synchronous authenticators run in. An already
+    read body is used in any thread, an unread one cannot be read from the
+    event loop thread and is rejected as unreadable.
+
+    :param request: Request The request.
+    :param max_size: int The maximum body size in bytes.
+    :return: List[Tuple[str, str]] The decoded name/value pairs.
+    """
+    cached = read_body(request)
+    if cached is not None:
+        return parse_form(cached)
+
+    try:
+        return from_thread.run(read_form, request, max_size)
+    except RuntimeError:
+        # blocking the event loop thread on the stream would deadlock.
+        raise OAuth10aBodyError(
+            UNREADABLE_BODY,
+            "The synchronous authenticators cannot read the form body from the event loop thread, use "
+            "provide_async_request_authenticator or run the synchronous authenticator in the threadpool.",
+        )
+
+
+def replay_body(body: bytes, receive: Receive) -> Receive:
+    """
+    Wrap the given receive callable to deliver the already read body again as
+    a single message, the following messages come from the original callable.
+
+    :param body: bytes The already read body.
+    :param receive: Receive The original receive callable.
+    :return: Receive The replaying receive callable.
+    """
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    return replay
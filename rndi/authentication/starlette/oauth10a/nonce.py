@@ -0,0 +1,104 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from threading import Lock
+from time import time
+from typing import Callable, Dict, Set, Tuple
+
+from rndi.authentication.starlette.contract import NonceStore
+
+
+class InMemoryNonceStore(NonceStore):
+    """
+    Process local NonceStore that keeps the nonces in sets grouped by time
+    buckets of bucket_size seconds. Only the timestamps inside now +/- skew
+    are accepted, so whole buckets expire at once instead of entry by entry.
+
+    The store is bounded to max_size nonces, when it is full the oldest bucket
+    is dropped and its timestamps are no longer accepted, so a dropped nonce
+    can never be replayed.
+
+    Each worker has its own store, multi-worker deployments must use a shared
+    NonceStore implementation.
+    """
+
+    def __init__(
+            self,
+            skew: int = 300,
+            bucket_size: int = 30,
+            max_size: int = 100000,
+            clock: Callable[[], float] = time,
+    ):
+        if skew < 1 or bucket_size < 1 or max_size < 1:
+            raise ValueError("Invalid nonce store configuration, skew, bucket size and max size must be positive.")
+
+        self.__skew = skew
+        self.__bucket_size = bucket_size
+        self.__max_size = max_size
+        self.__clock = clock
+
+        self.__buckets: Dict[int, Set[Tuple[str, int, str]]] = {}
+        self.__floor = 0
+        self.__size = 0
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def is_fresh(self, timestamp: int) -> bool:
+        return abs(self.__clock() - timestamp) <= self.__skew and timestamp // self.__bucket_size >= self.__floor
+
+    def remember(self, client_key: str, timestamp: int, nonce: str) -> bool:
+        now = self.__clock()
+        if abs(now - timestamp) > self.__skew:
+            return False
+
+        index = timestamp // self.__bucket_size
+        entry = (client_key, timestamp, nonce)
+
+        with self.__lock:
+            self.__expire(int(now - self.__skew) // self.__bucket_size)
+            if index < self.__floor:
+                return False
+
+            bucket = self.__buckets.get(index)
+            if bucket is not None and entry in bucket:
+                return False
+
+            if self.__size >= self.__max_size:
+                self.__drop(min(self.__buckets))
+                if index < self.__floor:
+                    return False
+                bucket = self.__buckets.get(index)
+
+            if bucket is None:
+                bucket = self.__buckets[index] = set()
+            bucket.add(entry)
+            self.__size += 1
+
+        return True
+
+    def __expire(self, floor: int):
+        if floor <= self.__floor:
+            return
+
+        # the buckets below the window are dropped as a whole, there are at
+        # most (2 * skew / bucket_size) + 2 live buckets.
+        if floor - self.__floor > len(self.__buckets):
+            expired = [index for index in self.__buckets if index < floor]
+        else:
+            expired = range(self.__floor, floor)
+
+        for index in expired:
+            bucket = self.__buckets.pop(index, None)
+            if bucket is not None:
+                self.__size -= len(bucket)
+        self.__floor = floor
+
+    def __drop(self, index: int):
+        self.__size -= len(self.__buckets.pop(index))
+        self.__floor = index + 1
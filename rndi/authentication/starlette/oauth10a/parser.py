@@ -0,0 +1,171 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+from urllib.parse import unquote
+
+MAX_HEADER_LENGTH = 4096
+
+_REQUIRED = ('oauth_consumer_key', 'oauth_signature_method', 'oauth_timestamp', 'oauth_nonce')
+
+HEADER_TOO_LONG = 'header_too_long'
+MALFORMED_HEADER = 'malformed_header'
+MISSING_PARAMETER = 'missing_parameter'
+
+
+class OAuth10aParseError(ValueError):
+    def __init__(self, message: str, reason: str = MALFORMED_HEADER):
+        super().__init__(message, reason)
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+
+class OAuth10aParameters:
+    """
+    The protocol parameters of an OAuth 1.0a Authorization header, the values
+    are already percent-decoded.
+
+    The parameters attribute holds every parameter that takes part of the
+    signature base string, that is, all but realm and oauth_signature.
+    """
+
+    __slots__ = (
+        'oauth_consumer_key',
+        'oauth_signature_method',
+        'oauth_timestamp',
+        'oauth_nonce',
+        'oauth_signature',
+        'oauth_version',
+        'oauth_token',
+        'realm',
+        'parameters',
+    )
+
+    def __init__(
+            self,
+            oauth_consumer_key: str,
+            oauth_signature_method: str,
+            oauth_timestamp: str,
+            oauth_nonce: str,
+            oauth_signature: str,
+            oauth_version: Optional[str] = None,
+            oauth_token: Optional[str] = None,
+            realm: Optional[str] = None,
+            parameters: Optional[Dict[str, str]] = None,
+    ):
+        self.oauth_consumer_key = oauth_consumer_key
+        self.oauth_signature_method = oauth_signature_method
+        self.oauth_timestamp = oauth_timestamp
+        self.oauth_nonce = oauth_nonce
+        self.oauth_signature = oauth_signature
+        self.oauth_version = oauth_version
+        self.oauth_token = oauth_token
+        self.realm = realm
+        self.parameters = {} if parameters is None else parameters
+
+    def __repr__(self) -> str:
+        return (
+            f'OAuth10aParameters(oauth_consumer_key={self.oauth_consumer_key!r}, '
+            f'oauth_signature_method={self.oauth_signature_method!r}, '
+            f'oauth_timestamp={self.oauth_timestamp!r}, '
+            f'oauth_nonce={self.oauth_nonce!r}, '
+            f'oauth_signature={self.oauth_signature!r}, '
+            f'oauth_version={self.oauth_version!r}, '
+            f'oauth_token={self.oauth_token!r}, '
+            f'realm={self.realm!r})'
+        )
+
+
+def parse_authorization_header(header: str, max_length: int = MAX_HEADER_LENGTH) -> OAuth10aParameters:
+    """
+    Parse the given OAuth 1.0a Authorization header (RFC 5849 section 3.5.1).
+
+    The parameter values are quoted-strings that cannot contain double quotes,
+    so splitting the header by double quotes gives the separators ('name=' with
+    the surrounding commas and whitespaces) and the values in a single pass.
+    The separators are validated all at once instead of one by one.
+
+    :param header: str The Authorization header value.
+    :param max_length: int The maximum allowed length of the header.
+    :return: OAuth10aParameters The parsed protocol parameters.
+    :raise OAuth10aParseError: If the header is too long, malformed or misses required parameters.
+    """
+    if len(header) > max_length:
+        raise OAuth10aParseError(
+            f'header exceeds the maximum length of {max_length} characters',
+            HEADER_TOO_LONG,
+        )
+
+    if not header.startswith('OAuth ') and header[:6].lower() != 'oauth ':
+        raise OAuth10aParseError('unsupported authorization scheme')
+
+    parts = header[6:].split('"')
+    count = len(parts) >> 1
+    if not len(parts) & 1 or parts[-1].strip(' \t,'):
+        raise OAuth10aParseError('unbalanced quotes or unquoted trailing data')
+
+    # a well-formed list of separators looks like 'name=",name=",name=' once
+    # the whitespaces are removed, so every "=" ends a name and every "," is
+    # the one between two parameters.
+    names = '"'.join(parts[0:-1:2]).replace(' ', '').replace('\t', '')
+    if (
+            not names.endswith('=')
+            or names.count('=') != count
+            or names.count(',') != count - 1
+            or names.count('=",') != count - 1
+    ):
+        raise OAuth10aParseError('malformed parameter list')
+
+    values = parts[1::2]
+    if '%' in header:
+        values = _unescape(values)
+
+    if '%' in names:
+        names = [unquote(name) for name in names[:-1].split('=",')]
+    else:
+        names = names[:-1].split('=",')
+
+    parameters = dict(zip(names, values))
+    if len(parameters) != count:
+        raise OAuth10aParseError('duplicated parameter')
+    if '' in parameters:
+        raise OAuth10aParseError('empty parameter name')
+
+    signature = parameters.pop('oauth_signature', None)
+    if signature is None:
+        raise OAuth10aParseError('missing required parameter oauth_signature', MISSING_PARAMETER)
+    for name in _REQUIRED:
+        if name not in parameters:
+            raise OAuth10aParseError(f'missing required parameter {name}', MISSING_PARAMETER)
+
+    version = parameters.get('oauth_version')
+    if version is not None and version != '1.0':
+        raise OAuth10aParseError(f'unsupported version {version}')
+
+    return OAuth10aParameters(
+        parameters['oauth_consumer_key'],
+        parameters['oauth_signature_method'],
+        parameters['oauth_timestamp'],
+        parameters['oauth_nonce'],
+        signature,
+        version,
+        parameters.get('oauth_token'),
+        parameters.pop('realm', None),
+        parameters,
+    )
+
+
+def _unescape(values: List[str]) -> List[str]:
+    # the base64 encoded signature only contains the "+", "/" and "=" escapes,
+    # those are decoded for all the values at once, any other escape falls
+    # back to the generic percent-decoding value by value.
+    decoded = '"'.join(values).replace('%2B', '+').replace('%2F', '/').replace('%3D', '=')
+    if '%' in decoded:
+        return [unquote(value) for value in values]
+    return decoded.split('"')
@@ -0,0 +1,155 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from rndi.authentication.starlette.contract import NonceStore
+from rndi.authentication.starlette.oauth10a.parser import (
+    HEADER_TOO_LONG,
+    MALFORMED_HEADER,
+    MAX_HEADER_LENGTH,
+    MISSING_PARAMETER,
+    OAuth10aParameters,
+    OAuth10aParseError,
+    parse_authorization_header,
+)
+from rndi.authentication.starlette.oauth10a.signature import HMAC_SHA1, HMAC_SHA256, HMAC_SHA512
+from rndi.authentication.starlette.rejection import ReasonError
+
+MISSING_HEADER = 'missing_header'
+INVALID_SIGNATURE_ENCODING = 'invalid_signature_encoding'
+UNSUPPORTED_SIGNATURE_METHOD = 'unsupported_signature_method'
+INVALID_TIMESTAMP = 'invalid_timestamp'
+
+# the user facing detail of each rejection reason, the parsing failures share
+# the same detail to not give hints about the expected format.
+DETAILS = {
+    MISSING_HEADER: 'missing oauth 1.0a signature',
+    HEADER_TOO_LONG: 'malformed oauth 1.0a signature',
+    MALFORMED_HEADER: 'malformed oauth 1.0a signature',
+    MISSING_PARAMETER: 'malformed oauth 1.0a signature',
+    INVALID_SIGNATURE_ENCODING: 'the provided signature is not valid',
+    UNSUPPORTED_SIGNATURE_METHOD: 'unsupported signature method',
+    INVALID_TIMESTAMP: 'invalid or expired timestamp',
+}
+
+# base64 length of the HMAC digests, the RSA signatures depend on the key size
+# so only the upper bound (8192 bits keys) is checked.
+_SIGNATURE_LENGTHS = {HMAC_SHA1: 28, HMAC_SHA256: 44, HMAC_SHA512: 88}
+_MAX_SIGNATURE_LENGTH = 1368
+_BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+PreCheck = Callable[[OAuth10aParameters], bool]
+
+
+class OAuth10aPreValidationError(ReasonError):
+    DETAILS = DETAILS
+
+
+class OAuth10aPreValidator:
+    """
+    Ordered chain of cheap checks done on the Authorization header before the
+    credentials lookup and the signature verification, so the invalid traffic
+    is shed at the lowest possible cost. The header length and the required
+    parameters are checked while parsing, then each (reason, check) pair runs
+    in order until one of them fails.
+
+    Every rejection is counted by reason.
+    """
+
+    def __init__(self, checks: Sequence[Tuple[str, PreCheck]] = (), max_header_length: int = MAX_HEADER_LENGTH):
+        self.__checks = tuple(checks)
+        self.__max_header_length = max_header_length
+        self.__rejections: Dict[str, int] = {}
+        self.__lock = Lock()
+
+    @property
+    def rejections(self) -> Dict[str, int]:
+        with self.__lock:
+            return dict(self.__rejections)
+
+    def validate(self, header: Optional[str]) -> OAuth10aParameters:
+        """
+        Parse and pre-validate the given Authorization header.
+
+        :param header: Optional[str] The Authorization header value.
+        :return: OAuth10aParameters The parsed protocol parameters.
+        :raise OAuth10aPreValidationError: If any of the checks fails.
+        """
+        if header is None:
+            raise self.__reject(MISSING_HEADER, 'missing authorization header')
+
+        try:
+            authorization = parse_authorization_header(header, self.__max_header_length)
+        except OAuth10aParseError as e:
+            raise self.__reject(e.reason, str(e))
+
+        for reason, check in self.__checks:
+            if not check(authorization):
+                raise self.__reject(reason, f'{reason} check failed')
+
+        return authorization
+
+    def __reject(self, reason: str, message: str) -> OAuth10aPreValidationError:
+        with self.__lock:
+            self.__rejections[reason] = self.__rejections.get(reason, 0) + 1
+        return OAuth10aPreValidationError(reason, message)
+
+
+def check_signature_encoding(authorization: OAuth10aParameters) -> bool:
+    """
+    Check the length and the base64 alphabet of the signature without decoding it.
+    """
+    signature = authorization.oauth_signature
+    length = len(signature)
+
+    expected = _SIGNATURE_LENGTHS.get(authorization.oauth_signature_method)
+    if expected is not None and length != expected:
+        return False
+    if length == 0 or length & 3 or length > _MAX_SIGNATURE_LENGTH:
+        return False
+
+    unpadded = signature.rstrip('=')
+    return length - len(unpadded) <= 2 and not unpadded.strip(_BASE64)
+
+
+def make_signature_method_check(methods: Iterable[str]) -> PreCheck:
+    supported = frozenset(methods)
+
+    def check_signature_method(authorization: OAuth10aParameters) -> bool:
+        return authorization.oauth_signature_method in supported
+
+    return check_signature_method
+
+
+def make_timestamp_check(nonce_store: NonceStore) -> PreCheck:
+    def check_timestamp(authorization: OAuth10aParameters) -> bool:
+        timestamp = authorization.oauth_timestamp
+        return timestamp.isascii() and timestamp.isdigit() and nonce_store.is_fresh(int(timestamp))
+
+    return check_timestamp
+
+
+def provide_pre_checks(
+        methods: Iterable[str],
+        nonce_store: Optional[NonceStore] = None,
+) -> List[Tuple[str, PreCheck]]:
+    """
+    Build the default ordered pre-checks.
+
+    :param methods: Iterable[str] The supported signature methods.
+    :param nonce_store: Optional[NonceStore] The nonce store, the timestamp window is only checked if present.
+    :return: List[Tuple[str, PreCheck]] The (reason, check) pairs.
+    """
+    checks: List[Tuple[str, PreCheck]] = [
+        (UNSUPPORTED_SIGNATURE_METHOD, make_signature_method_check(methods)),
+        (INVALID_SIGNATURE_ENCODING, check_signature_encoding),
+    ]
+    if nonce_store is not None:
+        checks.append((INVALID_TIMESTAMP, make_timestamp_check(nonce_store)))
+    return checks
@@ -0,0 +1,70 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from typing import Hashable, Optional
+
+from cryptography import x509
+from cryptography.exceptions import InvalidSignature, UnsupportedAlgorithm
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from rndi.authentication.starlette.oauth10a.signature import Credential, SignatureVerifier
+
+_HASHES = {
+    'SHA1': hashes.SHA1,
+    'SHA256': hashes.SHA256,
+    'SHA384': hashes.SHA384,
+    'SHA512': hashes.SHA512,
+}
+
+
+def load_rsa_public_key(pem: str) -> RSAPublicKey:
+    """
+    Load the RSA public key from the given PEM public key or X.509 certificate.
+
+    :param pem: str The PEM encoded public key or certificate.
+    :return: RSAPublicKey The parsed public key.
+    :raise ValueError: If the PEM cannot be parsed or it is not an RSA key.
+    """
+    try:
+        if 'BEGIN CERTIFICATE' in pem:
+            key = x509.load_pem_x509_certificate(pem.encode('utf-8')).public_key()
+        else:
+            key = load_pem_public_key(pem.encode('utf-8'))
+    except UnsupportedAlgorithm as e:
+        raise ValueError(str(e))
+
+    if not isinstance(key, RSAPublicKey):
+        raise ValueError('the key is not an RSA public key')
+    return key
+
+
+class RsaSignatureVerifier(SignatureVerifier):
+    """
+    Verify RSASSA-PKCS1-v1_5 signatures (RFC 5849 section 3.4.3) with the
+    rsa_key (PEM public key or certificate) of the credential. Parsing the PEM
+    is far more expensive than the verification itself, so the parsed public
+    keys are kept per consumer key.
+    """
+
+    def __init__(self, algorithm: str = 'SHA1', max_size: int = 1024):
+        super().__init__(max_size)
+        self.__algorithm = _HASHES[algorithm]()
+
+    def _material(self, credential: Credential) -> Optional[Hashable]:
+        return credential.rsa_key
+
+    def _prepare(self, material: str) -> RSAPublicKey:
+        return load_rsa_public_key(material)
+
+    def _verify(self, prepared: RSAPublicKey, message: bytes, signature: bytes) -> bool:
+        try:
+            prepared.verify(signature, message, padding.PKCS1v15(), self.__algorithm)
+        except InvalidSignature:
+            return False
+        return True
@@ -0,0 +1,216 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import hashlib
+import hmac
+from abc import ABC, abstractmethod
+from base64 import b64decode
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from rndi.authentication.starlette.oauth10a.base_string import escape
+
+HMAC_SHA1 = 'HMAC-SHA1'
+HMAC_SHA256 = 'HMAC-SHA256'
+HMAC_SHA512 = 'HMAC-SHA512'
+RSA_SHA1 = 'RSA-SHA1'
+RSA_SHA256 = 'RSA-SHA256'
+
+
+@dataclass
+class Credential:
+    client_key: str
+    client_secret: Optional[str] = None
+    resource_owner_secret: Optional[str] = None
+    rsa_key: Optional[str] = None
+
+
+def decode_signature(signature: str) -> Optional[bytes]:
+    """
+    Decode the given base64 oauth_signature into the raw digest.
+
+    :param signature: str The base64 encoded signature.
+    :return: Optional[bytes] The raw digest or None if the signature is not valid base64.
+    """
+    try:
+        return b64decode(signature, validate=True)
+    except ValueError:
+        # binascii.Error and non-ASCII characters.
+        return None
+
+
+class SignatureVerifier(ABC):
+    """
+    Verify the signatures of one signature method keeping a prepared state
+    (hmac object, parsed public key...) per consumer key, so the expensive
+    preparation is done once per credential instead of once per request.
+
+    The prepared state is rebuilt if the key material of the consumer key
+    changes, and at most max_size consumer keys are kept.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.__max_size = max_size
+        self.__prepared: Dict[str, Tuple[Hashable, Any]] = {}
+        self.__lock = Lock()
+
+    def verify(self, credential: Credential, base_string: str, signature: str) -> bool:
+        """
+        Verify the given base64 encoded signature.
+
+        :param credential: Credential The client credentials.
+        :param base_string: str The signature base string.
+        :param signature: str The received base64 encoded oauth_signature.
+        :return: bool True if the signature is valid, False otherwise.
+        """
+        received = decode_signature(signature)
+        if received is None:
+            return False
+        return self.verify_digest(credential, base_string.encode('utf-8'), received)
+
+    def verify_digest(self, credential: Credential, message: bytes, signature: bytes) -> bool:
+        """
+        Verify the given raw signature of the message, for the signatures that
+        are not base64 encoded (JWS).
+
+        :param credential: Credential The client credentials.
+        :param message: bytes The signed message.
+        :param signature: bytes The raw received signature.
+        :return: bool True if the signature is valid, False otherwise.
+        """
+        material = self._material(credential)
+        if material is None:
+            return False
+
+        prepared = self.__prepared.get(credential.client_key)
+        if prepared is None or prepared[0] != material:
+            try:
+                prepared = self.__prepare(credential.client_key, material)
+            except ValueError:
+                # unusable key material.
+                return False
+
+        return self._verify(prepared[1], message, signature)
+
+    def invalidate(self, client_key: Optional[str] = None):
+        """
+        Drop the prepared state of the given consumer key, or all of them.
+
+        :param client_key: Optional[str] The consumer key.
+        """
+        with self.__lock:
+            if client_key is None:
+                self.__prepared.clear()
+            else:
+                self.__prepared.pop(client_key, None)
+
+    def __getstate__(self) -> dict:
+        # the prepared state and the lock cannot be pickled, a verifier sent to
+        # another process prepares its own state.
+        state = self.__dict__.copy()
+        state['_SignatureVerifier__prepared'] = {}
+        del state['_SignatureVerifier__lock']
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    def __prepare(self, client_key: str, material: Hashable) -> Tuple[Hashable, Any]:
+        prepared = (material, self._prepare(material))
+
+        with self.__lock:
+            if client_key not in self.__prepared and len(self.__prepared) >= self.__max_size:
+                # evict the oldest prepared state.
+                self.__prepared.pop(next(iter(self.__prepared)), None)
+            self.__prepared[client_key] = prepared
+
+        return prepared
+
+    @abstractmethod
+    def _material(self, credential: Credential) -> Optional[Hashable]:
+        """
+        Extract the key material of the given credential.
+
+        :param credential: Credential The client credentials.
+        :return: Optional[Hashable] The key material or None if the credential cannot use this method.
+        """
+
+    @abstractmethod
+    def _prepare(self, material: Hashable) -> Any:
+        """
+        Build the reusable state from the key material.
+
+        :param material: Hashable The key material.
+        :return: Any The prepared state.
+        :raise ValueError: If the key material cannot be used.
+        """
+
+    @abstractmethod
+    def _verify(self, prepared: Any, message: bytes, signature: bytes) -> bool:
+        """
+        Verify the raw signature of the message with the prepared state.
+
+        :param prepared: Any The prepared state.
+        :param message: bytes The UTF-8 encoded signature base string.
+        :param signature: bytes The raw received signature.
+        :return: bool True if the signature is valid, False otherwise.
+        """
+
+
+class HmacSignatureVerifier(SignatureVerifier):
+    """
+    Verify HMAC signatures (RFC 5849 section 3.4.2), the prepared hmac object
+    is copied for each request, so the key derivation and the inner/outer pads
+    are computed once per credential. The raw digests are compared in constant
+    time.
+    """
+
+    def __init__(self, digestmod: Callable = hashlib.sha1, max_size: int = 1024):
+        super().__init__(max_size)
+        self.__digestmod = digestmod
+
+    def _material(self, credential: Credential) -> Optional[Hashable]:
+        if credential.client_secret is None:
+            return None
+        # the token secret is empty when the request is not bound to a token.
+        return credential.client_secret, credential.resource_owner_secret or ''
+
+    def _prepare(self, material: Tuple[str, str]) -> hmac.HMAC:
+        key = f'{escape(material[0])}&{escape(material[1])}'
+        return hmac.new(key.encode('utf-8'), digestmod=self.__digestmod)
+
+    def _verify(self, prepared: hmac.HMAC, message: bytes, signature: bytes) -> bool:
+        generated = prepared.copy()
+        generated.update(message)
+        return hmac.compare_digest(generated.digest(), signature)
+
+
+def provide_signature_verifiers(max_size: int = 1024) -> Dict[str, SignatureVerifier]:
+    """
+    Build the default signature method table. The RSA methods are only
+    available if the optional cryptography package is installed.
+
+    :param max_size: int The maximum number of consumer keys prepared per method.
+    :return: Dict[str, SignatureVerifier] The verifiers by oauth_signature_method.
+    """
+    verifiers: Dict[str, SignatureVerifier] = {
+        HMAC_SHA1: HmacSignatureVerifier(hashlib.sha1, max_size),
+        HMAC_SHA256: HmacSignatureVerifier(hashlib.sha256, max_size),
+        HMAC_SHA512: HmacSignatureVerifier(hashlib.sha512, max_size),
+    }
+
+    try:
+        from rndi.authentication.starlette.oauth10a.rsa import RsaSignatureVerifier
+    except ImportError:  # pragma: no cover
+        return verifiers
+
+    verifiers[RSA_SHA1] = RsaSignatureVerifier('SHA1', max_size)
+    verifiers[RSA_SHA256] = RsaSignatureVerifier('SHA256', max_size)
+
+    return verifiers
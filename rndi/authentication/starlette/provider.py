@@ -3,58 +3,194 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
+from collections import ChainMap
+from functools import partial
+from inspect import signature
 from logging import LoggerAdapter
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple, Union
 
-from rndi.authentication.starlette.adapters.unauthorized import (
-    provide_unauthorized_request_authenticator,
-    UnauthorizedRequestAuthenticatorAdapter,
-)
-from rndi.authentication.starlette.adapters.oauth10a import (
-    OAuth10aRequestAuthenticatorAdapter,
-    provide_oauth10a_request_authenticator_adapter,
-)
 from rndi.authentication.starlette.contract import (
+    AsyncCredentialsRepository,
+    AsyncRequestAuthenticator,
+    AsyncRequestAuthenticatorDriverProvider,
+    AuthenticationObserver,
     CredentialsRepository,
     RequestAuthenticator,
     RequestAuthenticatorDriverProvider,
 )
+from rndi.authentication.starlette.registry import (
+    async_registry,
+    authenticator_cache,
+    DriverRegistry,
+    fingerprint,
+    sync_registry,
+    UNAUTHORIZED,
+)
+from rndi.authentication.starlette.repositories.bridges import (
+    AsyncToSyncCredentialsRepository,
+    SyncToAsyncCredentialsRepository,
+)
 
 REQUEST_AUTH_DRIVER = 'REQUEST_AUTH_DRIVER'
 
+# seconds the fallback of a failed build is reused before building the
+# requested driver again, so a misconfiguration is not logged on every call.
+FAILURE_RETRY_INTERVAL = 60.0
+
 
 def provide_request_authenticator(
         config: dict,
         logger: LoggerAdapter,
-        credentials_repository: CredentialsRepository,
+        credentials_repository: Union[CredentialsRepository, AsyncCredentialsRepository],
         drivers: Optional[Dict[str, RequestAuthenticatorDriverProvider]] = None,
-        default: str = UnauthorizedRequestAuthenticatorAdapter.DRIVER,
+        default: str = UNAUTHORIZED,
+        observer: Optional[AuthenticationObserver] = None,
+        cache: bool = False,
 ) -> RequestAuthenticator:
-    supported: Dict[str, RequestAuthenticatorDriverProvider] = {
-        OAuth10aRequestAuthenticatorAdapter.DRIVER: provide_oauth10a_request_authenticator_adapter,
-        UnauthorizedRequestAuthenticatorAdapter.DRIVER: provide_unauthorized_request_authenticator,
-    }
+    references = (logger, credentials_repository, observer, drivers)
+    if isinstance(credentials_repository, AsyncCredentialsRepository):
+        credentials_repository = AsyncToSyncCredentialsRepository(credentials_repository)
+
+    return _provide(
+        sync_registry,
+        config,
+        logger,
+        credentials_repository,
+        drivers,
+        default,
+        observer,
+        references if cache else None,
+    )
+
+
+def provide_async_request_authenticator(
+        config: dict,
+        logger: LoggerAdapter,
+        credentials_repository: Union[AsyncCredentialsRepository, CredentialsRepository],
+        drivers: Optional[Dict[str, AsyncRequestAuthenticatorDriverProvider]] = None,
+        default: str = UNAUTHORIZED,
+        observer: Optional[AuthenticationObserver] = None,
+        cache: bool = False,
+) -> AsyncRequestAuthenticator:
+    references = (logger, credentials_repository, observer, drivers)
+    if not isinstance(credentials_repository, AsyncCredentialsRepository):
+        credentials_repository = SyncToAsyncCredentialsRepository(credentials_repository)
+
+    return _provide(
+        async_registry,
+        config,
+        logger,
+        credentials_repository,
+        drivers,
+        default,
+        observer,
+        references if cache else None,
+    )
 
-    if isinstance(drivers, dict):
-        supported.update(drivers)
 
+def _provide(
+        registry: DriverRegistry,
+        config: dict,
+        logger: LoggerAdapter,
+        credentials_repository: Union[CredentialsRepository, AsyncCredentialsRepository],
+        drivers: Optional[Dict[str, Callable]],
+        default: str,
+        observer: Optional[AuthenticationObserver],
+        references: Optional[Tuple[Any, ...]],
+):
     driver = config.get(REQUEST_AUTH_DRIVER, default)
 
-    def _unsupported_driver(_, __, ___) -> RequestAuthenticator:
+    # with the cache opted in, the authenticators are built once per driver,
+    # configuration and objects they are built with, the failures are retried
+    # after an interval.
+    key = None
+    if references is not None:
+        references = (registry, *references)
+        key = (
+            driver,
+            fingerprint(config),
+            tuple(id(reference) for reference in references),
+            tuple((name, id(provider)) for name, provider in (drivers or {}).items()),
+        )
+        adapter = authenticator_cache.get(key, references)
+        if adapter is not None:
+            return adapter
+
+    # the given drivers take precedence over the registered ones, only the
+    # requested drivers are resolved (and imported).
+    supported = ChainMap(drivers if isinstance(drivers, dict) else {}, registry)
+
+    def _unsupported_driver(_, __, ___):
         raise ValueError(f"Unsupported request authenticator driver {driver}.")
 
-    # get the provider for the requested driver, if the driver is not supported
-    # use the '_unsupported_driver' provider, this will raise an Exception.
-    provider = supported.get(driver, _unsupported_driver)
+    # the drivers bound to the configuration, for the drivers composed of
+    # other drivers.
+    bound = _BoundDrivers(supported, partial(
+        _build,
+        config=config,
+        logger=logger,
+        credentials_repository=credentials_repository,
+        observer=observer,
+    ))
 
     try:
-        adapter = provider(config, logger, credentials_repository)
+        # get the provider for the requested driver, if the driver is not supported
+        # use the '_unsupported_driver' provider, this will raise an Exception.
+        provider = supported[driver] if driver in supported else _unsupported_driver
+        adapter = _build(provider, config, logger, credentials_repository, observer, bound)
         logger.debug(f"Request authentication service configured with {driver} driver.")
     except Exception as e:
-        adapter = provide_unauthorized_request_authenticator(config, logger, credentials_repository)
+        adapter = _build(registry[UNAUTHORIZED], config, logger, credentials_repository, observer, bound)
         logger.error(
             f"Request authentication failure, unable to use driver {driver} due to: {e}, using "
             f"'unauthorized' driver, all request will been responded with 401 Unauthorized",
         )
+        if key is not None:
+            authenticator_cache.put(key, references, adapter, FAILURE_RETRY_INTERVAL)
+        return adapter
 
+    if key is not None:
+        authenticator_cache.put(key, references, adapter)
     return adapter
+
+
+class _BoundDrivers(Mapping[str, Callable[[], Any]]):
+    """
+    The drivers bound to the configuration of the composed driver, resolved
+    by name only when requested.
+    """
+
+    def __init__(self, supported: Mapping[str, Callable], build: Callable):
+        self.__supported = supported
+        self.__build = build
+
+    def __getitem__(self, name: str) -> Callable[[], Any]:
+        return partial(self.__build, self.__supported[name], drivers=self)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.__supported
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__supported)
+
+    def __len__(self) -> int:
+        return len(self.__supported)
+
+
+def _build(
+        provider: Callable,
+        config: dict,
+        logger: LoggerAdapter,
+        credentials_repository: Union[CredentialsRepository, AsyncCredentialsRepository],
+        observer: Optional[AuthenticationObserver],
+        drivers: Mapping[str, Callable],
+):
+    # the observer and the bound drivers are only given to the driver
+    # providers that accept them, so the existing custom drivers keep working.
+    parameters = signature(provider).parameters
+    options = {}
+    if observer is not None and 'observer' in parameters:
+        options['observer'] = observer
+    if 'drivers' in parameters:
+        options['drivers'] = drivers
+    return provider(config, logger, credentials_repository, **options)
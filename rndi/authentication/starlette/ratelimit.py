@@ -0,0 +1,98 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, List, Optional
+
+from rndi.authentication.starlette.contract import RateLimiter
+
+REQUEST_AUTH_RATE_LIMIT = 'REQUEST_AUTH_RATE_LIMIT'
+REQUEST_AUTH_RATE_LIMIT_BURST = 'REQUEST_AUTH_RATE_LIMIT_BURST'
+REQUEST_AUTH_RATE_LIMIT_MAX_KEYS = 'REQUEST_AUTH_RATE_LIMIT_MAX_KEYS'
+
+
+def provide_rate_limiter(config: dict) -> Optional[RateLimiter]:
+    """
+    Build the token bucket rate limiter if the rate is configured, the rate
+    limiting is disabled otherwise.
+
+    :param config: dict The adapter configuration.
+    :return: Optional[RateLimiter] The rate limiter or None.
+    """
+    rate = float(config.get(REQUEST_AUTH_RATE_LIMIT) or 0)
+    if rate <= 0:
+        return None
+
+    return TokenBucketRateLimiter(
+        rate=rate,
+        burst=int(config.get(REQUEST_AUTH_RATE_LIMIT_BURST) or max(1, int(rate))),
+        max_size=int(config.get(REQUEST_AUTH_RATE_LIMIT_MAX_KEYS) or 10000),
+    )
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """
+    Token bucket per key, refilled at rate tokens per second up to burst
+    tokens. The buckets are kept from the least to the most recently used,
+    so the idle ones (already refilled, same as a new bucket) are dropped from
+    the front, and the table never holds more than max_size keys.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: int,
+            max_size: int = 10000,
+            clock: Callable[[], float] = monotonic,
+    ):
+        if rate <= 0 or burst < 1 or max_size < 1:
+            raise ValueError("Invalid rate limiter configuration, rate, burst and max size must be positive.")
+
+        self.__rate = rate
+        self.__burst = float(burst)
+        self.__max_size = max_size
+        self.__clock = clock
+        # a bucket idle for this long is full again.
+        self.__idle = burst / rate
+
+        # key -> [tokens, last update].
+        self.__buckets: OrderedDict[str, List[float]] = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    def acquire(self, key: str) -> float:
+        now = self.__clock()
+
+        with self.__lock:
+            bucket = self.__buckets.get(key)
+            if bucket is None:
+                self.__evict(now)
+                bucket = self.__buckets[key] = [self.__burst, now]
+            else:
+                self.__buckets.move_to_end(key)
+                bucket[0] = min(self.__burst, bucket[0] + (now - bucket[1]) * self.__rate)
+                bucket[1] = now
+
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+
+            return (1.0 - bucket[0]) / self.__rate
+
+    def __evict(self, now: float):
+        buckets = self.__buckets
+        while buckets:
+            _, bucket = next(iter(buckets.items()))
+            if now - bucket[1] < self.__idle and len(buckets) < self.__max_size:
+                break
+            # either idle (full again) or the least recently used one when the
+            # table is full.
+            buckets.popitem(last=False)
@@ -0,0 +1,195 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from collections import OrderedDict
+from importlib import import_module
+from threading import RLock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Mapping, Optional, Tuple, Union
+
+OAUTH10A = 'oauth10a'
+UNAUTHORIZED = 'unauthorized'
+COMPOSITE = 'composite'
+JWT = 'jwt'
+
+# the entry point groups the third-party drivers are discovered from, for
+# example in a pyproject.toml:
+#   [tool.poetry.plugins."rndi.authentication.drivers"]
+#   saml = "my_package.saml:provide_saml_request_authenticator"
+ENTRY_POINT_GROUP = 'rndi.authentication.drivers'
+ASYNC_ENTRY_POINT_GROUP = 'rndi.authentication.async_drivers'
+
+_ADAPTERS = 'rndi.authentication.starlette.adapters'
+
+# the built-in drivers as "module:attribute" references, the module of each
+# driver is only imported the first time the driver is used.
+BUILTIN_DRIVERS = {
+    OAUTH10A: f'{_ADAPTERS}.oauth10a:provide_oauth10a_request_authenticator_adapter',
+    UNAUTHORIZED: f'{_ADAPTERS}.unauthorized:provide_unauthorized_request_authenticator',
+    COMPOSITE: f'{_ADAPTERS}.composite:provide_composite_request_authenticator',
+    JWT: f'{_ADAPTERS}.jwt:provide_jwt_request_authenticator_adapter',
+}
+
+BUILTIN_ASYNC_DRIVERS = {
+    OAUTH10A: f'{_ADAPTERS}.oauth10a:provide_async_oauth10a_request_authenticator_adapter',
+    UNAUTHORIZED: f'{_ADAPTERS}.unauthorized:provide_async_unauthorized_request_authenticator',
+    COMPOSITE: f'{_ADAPTERS}.composite:provide_async_composite_request_authenticator',
+    JWT: f'{_ADAPTERS}.jwt:provide_async_jwt_request_authenticator_adapter',
+}
+
+
+class DriverRegistry(Mapping[str, Callable]):
+    """
+    Read-only mapping of driver names to driver providers, resolved lazily by
+    name: the providers given as "module:attribute" references are imported
+    on first use, and the unknown names are looked up once in the installed
+    entry points of the given group, so third-party drivers are available by
+    just installing their package.
+    """
+
+    def __init__(self, drivers: Mapping[str, Union[str, Callable]], group: Optional[str] = None):
+        self.__references: Dict[str, Union[str, Callable]] = dict(drivers)
+        self.__providers: Dict[str, Callable] = {}
+        self.__group = group
+        self.__discovered = group is None
+        self.__lock = RLock()
+
+    def register(self, name: str, provider: Union[str, Callable]):
+        """
+        Register a driver provider, or a "module:attribute" reference to it.
+
+        :param name: str The driver name.
+        :param provider: Union[str, Callable] The driver provider or its reference.
+        """
+        with self.__lock:
+            self.__providers.pop(name, None)
+            self.__references[name] = provider
+
+    def loaded(self) -> Iterable[str]:
+        """
+        The names of the drivers already resolved, mostly useful to check that
+        the unused drivers are never imported.
+
+        :return: Iterable[str] The resolved driver names.
+        """
+        return list(self.__providers)
+
+    def __getitem__(self, name: str) -> Callable:
+        provider = self.__providers.get(name)
+        if provider is not None:
+            return provider
+
+        with self.__lock:
+            if name not in self.__references:
+                self.__discover()
+            reference = self.__references[name]
+            provider = _load(reference) if isinstance(reference, str) else reference
+            self.__providers[name] = provider
+        return provider
+
+    def __contains__(self, name: object) -> bool:
+        if name in self.__references:
+            return True
+        with self.__lock:
+            self.__discover()
+        return name in self.__references
+
+    def __iter__(self) -> Iterator[str]:
+        with self.__lock:
+            self.__discover()
+            return iter(list(self.__references))
+
+    def __len__(self) -> int:
+        with self.__lock:
+            self.__discover()
+            return len(self.__references)
+
+    def __discover(self):
+        if self.__discovered:
+            return
+        self.__discovered = True
+        for entry_point in _entry_points(self.__group):
+            # the explicitly registered drivers take precedence.
+            self.__references.setdefault(entry_point.name, entry_point.value)
+
+
+class AuthenticatorCache:
+    """
+    Bounded LRU cache of the authenticators built by the providers, keyed by
+    driver and configuration fingerprint. The objects the authenticators are
+    built with (logger, credentials repository...) are part of the key by
+    identity and kept alive by the cache, so their ids cannot be reused. The
+    entries put with a ttl (the fallbacks of the failed builds) expire, so
+    the build is retried.
+    """
+
+    def __init__(self, max_size: int = 64, clock: Callable[[], float] = monotonic):
+        self.__max_size = max_size
+        self.__clock = clock
+        self.__entries: OrderedDict[Hashable, Tuple[Tuple[Any, ...], Any, Optional[float]]] = OrderedDict()
+        self.__lock = RLock()
+
+    def get(self, key: Hashable, references: Tuple[Any, ...]) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or any(a is not b for a, b in zip(entry[0], references)):
+                return None
+            if entry[2] is not None and self.__clock() >= entry[2]:
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, references: Tuple[Any, ...], authenticator: Any, ttl: Optional[float] = None):
+        expires = None if ttl is None else self.__clock() + ttl
+        with self.__lock:
+            self.__entries[key] = (references, authenticator, expires)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+def fingerprint(config: Mapping[str, Any]) -> Hashable:
+    """
+    Compute a hashable fingerprint of the given configuration.
+
+    :param config: Mapping[str, Any] The configuration.
+    :return: Hashable The fingerprint, equal for equal configurations.
+    """
+    return tuple(sorted((str(key), repr(value)) for key, value in config.items()))
+
+
+def _load(reference: str) -> Callable:
+    module, _, attribute = reference.partition(':')
+    provider: Any = import_module(module)
+    for name in attribute.split('.'):
+        provider = getattr(provider, name)
+    return provider
+
+
+def _entry_points(group: str) -> Iterable[Any]:
+    # imported on the first lookup of an unknown driver only, it is slow to import.
+    from importlib import metadata
+
+    discovered = metadata.entry_points()
+    # the selectable entry points replaced the dictionary in python 3.10.
+    if hasattr(discovered, 'select'):
+        return discovered.select(group=group)
+    return discovered.get(group, [])
+
+
+sync_registry = DriverRegistry(BUILTIN_DRIVERS, ENTRY_POINT_GROUP)
+async_registry = DriverRegistry(BUILTIN_ASYNC_DRIVERS, ASYNC_ENTRY_POINT_GROUP)
+
+authenticator_cache = AuthenticatorCache()
@@ -0,0 +1,75 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from math import ceil
+from typing import Dict, Optional
+
+from starlette.exceptions import HTTPException
+from rndi.authentication.starlette.instrumentation import REJECTED
+
+MSG_UNAUTHENTICATED = 'Unauthenticated, {detail}.'
+MSG_TOO_MANY_REQUESTS = 'Too many requests, retry in {seconds} seconds.'
+
+# rejection reasons shared by the drivers, reported to the observer besides
+# the driver specific ones.
+RATE_LIMITED = 'rate_limited'
+INVALID_CREDENTIALS = 'invalid_credentials'
+INVALID_SIGNATURE = 'invalid_signature'
+
+
+class ReasonError(ValueError):
+    """
+    Failure identified by a rejection reason, the message is logged while the
+    detail, looked up in the DETAILS of the subclass, is the one given to the
+    user.
+    """
+
+    DETAILS: Dict[str, str] = {}
+
+    def __init__(self, reason: str, message: str, *args):
+        super().__init__(reason, message, *args)
+        self.reason = reason
+        self.detail = self.DETAILS.get(reason, reason.replace('_', ' '))
+
+    def __str__(self) -> str:
+        return self.args[1]
+
+
+class Rejection(HTTPException):
+    reason = REJECTED
+
+
+def reject(reason: str, detail: str, status_code: int = 401, headers: Optional[Dict[str, str]] = None) -> Rejection:
+    """
+    Build the HTTP rejection of a request, carrying the reason reported to the
+    observer.
+
+    :param reason: str The rejection reason.
+    :param detail: str The user facing detail.
+    :param status_code: int The HTTP status code, 401 by default.
+    :param headers: Optional[Dict[str, str]] The response headers.
+    :return: Rejection The exception to raise.
+    """
+    rejection = Rejection(status_code=status_code, detail=detail, headers=headers)
+    rejection.reason = reason
+    return rejection
+
+
+def too_many_requests(wait: float) -> Rejection:
+    """
+    Build the HTTP 429 rejection of a rate limited request.
+
+    :param wait: float The seconds until the request would be allowed.
+    :return: Rejection The exception to raise.
+    """
+    seconds = ceil(wait)
+    return reject(
+        RATE_LIMITED,
+        MSG_TOO_MANY_REQUESTS.format(seconds=seconds),
+        status_code=429,
+        headers={'Retry-After': str(seconds)},
+    )
@@ -0,0 +1,88 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable
+
+from anyio import from_thread
+from starlette.concurrency import run_in_threadpool
+from rndi.authentication.starlette.contract import AsyncCredentialsRepository, CredentialsRepository
+
+
+class SyncToAsyncCredentialsRepository(AsyncCredentialsRepository):
+    """
+    Expose a synchronous CredentialsRepository through the async contract.
+
+    Blocking repositories (database, remote secret store...) are executed in
+    the threadpool so the event loop is never blocked. Set blocking to False
+    for pure in-memory repositories to call them inline.
+    """
+
+    def __init__(self, repository: CredentialsRepository, blocking: bool = True):
+        self.__repository = repository
+        self.__blocking = blocking
+
+    async def get(self, key: str) -> Dict[str, str]:
+        if self.__blocking:
+            return await run_in_threadpool(self.__repository.get, key)
+        return self.__repository.get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        if self.__blocking:
+            return await run_in_threadpool(self.__repository.get_many, list(keys))
+        return self.__repository.get_many(keys)
+
+
+class AsyncToSyncCredentialsRepository(CredentialsRepository):
+    """
+    Expose an AsyncCredentialsRepository through the synchronous contract.
+
+    When called from a worker thread of the running event loop (for example a
+    synchronous dependency executed in the threadpool) the coroutine is sent
+    back to that event loop, and outside of any event loop a new one is used.
+    Calling it from the event loop thread itself (a synchronous adapter called
+    from an async endpoint) would block the loop the coroutine needs, so it
+    is rejected with a RuntimeError, use the async adapter there instead.
+    """
+
+    def __init__(self, repository: AsyncCredentialsRepository):
+        self.__repository = repository
+
+    def get(self, key: str) -> Dict[str, str]:
+        return self.__run(self.__repository.get, key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        return self.__run(self.__repository.get_many, list(keys))
+
+    @staticmethod
+    def __run(function: Callable[[Any], Awaitable], argument: Any) -> Any:
+        started = False
+
+        async def _run() -> Any:
+            nonlocal started
+            started = True
+            return await function(argument)
+
+        try:
+            return from_thread.run(_run)
+        except RuntimeError:
+            if started:
+                raise
+
+        if _in_event_loop():
+            raise RuntimeError(
+                "AsyncToSyncCredentialsRepository cannot be called from the event loop thread, use "
+                "provide_async_request_authenticator or run the synchronous authenticator in the threadpool.",
+            )
+        # not running in a worker thread of an event loop.
+        return asyncio.run(function(argument))
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
@@ -0,0 +1,187 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Event, Lock
+from time import monotonic
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from rndi.authentication.starlette.contract import CredentialsRepository
+
+
+@dataclass(frozen=True)
+class CacheStatistics:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class _Flight:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = Event()
+        self.value: Optional[Dict[str, str]] = None
+        self.error: Optional[BaseException] = None
+
+
+class CachingCredentialsRepository(CredentialsRepository):
+    """
+    CredentialsRepository decorator that keeps the credentials of the wrapped
+    repository in a bounded LRU cache with a per-entry time to live.
+
+    Unknown keys (empty dictionary) are cached as well using the negative ttl,
+    so floods of invalid keys never reach the wrapped repository. Concurrent
+    misses for the same key share a single call to the wrapped repository.
+    The lookups started before an invalidation never store their (possibly
+    stale) result, and the later misses do not join them.
+
+    The returned dictionaries are shared between callers and MUST be treated
+    as read-only.
+    """
+
+    def __init__(
+            self,
+            repository: CredentialsRepository,
+            max_size: int = 1024,
+            ttl: float = 300.0,
+            negative_ttl: float = 5.0,
+            clock: Callable[[], float] = monotonic,
+    ):
+        if max_size < 1:
+            raise ValueError(f"Invalid cache max size {max_size}, must be greater than 0.")
+
+        self.__repository = repository
+        self.__max_size = max_size
+        self.__ttl = ttl
+        self.__negative_ttl = negative_ttl
+        self.__clock = clock
+
+        self.__entries: OrderedDict[str, Tuple[float, Dict[str, str]]] = OrderedDict()
+        self.__flights: Dict[str, _Flight] = {}
+        self.__lock = Lock()
+        # incremented by each invalidation, the results of the lookups started
+        # in a previous generation are not stored.
+        self.__generation = 0
+
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        with self.__lock:
+            return CacheStatistics(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                size=len(self.__entries),
+            )
+
+    def get(self, key: str) -> Dict[str, str]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry[0] > self.__clock():
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return entry[1]
+                del self.__entries[key]
+
+            self.__misses += 1
+            generation = self.__generation
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = self.__repository.get(key)
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            self.__store(key, flight.value, generation)
+        finally:
+            with self.__lock:
+                # an invalidation may have already detached the flight.
+                if self.__flights.get(key) is flight:
+                    del self.__flights[key]
+            flight.done.set()
+
+        return flight.value
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Get the credentials of the given keys, the cached keys are served from
+        the cache and the rest are recovered with a single get_many call to the
+        wrapped repository, so it can be used to warm up the cache.
+
+        :param keys: Iterable[str] The given keys.
+        :return: Dict[str, Dict[str, str]] The credentials by key.
+        """
+        credentials: Dict[str, Dict[str, str]] = {}
+        missing: List[str] = []
+
+        with self.__lock:
+            generation = self.__generation
+            now = self.__clock()
+            for key in dict.fromkeys(keys):
+                entry = self.__entries.get(key)
+                if entry is not None and entry[0] > now:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    credentials[key] = entry[1]
+                else:
+                    self.__misses += 1
+                    missing.append(key)
+
+        if missing:
+            recovered = self.__repository.get_many(missing)
+            for key in missing:
+                credentials[key] = recovered.get(key, {})
+                self.__store(key, credentials[key], generation)
+
+        return credentials
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Remove the given key from the cache, or all the keys if no key is given.
+        The lookups in progress are not stored once they complete.
+
+        :param key: Optional[str] The key to remove.
+        """
+        with self.__lock:
+            self.__generation += 1
+            if key is None:
+                self.__entries.clear()
+                self.__flights.clear()
+            else:
+                self.__entries.pop(key, None)
+                self.__flights.pop(key, None)
+
+    def __store(self, key: str, value: Dict[str, str], generation: int):
+        ttl = self.__ttl if value else self.__negative_ttl
+        if ttl <= 0:
+            return
+
+        with self.__lock:
+            if generation != self.__generation:
+                return
+            self.__entries[key] = (self.__clock() + ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
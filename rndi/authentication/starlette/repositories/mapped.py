@@ -0,0 +1,104 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from typing import Dict, Iterable, Tuple, Union
+
+from rndi.authentication.starlette.contract import CredentialsRepository
+
+_Index = Dict[str, Tuple[int, int]]
+
+
+class MappedJSONCredentialsRepository(CredentialsRepository):
+    """
+    Read-only CredentialsRepository over a JSON Lines file, one JSON object of
+    credentials per line, memory-mapped in read-only mode.
+
+    Only the position of each key is kept in memory, the credentials are
+    decoded from the mapped file on lookup, so the workers of a server share
+    the pages of the file through the page cache instead of each one holding
+    its own copy of all the credentials. reload swaps the mapping atomically
+    after the file has been replaced (write a new file and rename it) and
+    closes the previous one.
+    """
+
+    def __init__(self, path: str, key: str = 'client_key'):
+        self.__path = path
+        self.__key = key
+        self.__state = self.__map()
+
+    def __len__(self) -> int:
+        return len(self.__state[1])
+
+    def get(self, key: str) -> Dict[str, str]:
+        while True:
+            state = self.__state
+            position = state[1].get(key)
+            if position is None:
+                return {}
+            try:
+                data = state[0][position[0]:position[1]]
+            except ValueError:
+                # the mapping was closed by a reload meanwhile, the lookup is
+                # done again with the new one.
+                if self.__state is state:
+                    raise
+                continue
+            return json.loads(data)
+
+    def reload(self):
+        """
+        Map the file again and close the previous mapping, the lookups in
+        progress are retried with the new mapping.
+        """
+        previous, self.__state = self.__state, self.__map()
+        if isinstance(previous[0], mmap.mmap):
+            previous[0].close()
+
+    def close(self):
+        mapped = self.__state[0]
+        if isinstance(mapped, mmap.mmap):
+            mapped.close()
+
+    def __map(self) -> Tuple[Union[mmap.mmap, bytes], _Index]:
+        with open(self.__path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return b'', {}
+            # the mapping keeps its own reference to the file.
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        index: _Index = {}
+        start = 0
+        for line in iter(mapped.readline, b''):
+            end = start + len(line)
+            if line.strip():
+                try:
+                    index[json.loads(line)[self.__key]] = (start, end)
+                except (ValueError, KeyError, TypeError) as e:
+                    mapped.close()
+                    raise ValueError(f"Invalid credentials at byte {start} of {self.__path}: {e!r}.")
+            start = end
+
+        return mapped, index
+
+
+def dump_credentials(path: str, credentials: Iterable[Dict[str, str]]):
+    """
+    Write the given credentials as JSON Lines, to a temporary file renamed
+    over the given path, so the mapped readers never see a partial file.
+
+    :param path: str The file path.
+    :param credentials: Iterable[Dict[str, str]] The credentials, one dictionary per key.
+    """
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'w', encoding='utf-8') as file:
+        for data in credentials:
+            file.write(json.dumps(data, ensure_ascii=False))
+            file.write('\n')
+    os.replace(temporary, path)
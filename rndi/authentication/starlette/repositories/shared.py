@@ -0,0 +1,309 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import struct
+import tempfile
+import threading
+from hashlib import blake2b
+from multiprocessing import resource_tracker, shared_memory
+from time import sleep, time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from zlib import crc32
+
+from rndi.authentication.starlette.contract import CredentialsRepository
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# only the POSIX shared memory segments are tracked and unlinked.
+_TRACKED = os.name == 'posix'
+
+_MAGIC = b'RNDC'
+_VERSION = 1
+
+# magic, version, slots, slot size and generation.
+_HEADER = struct.Struct('<4sIIIQ')
+_HEADER_SIZE = 64
+
+# sequence, generation, expiration, key hash, payload length and payload crc32.
+_SLOT = struct.Struct('<QQdQII')
+
+
+class SharedMemoryCredentialsRepository(CredentialsRepository):
+    """
+    CredentialsRepository decorator that caches the credentials of the wrapped
+    repository in a named shared memory segment, so the worker processes of a
+    server share a single cache and the lookup of one worker warms all the
+    others, without any external service.
+
+    The segment is a fixed-slot hash table, each key goes to the slot given by
+    a stable hash of the key and replaces its previous entry. Each slot has a
+    sequence number, odd while being written, and a checksum of the entry, so
+    torn or concurrent writes are detected by the readers and treated as a
+    miss. invalidate increments the generation counter of the segment,
+    invalidating the entries of all the workers at once.
+
+    The sequence and generation updates are not atomic, so the writers of all
+    the instances are serialized with a lock file in the temporary directory
+    (on platforms without fcntl only the threads of a process are).
+
+    The first instance creates the segment, the rest attach to it. The
+    segment holds the secrets in plain text and outlives the processes that
+    attach to it, so the process that creates it unlinks it when it exits
+    (unless unlink_at_exit is False, then call unlink when the server stops).
+    Create it in the server master process before forking the workers, so the
+    segment lives as long as the server; a creator killed without running its
+    exit handlers leaves the segment behind.
+    """
+
+    def __init__(
+            self,
+            repository: CredentialsRepository,
+            name: str = 'rndi-credentials',
+            slots: int = 4096,
+            slot_size: int = 1024,
+            ttl: float = 300.0,
+            negative_ttl: float = 5.0,
+            clock: Callable[[], float] = time,
+            unlink_at_exit: bool = True,
+    ):
+        if slots < 1 or slot_size <= _SLOT.size:
+            raise ValueError(f"Invalid shared cache layout, {slots} slots of {slot_size} bytes.")
+
+        self.__repository = repository
+        self.__slots = slots
+        self.__slot_size = slot_size
+        self.__ttl = ttl
+        self.__negative_ttl = negative_ttl
+        self.__clock = clock
+        self.__memory, created = _attach(name, _HEADER_SIZE + slots * slot_size, slots, slot_size)
+        self.__buffer = self.__memory.buf
+        self.__lock = _WriterLock(self.__memory.name)
+
+        if created and unlink_at_exit:
+            # the attached workers never unlink, the creator owns the segment.
+            atexit.register(_unlink, self.__memory)
+
+    @property
+    def name(self) -> str:
+        return self.__memory.name
+
+    @property
+    def generation(self) -> int:
+        return _HEADER.unpack_from(self.__buffer, 0)[4]
+
+    def get(self, key: str) -> Dict[str, str]:
+        hashed = _hash(key)
+        found, value = self.__read(key, hashed, self.generation)
+        if found:
+            return value
+
+        value = self.__repository.get(key)
+        self.__write(key, hashed, value)
+        return value
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        generation = self.generation
+        credentials: Dict[str, Dict[str, str]] = {}
+        missing: List[str] = []
+
+        for key in dict.fromkeys(keys):
+            found, value = self.__read(key, _hash(key), generation)
+            if found:
+                credentials[key] = value
+            else:
+                missing.append(key)
+
+        if missing:
+            recovered = self.__repository.get_many(missing)
+            for key in missing:
+                credentials[key] = recovered.get(key, {})
+                self.__write(key, _hash(key), credentials[key])
+
+        return credentials
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Invalidate the given key, or all the keys of all the workers if no key
+        is given by incrementing the generation counter.
+
+        :param key: Optional[str] The key to invalidate.
+        """
+        if key is not None:
+            self.__write(key, _hash(key), {}, ttl=0.0)
+            return
+
+        with self.__lock:
+            magic, version, slots, slot_size, generation = _HEADER.unpack_from(self.__buffer, 0)
+            _HEADER.pack_into(self.__buffer, 0, magic, version, slots, slot_size, generation + 1)
+
+    def close(self):
+        """
+        Detach from the shared memory segment.
+        """
+        self.__buffer = None
+        self.__memory.close()
+        self.__lock.close()
+
+    def unlink(self):
+        """
+        Destroy the shared memory segment, once all the workers are stopped.
+        """
+        _unlink(self.__memory)
+
+    def __read(self, key: str, hashed: int, generation: int) -> Tuple[bool, Dict[str, str]]:
+        offset = self.__offset(hashed)
+        sequence, entry_generation, expires, entry_hash, length, checksum = _SLOT.unpack_from(self.__buffer, offset)
+        if (
+                sequence & 1 or entry_hash != hashed or entry_generation != generation
+                or expires <= self.__clock() or length > self.__slot_size - _SLOT.size
+        ):
+            return False, {}
+
+        payload = bytes(self.__buffer[offset + _SLOT.size:offset + _SLOT.size + length])
+
+        # the entry may have been replaced while being copied.
+        if _SLOT.unpack_from(self.__buffer, offset)[0] != sequence or crc32(payload) != checksum:
+            return False, {}
+
+        try:
+            entry_key, value = json.loads(payload)
+        except ValueError:
+            return False, {}
+        return entry_key == key, value
+
+    def __write(self, key: str, hashed: int, value: Dict[str, str], ttl: Optional[float] = None):
+        if ttl is None:
+            ttl = self.__ttl if value else self.__negative_ttl
+
+        payload = json.dumps([key, value], separators=(',', ':')).encode('utf-8')
+        if len(payload) > self.__slot_size - _SLOT.size:
+            # too large for a slot, served from the wrapped repository.
+            return
+
+        offset = self.__offset(hashed)
+        with self.__lock:
+            sequence = _SLOT.unpack_from(self.__buffer, offset)[0]
+            # odd while writing, a crashed writer cannot leave the slot locked
+            # because the next write moves the sequence forward anyway.
+            writing = sequence + 1 if sequence % 2 == 0 else sequence + 2
+            struct.pack_into('<Q', self.__buffer, offset, writing)
+
+            self.__buffer[offset + _SLOT.size:offset + _SLOT.size + len(payload)] = payload
+            _SLOT.pack_into(
+                self.__buffer,
+                offset,
+                writing,
+                self.generation,
+                self.__clock() + ttl,
+                hashed,
+                len(payload),
+                crc32(payload),
+            )
+            struct.pack_into('<Q', self.__buffer, offset, writing + 1)
+
+    def __offset(self, hashed: int) -> int:
+        return _HEADER_SIZE + (hashed % self.__slots) * self.__slot_size
+
+
+class _WriterLock:
+    """
+    Exclusive lock of the writers of a segment, a thread lock for the threads
+    of the process and an advisory file lock for the other processes.
+    """
+
+    def __init__(self, name: str):
+        self.__thread_lock = threading.Lock()
+        self.__fd = -1
+        if fcntl is not None:
+            self.__fd = os.open(_lock_path(name), os.O_RDWR | os.O_CREAT, 0o600)
+
+    def __enter__(self):
+        self.__thread_lock.acquire()
+        if self.__fd >= 0:
+            try:
+                fcntl.flock(self.__fd, fcntl.LOCK_EX)
+            except BaseException:
+                self.__thread_lock.release()
+                raise
+
+    def __exit__(self, *args):
+        if self.__fd >= 0:
+            fcntl.flock(self.__fd, fcntl.LOCK_UN)
+        self.__thread_lock.release()
+
+    def close(self):
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+
+def _lock_path(name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f'{name.lstrip("/")}.lock')
+
+
+def _hash(key: str) -> int:
+    # hash() is randomized per process, the slot must be the same in all of them.
+    return int.from_bytes(blake2b(key.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _tracked_name(memory: shared_memory.SharedMemory) -> str:
+    return getattr(memory, '_name', '/' + memory.name)
+
+
+def _unlink(memory: shared_memory.SharedMemory):
+    try:
+        os.unlink(_lock_path(memory.name))
+    except FileNotFoundError:
+        pass
+
+    if _TRACKED:
+        # unlink unregisters the segment from the resource tracker again.
+        resource_tracker.register(_tracked_name(memory), 'shared_memory')
+    try:
+        memory.unlink()
+    except FileNotFoundError:
+        # already unlinked by this or another process.
+        if _TRACKED:
+            resource_tracker.unregister(_tracked_name(memory), 'shared_memory')
+
+
+def _attach(name: str, size: int, slots: int, slot_size: int) -> Tuple[shared_memory.SharedMemory, bool]:
+    try:
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(memory.buf, 0, _MAGIC, _VERSION, slots, slot_size, 0)
+        created = True
+    except FileExistsError:
+        memory = shared_memory.SharedMemory(name=name)
+        created = False
+
+    # the resource tracker would destroy the segment when this process exits,
+    # while the other workers are still using it.
+    if _TRACKED:
+        resource_tracker.unregister(_tracked_name(memory), 'shared_memory')
+
+    magic, version, existing_slots, existing_slot_size, _ = _HEADER.unpack_from(memory.buf, 0)
+    for _ in range(100):
+        if magic != bytes(len(_MAGIC)):
+            break
+        # created by another worker that has not written the header yet.
+        sleep(0.01)
+        magic, version, existing_slots, existing_slot_size, _ = _HEADER.unpack_from(memory.buf, 0)
+
+    if (magic, version, existing_slots, existing_slot_size) != (_MAGIC, _VERSION, slots, slot_size):
+        memory.close()
+        raise ValueError(
+            f"The shared memory segment {name} has a different layout, {existing_slots} slots of "
+            f"{existing_slot_size} bytes.",
+        )
+
+    return memory, created
@@ -0,0 +1,114 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from logging import LoggerAdapter
+from threading import Event, Lock, Thread
+from time import monotonic
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, Optional
+
+from rndi.authentication.starlette.contract import CredentialsRepository
+
+CredentialsLoader = Callable[[], Mapping[str, Dict[str, str]]]
+
+
+class SnapshotCredentialsRepository(CredentialsRepository):
+    """
+    CredentialsRepository that serves the credentials from an immutable
+    in-memory index of all of them, so the lookups never do any I/O.
+
+    The loader is called once at construction, failing fast if the credentials
+    cannot be loaded at startup. The snapshot is rebuilt by refresh, every
+    refresh_interval seconds in a background thread if given, and swapped
+    atomically: the lookups see either the old or the new snapshot, never a
+    partially loaded one. A failed refresh keeps the previous snapshot.
+
+    The returned dictionaries are shared between callers and MUST be treated
+    as read-only.
+    """
+
+    def __init__(
+            self,
+            loader: CredentialsLoader,
+            refresh_interval: Optional[float] = None,
+            logger: Optional[LoggerAdapter] = None,
+    ):
+        self.__loader = loader
+        self.__logger = logger
+        self.__refresh_lock = Lock()
+        self.__stopped = Event()
+        self.__snapshot: Mapping[str, Dict[str, str]] = MappingProxyType(dict(loader()))
+        self.__loaded_at = monotonic()
+
+        self.__thread: Optional[Thread] = None
+        if refresh_interval is not None and refresh_interval > 0:
+            self.__thread = Thread(
+                target=self.__refresh_periodically,
+                args=(refresh_interval,),
+                name='credentials-snapshot-refresh',
+                daemon=True,
+            )
+            self.__thread.start()
+
+    @property
+    def snapshot(self) -> Mapping[str, Dict[str, str]]:
+        return self.__snapshot
+
+    @property
+    def age(self) -> float:
+        """
+        Seconds since the current snapshot was loaded.
+        """
+        return monotonic() - self.__loaded_at
+
+    def __len__(self) -> int:
+        return len(self.__snapshot)
+
+    def get(self, key: str) -> Dict[str, str]:
+        return self.__snapshot.get(key, {})
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        # a single snapshot serves the whole call, even if refreshed meanwhile.
+        snapshot = self.__snapshot
+        return {key: snapshot.get(key, {}) for key in keys}
+
+    def refresh(self) -> bool:
+        """
+        Load a new snapshot and swap it with the current one.
+
+        :return: bool True if the snapshot has been refreshed, False if the loader failed.
+        """
+        with self.__refresh_lock:
+            try:
+                snapshot = MappingProxyType(dict(self.__loader()))
+            except Exception as e:
+                if self.__logger is not None:
+                    self.__logger.warning(
+                        "SnapshotCredentialsRepository: unable to refresh the credentials snapshot due to %s, "
+                        "keeping the snapshot loaded %.0f seconds ago.",
+                        e,
+                        self.age,
+                    )
+                return False
+
+            self.__snapshot = snapshot
+            self.__loaded_at = monotonic()
+            return True
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Stop the background refresh.
+
+        :param timeout: Optional[float] Seconds to wait for the refresh thread to finish.
+        """
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+
+    def __refresh_periodically(self, interval: float):
+        while not self.__stopped.wait(interval):
+            self.refresh()
@@ -0,0 +1,129 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from pathlib import Path
+from threading import local, Lock
+from typing import Dict, Iterable, List, Mapping
+
+from rndi.authentication.starlette.contract import CredentialsRepository
+
+# keeps the IN (...) lookups under the SQLITE_MAX_VARIABLE_NUMBER of old builds.
+_MAX_VARIABLES = 500
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+class SQLiteCredentialsRepository(CredentialsRepository):
+    """
+    CredentialsRepository backed by a local SQLite database, storing the
+    credentials of each key as a JSON object in a WITHOUT ROWID table indexed
+    by its primary key.
+
+    Each thread gets its own connection, opened on first use and kept open,
+    the database is switched to WAL mode so readers never block each other or
+    the writers, and the lookups always use the same SQL text, so the prepared
+    statement is reused from the statement cache of the connection.
+    """
+
+    def __init__(self, path: str, table: str = 'credentials', read_only: bool = False, timeout: float = 5.0):
+        if not _IDENTIFIER.match(table):
+            raise ValueError(f"Invalid table name {table}.")
+
+        self.__path = path
+        self.__read_only = read_only
+        self.__timeout = timeout
+        self.__local = local()
+        self.__connections: List[sqlite3.Connection] = []
+        self.__lock = Lock()
+
+        self.__select = f'SELECT credentials FROM {table} WHERE key = ?'
+        self.__select_many = f'SELECT key, credentials FROM {table} WHERE key IN ({{}})'
+        self.__upsert = f'INSERT OR REPLACE INTO {table} (key, credentials) VALUES (?, ?)'
+        self.__delete = f'DELETE FROM {table} WHERE key = ?'
+
+        if not read_only:
+            connection = self.__connection()
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                f'CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, credentials TEXT NOT NULL) WITHOUT ROWID',
+            )
+            connection.commit()
+
+    def get(self, key: str) -> Dict[str, str]:
+        row = self.__connection().execute(self.__select, (key,)).fetchone()
+        return {} if row is None else json.loads(row[0])
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        keys = list(dict.fromkeys(keys))
+        credentials: Dict[str, Dict[str, str]] = {key: {} for key in keys}
+
+        connection = self.__connection()
+        for start in range(0, len(keys), _MAX_VARIABLES):
+            chunk = keys[start:start + _MAX_VARIABLES]
+            for key, data in connection.execute(self.__select_many.format(','.join('?' * len(chunk))), chunk):
+                credentials[key] = json.loads(data)
+
+        return credentials
+
+    def put_many(self, credentials: Mapping[str, Dict[str, str]]):
+        """
+        Insert or replace the credentials of the given keys in a single transaction.
+
+        :param credentials: Mapping[str, Dict[str, str]] The credentials by key.
+        """
+        with self.__connection() as connection:
+            connection.executemany(self.__upsert, [(key, json.dumps(data)) for key, data in credentials.items()])
+
+    def put(self, key: str, credentials: Dict[str, str]):
+        """
+        Insert or replace the credentials of the given key.
+
+        :param key: str The key.
+        :param credentials: Dict[str, str] The credentials.
+        """
+        self.put_many({key: credentials})
+
+    def delete(self, key: str):
+        """
+        Delete the credentials of the given key.
+
+        :param key: str The key.
+        """
+        with self.__connection() as connection:
+            connection.execute(self.__delete, (key,))
+
+    def close(self):
+        """
+        Close the connections of all the threads.
+        """
+        with self.__lock:
+            connections, self.__connections = self.__connections, []
+        for connection in connections:
+            connection.close()
+        self.__local = local()
+
+    def __connection(self) -> sqlite3.Connection:
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None:
+            if self.__read_only:
+                # the path is percent-encoded in the URI, a "?", "#" or "%" in
+                # it would be taken as part of the URI syntax otherwise.
+                connection = sqlite3.connect(
+                    f'{Path(self.__path).absolute().as_uri()}?mode=ro',
+                    uri=True,
+                    timeout=self.__timeout,
+                    check_same_thread=False,
+                )
+            else:
+                connection = sqlite3.connect(self.__path, timeout=self.__timeout, check_same_thread=False)
+            self.__local.connection = connection
+            with self.__lock:
+                self.__connections.append(connection)
+        return connection
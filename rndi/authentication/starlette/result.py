@@ -0,0 +1,100 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional
+
+from starlette.requests import HTTPConnection
+
+# name of the request.state attribute holding the AuthResult.
+AUTH_RESULT = 'auth_result'
+
+# the request.state entry holding the authenticator that built the AuthResult.
+_AUTHENTICATOR = 'rndi.authentication.authenticator'
+
+# the credential entries that never reach the principal.
+SECRET_ATTRIBUTES = frozenset(['client_secret', 'resource_owner_secret', 'rsa_key'])
+
+
+class AuthResult:
+    """
+    The principal of an authenticated request: the consumer key, the driver
+    that authenticated it and the non secret credential attributes, so the
+    handlers do not need to recover the credentials again.
+    """
+
+    __slots__ = ('consumer_key', 'driver', 'attributes')
+
+    def __init__(self, consumer_key: str, driver: str, attributes: Optional[Mapping[str, Any]] = None):
+        self.consumer_key = consumer_key
+        self.driver = driver
+        self.attributes = {} if attributes is None else attributes
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, AuthResult):
+            return NotImplemented
+        return (self.consumer_key, self.driver, self.attributes) == (other.consumer_key, other.driver, other.attributes)
+
+    def __repr__(self) -> str:
+        return f'AuthResult(consumer_key={self.consumer_key!r}, driver={self.driver!r}, attributes={self.attributes!r})'
+
+
+def principal(consumer_key: str, driver: str, credentials: Mapping[str, Any]) -> AuthResult:
+    """
+    Build the AuthResult of the given consumer key, keeping the credential
+    attributes except the secrets.
+
+    :param consumer_key: str The consumer key.
+    :param driver: str The driver that authenticated the request.
+    :param credentials: Mapping[str, Any] The credentials recovered from the repository.
+    :return: AuthResult The principal.
+    """
+    attributes: Dict[str, Any] = {key: value for key, value in credentials.items() if key not in SECRET_ATTRIBUTES}
+    return AuthResult(consumer_key, driver, attributes)
+
+
+def authenticated(
+        request: HTTPConnection,
+        driver: Optional[str] = None,
+        authenticator: Optional[object] = None,
+) -> Optional[AuthResult]:
+    """
+    Get the AuthResult of the given request, memoized in the scope state, so
+    it is shared by all the Request objects built for the same request
+    (middleware, dependencies and handler).
+
+    :param request: HTTPConnection The request.
+    :param driver: Optional[str] Only return the result of the given driver.
+    :param authenticator: Optional[object] Only return the result built by the given authenticator instance.
+    :return: Optional[AuthResult] The AuthResult or None if not authenticated yet.
+    """
+    state = request.scope.get('state')
+    if state is None:
+        return None
+    result = state.get(AUTH_RESULT)
+    if result is None or (driver is not None and result.driver != driver):
+        return None
+    if authenticator is not None and state.get(_AUTHENTICATOR) is not authenticator:
+        # two authenticators of the same driver may trust different
+        # credentials, one never reuses the result of the other.
+        return None
+    return result
+
+
+def remember(request: HTTPConnection, result: AuthResult, authenticator: Optional[object] = None) -> AuthResult:
+    """
+    Memoize the given AuthResult in the scope state of the request, where
+    request.state.auth_result reads it.
+
+    :param request: HTTPConnection The request.
+    :param result: AuthResult The AuthResult.
+    :param authenticator: Optional[object] The authenticator instance that built the result.
+    :return: AuthResult The same AuthResult.
+    """
+    state = request.scope.setdefault('state', {})
+    state[AUTH_RESULT] = result
+    state[_AUTHENTICATOR] = authenticator
+    return result
@@ -3,14 +3,19 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
+import hmac
+import json
+from base64 import b64decode, b64encode, urlsafe_b64encode
 from logging import LoggerAdapter
 from typing import Callable, Dict, Optional
 from unittest.mock import patch
+from urllib.parse import unquote
 
 import pytest
+from oauthlib import oauth1
 from starlette.datastructures import Headers, URL
 from starlette.requests import Request
-from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.contract import AsyncCredentialsRepository, CredentialsRepository
 
 
 @pytest.fixture
@@ -27,6 +32,35 @@ def make_credential_repository():
     return __
 
 
+@pytest.fixture
+def make_counting_credential_repository():
+    class CountingCredentialsRepository(CredentialsRepository):
+        def __init__(self, credentials: Dict[str, Dict[str, str]]):
+            self.credentials = credentials
+            self.calls = 0
+
+        def get(self, key: str) -> Dict[str, str]:
+            self.calls += 1
+            return self.credentials.get(key, {})
+
+    def __(credentials: Optional[Dict[str, Dict[str, str]]] = None) -> CredentialsRepository:
+        return CountingCredentialsRepository({} if credentials is None else credentials)
+
+    return __
+
+
+@pytest.fixture
+def make_async_credential_repository():
+    def __(credentials: Optional[Dict[str, Dict[str, str]]] = None) -> AsyncCredentialsRepository:
+        class InMemoryAsyncCredentialsRepository(AsyncCredentialsRepository):
+            async def get(self, key: str) -> Dict[str, str]:
+                return ({} if credentials is None else credentials).get(key, {})
+
+        return InMemoryAsyncCredentialsRepository()
+
+    return __
+
+
 @pytest.fixture
 def make_logger():
     def __(overrides: Optional[Dict[str, Callable[[str], None]]] = None) -> LoggerAdapter:
@@ -45,6 +79,21 @@ def make_logger():
     return __
 
 
+@pytest.fixture
+def make_clock():
+    class Clock:
+        def __init__(self, now: float):
+            self.now = now
+
+        def __call__(self) -> float:
+            return self.now
+
+    def __(now: float = 0.0) -> Callable[[], float]:
+        return Clock(now)
+
+    return __
+
+
 @pytest.fixture
 def make_request():
     def __(method: str, location: str, headers: Optional[Dict[str, str]] = None, _: Optional[any] = None) -> Request:
@@ -64,10 +113,90 @@ def make_request():
             "http_version": "1.1",
             "method": method,
             "scheme": url.scheme,
-            "path": url.path,
-            "query_string": url.query,
+            "path": unquote(url.path),
+            "raw_path": url.path.encode("latin-1"),
+            "query_string": url.query.encode("latin-1"),
             "headers": headers.raw,
             "server": (url.hostname, 443 if url.scheme == 'https' else 80),
         })
 
     return __
+
+
+@pytest.fixture
+def make_oauth10a_authorization():
+    def __(
+            method: str,
+            location: str,
+            client_key: str = 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+            client_secret: str = '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+            **kwargs,
+    ) -> str:
+        client = oauth1.Client(client_key, client_secret=client_secret, **kwargs)
+        _, headers, _ = client.sign(location, http_method=method)
+        return headers['Authorization']
+
+    return __
+
+
+@pytest.fixture
+def make_jwt():
+    def encode(value: bytes) -> str:
+        return urlsafe_b64encode(value).decode('ascii').rstrip('=')
+
+    def __(
+            claims: dict,
+            secret: str = 'Ylh2oDiCXh5ITeKXWGUvpWmgNDXJU0tC',
+            algorithm: str = 'HS256',
+            header: Optional[dict] = None,
+            sign: Optional[Callable[[str, str], str]] = None,
+    ) -> str:
+        header = {'alg': algorithm, 'typ': 'JWT', **({} if header is None else header)}
+        signing_input = f"{encode(json.dumps(header).encode('utf-8'))}.{encode(json.dumps(claims).encode('utf-8'))}"
+        digest = f'SHA{algorithm[2:]}'
+        if sign is None:
+            signature = hmac.new(secret.encode('utf-8'), signing_input.encode('ascii'), digest.lower()).digest()
+        else:
+            # the RSA keys sign in base64, the JWS signatures are base64url.
+            signature = b64decode(sign(signing_input, digest))
+        return f'{signing_input}.{encode(signature)}'
+
+    return __
+
+
+@pytest.fixture
+def make_rsa_key():
+    pytest.importorskip('cryptography')
+
+    from datetime import datetime, timedelta
+    from types import SimpleNamespace
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import padding, rsa
+    from cryptography.x509.oid import NameOID
+
+    def __():
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'rndi')])
+        certificate = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(
+            private_key.public_key(),
+        ).serial_number(1).not_valid_before(datetime.utcnow()).not_valid_after(
+            datetime.utcnow() + timedelta(days=1),
+        ).sign(private_key, hashes.SHA256())
+
+        def sign(message: str, algorithm: str = 'SHA1') -> str:
+            signature = private_key.sign(message.encode('utf-8'), padding.PKCS1v15(), getattr(hashes, algorithm)())
+            return b64encode(signature).decode('ascii')
+
+        return SimpleNamespace(
+            public_key=private_key.public_key().public_bytes(
+                serialization.Encoding.PEM,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            ).decode('ascii'),
+            certificate=certificate.public_bytes(serialization.Encoding.PEM).decode('ascii'),
+            sign=sign,
+        )
+
+    return __
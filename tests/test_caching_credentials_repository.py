@@ -0,0 +1,244 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from threading import Barrier, Event, Thread
+from typing import Dict
+
+import pytest
+from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.repositories.caching import CachingCredentialsRepository
+
+
+CREDENTIALS = {
+    'key-1': {'client_key': 'key-1', 'client_secret': 'secret-1', 'resource_owner_secret': ''},
+    'key-2': {'client_key': 'key-2', 'client_secret': 'secret-2', 'resource_owner_secret': ''},
+    'key-3': {'client_key': 'key-3', 'client_secret': 'secret-3', 'resource_owner_secret': ''},
+}
+
+
+def test_caching_credentials_repository_should_serve_repeated_keys_from_cache(make_counting_credential_repository):
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = CachingCredentialsRepository(backend)
+
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert backend.calls == 1
+
+    statistics = repository.statistics
+    assert (statistics.hits, statistics.misses, statistics.evictions, statistics.size) == (1, 1, 0, 1)
+
+
+def test_caching_credentials_repository_should_expire_entries_after_ttl(
+        make_clock,
+        make_counting_credential_repository,
+):
+    clock = make_clock()
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = CachingCredentialsRepository(backend, ttl=10, clock=clock)
+
+    repository.get('key-1')
+    clock.now = 9.9
+    repository.get('key-1')
+    clock.now = 10.0
+    repository.get('key-1')
+
+    assert backend.calls == 2
+
+
+def test_caching_credentials_repository_should_cache_unknown_keys_with_negative_ttl(
+        make_clock,
+        make_counting_credential_repository,
+):
+    clock = make_clock()
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = CachingCredentialsRepository(backend, ttl=300, negative_ttl=1, clock=clock)
+
+    assert repository.get('unknown') == {}
+    assert repository.get('unknown') == {}
+    assert backend.calls == 1
+
+    clock.now = 1.0
+    assert repository.get('unknown') == {}
+    assert backend.calls == 2
+
+
+def test_caching_credentials_repository_should_evict_least_recently_used_entries(make_counting_credential_repository):
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = CachingCredentialsRepository(backend, max_size=2)
+
+    repository.get('key-1')
+    repository.get('key-2')
+    repository.get('key-1')
+    repository.get('key-3')
+
+    assert repository.statistics.evictions == 1
+    assert repository.statistics.size == 2
+
+    repository.get('key-1')
+    assert backend.calls == 3
+    repository.get('key-2')
+    assert backend.calls == 4
+
+
+def test_caching_credentials_repository_should_invalidate_entries(make_counting_credential_repository):
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = CachingCredentialsRepository(backend)
+
+    repository.get('key-1')
+    repository.get('key-2')
+    repository.invalidate('key-1')
+    repository.get('key-1')
+    repository.get('key-2')
+    assert backend.calls == 3
+
+    repository.invalidate()
+    assert repository.statistics.size == 0
+
+
+def test_caching_credentials_repository_should_share_concurrent_misses_for_the_same_key(
+        make_counting_credential_repository,
+):
+    release = Event()
+    workers = 8
+    barrier = Barrier(workers + 1)
+
+    backend = make_counting_credential_repository(CREDENTIALS)
+
+    class SlowCredentialsRepository(CredentialsRepository):
+        def get(self, key: str) -> Dict[str, str]:
+            release.wait(timeout=5)
+            return backend.get(key)
+
+    repository = CachingCredentialsRepository(SlowCredentialsRepository())
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(repository.get('key-1'))
+
+    threads = [Thread(target=worker) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert backend.calls == 1
+    assert results == [CREDENTIALS['key-1']] * workers
+
+
+@pytest.mark.parametrize('key', ['key-1', None])
+def test_caching_credentials_repository_should_not_store_lookups_started_before_invalidation(key):
+    started = Event()
+    release = Event()
+    credentials = {'key-1': {'client_key': 'key-1', 'client_secret': 'stale', 'resource_owner_secret': ''}}
+
+    class SlowCredentialsRepository(CredentialsRepository):
+        def get(self, key: str) -> Dict[str, str]:
+            value = credentials[key]
+            started.set()
+            release.wait(timeout=5)
+            return value
+
+    repository = CachingCredentialsRepository(SlowCredentialsRepository())
+    results = []
+    thread = Thread(target=lambda: results.append(repository.get('key-1')))
+    thread.start()
+    started.wait(timeout=5)
+
+    # the secret is rotated while the lookup of the old one is in flight.
+    credentials['key-1'] = CREDENTIALS['key-1']
+    repository.invalidate(key)
+    release.set()
+    thread.join()
+
+    assert results[0]['client_secret'] == 'stale'
+    assert repository.statistics.size == 0
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+
+
+def test_caching_credentials_repository_should_not_join_lookups_started_before_invalidation():
+    started = Event()
+    release = Event()
+    secrets = iter(['stale', 'fresh'])
+
+    class SlowCredentialsRepository(CredentialsRepository):
+        def get(self, key: str) -> Dict[str, str]:
+            secret = next(secrets)
+            if secret == 'stale':
+                started.set()
+                release.wait(timeout=5)
+            return {'client_key': key, 'client_secret': secret}
+
+    repository = CachingCredentialsRepository(SlowCredentialsRepository())
+    thread = Thread(target=repository.get, args=('key-1',))
+    thread.start()
+    started.wait(timeout=5)
+
+    repository.invalidate('key-1')
+    assert repository.get('key-1')['client_secret'] == 'fresh'
+    release.set()
+    thread.join()
+
+    assert repository.get('key-1')['client_secret'] == 'fresh'
+
+
+def test_caching_credentials_repository_should_not_cache_backend_errors():
+    class FailingCredentialsRepository(CredentialsRepository):
+        def get(self, key: str) -> Dict[str, str]:
+            raise ConnectionError('backend down')
+
+    repository = CachingCredentialsRepository(FailingCredentialsRepository())
+
+    with pytest.raises(ConnectionError):
+        repository.get('key-1')
+
+    assert repository.statistics.size == 0
+
+
+def test_caching_credentials_repository_should_reject_invalid_max_size(make_counting_credential_repository):
+    with pytest.raises(ValueError):
+        CachingCredentialsRepository(make_counting_credential_repository(), max_size=0)
+
+
+def test_credentials_repository_get_many_should_fall_back_to_get(make_counting_credential_repository):
+    backend = make_counting_credential_repository(CREDENTIALS)
+
+    assert backend.get_many(['key-1', 'unknown']) == {'key-1': CREDENTIALS['key-1'], 'unknown': {}}
+    assert backend.calls == 2
+
+
+def test_caching_credentials_repository_get_many_should_recover_missing_keys_at_once(
+        make_clock,
+        make_counting_credential_repository,
+):
+    clock = make_clock()
+    backend = make_counting_credential_repository(CREDENTIALS)
+    bulk = []
+    backend.get_many = lambda keys: bulk.append(list(keys)) or {k: CREDENTIALS[k] for k in keys if k in CREDENTIALS}
+    repository = CachingCredentialsRepository(backend, ttl=10, clock=clock)
+
+    repository.get_many(['key-1', 'key-2'])
+    credentials = repository.get_many(['key-1', 'key-2', 'key-3', 'unknown', 'key-3'])
+
+    assert credentials == {
+        'key-1': CREDENTIALS['key-1'],
+        'key-2': CREDENTIALS['key-2'],
+        'key-3': CREDENTIALS['key-3'],
+        'unknown': {},
+    }
+    assert bulk == [['key-1', 'key-2'], ['key-3', 'unknown']]
+
+    assert repository.get('key-3') == CREDENTIALS['key-3']
+    assert backend.calls == 0
+
+    clock.now = 10.0
+    repository.get_many(['key-1'])
+    assert bulk[-1] == ['key-1']
+
+    statistics = repository.statistics
+    assert (statistics.hits, statistics.misses, statistics.size) == (3, 5, 4)
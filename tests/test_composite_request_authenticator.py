@@ -0,0 +1,193 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import asyncio
+from typing import List
+
+import pytest
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from rndi.authentication.starlette.adapters.composite import (
+    AsyncCompositeRequestAuthenticatorAdapter,
+    CompositeRequestAuthenticatorAdapter,
+    REQUEST_AUTH_COMPOSITE_FALLBACK,
+    REQUEST_AUTH_COMPOSITE_HEADERS,
+    REQUEST_AUTH_COMPOSITE_SCHEMES,
+)
+from rndi.authentication.starlette.adapters.unauthorized import UnauthorizedRequestAuthenticatorAdapter
+from rndi.authentication.starlette.contract import AsyncRequestAuthenticator, RequestAuthenticator
+from rndi.authentication.starlette.provider import (
+    provide_async_request_authenticator,
+    provide_request_authenticator,
+    REQUEST_AUTH_DRIVER,
+)
+
+
+class RecordingRequestAuthenticator(RequestAuthenticator):
+    def __init__(self, name: str, calls: List[str]):
+        self.name = name
+        self.calls = calls
+
+    def authenticate(self, request: Request):
+        self.calls.append(self.name)
+
+
+class AsyncRecordingRequestAuthenticator(AsyncRequestAuthenticator):
+    def __init__(self, name: str, calls: List[str]):
+        self.name = name
+        self.calls = calls
+
+    async def authenticate(self, request: Request):
+        self.calls.append(self.name)
+
+
+@pytest.mark.parametrize('headers, expected', [
+    ({'authorization': 'OAuth oauth_consumer_key="key"'}, 'oauth'),
+    ({'authorization': 'oauth oauth_consumer_key="key"'}, 'oauth'),
+    ({'authorization': 'Bearer token', 'x-api-key': 'key'}, 'bearer'),
+    ({'x-api-key': 'key', 'authorization': 'Bearer token'}, 'bearer'),
+    ({'authorization': 'Basic dXNlcg==', 'x-api-key': 'key'}, 'api-key'),
+    ({'x-api-key': 'key'}, 'api-key'),
+    ({'authorization': 'Basic dXNlcg=='}, 'fallback'),
+    ({}, 'fallback'),
+])
+def test_composite_request_authenticator_should_route_to_a_single_authenticator(
+        make_logger,
+        make_request,
+        headers,
+        expected,
+):
+    calls = []
+    authenticator = CompositeRequestAuthenticatorAdapter(
+        make_logger(),
+        schemes={
+            'OAuth': RecordingRequestAuthenticator('oauth', calls),
+            'Bearer': RecordingRequestAuthenticator('bearer', calls),
+        },
+        headers={'X-API-Key': RecordingRequestAuthenticator('api-key', calls)},
+        fallback=RecordingRequestAuthenticator('fallback', calls),
+    )
+
+    authenticator.authenticate(make_request('GET', 'https://example.com/path', headers))
+
+    assert calls == [expected]
+
+
+def test_composite_request_authenticator_should_reject_unrouted_requests_by_default(make_logger, make_request):
+    calls = []
+    authenticator = CompositeRequestAuthenticatorAdapter(
+        make_logger(),
+        schemes={'Bearer': RecordingRequestAuthenticator('bearer', calls)},
+    )
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(make_request('GET', 'https://example.com/path'))
+
+    assert e.value.status_code == 401
+    assert calls == []
+
+
+def test_async_composite_request_authenticator_should_route_to_a_single_authenticator(make_logger, make_request):
+    calls = []
+    authenticator = AsyncCompositeRequestAuthenticatorAdapter(
+        make_logger(),
+        schemes={'Bearer': AsyncRecordingRequestAuthenticator('bearer', calls)},
+    )
+
+    asyncio.run(authenticator.authenticate(make_request('GET', 'https://example.com/path', {
+        'authorization': 'Bearer token',
+    })))
+    assert calls == ['bearer']
+
+    with pytest.raises(HTTPException):
+        asyncio.run(authenticator.authenticate(make_request('GET', 'https://example.com/path')))
+
+
+def test_provider_should_build_composite_request_authenticator_from_config(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+):
+    calls = []
+    built = []
+
+    def provide_api_key_authenticator(config, logger, repository):
+        built.append('api-key')
+        return RecordingRequestAuthenticator('api-key', calls)
+
+    config = {
+        REQUEST_AUTH_DRIVER: 'composite',
+        REQUEST_AUTH_COMPOSITE_SCHEMES: 'OAuth:oauth10a, Token:api-key',
+        REQUEST_AUTH_COMPOSITE_HEADERS: 'X-API-Key:api-key',
+    }
+    authenticator = provide_request_authenticator(
+        config,
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+        {'api-key': provide_api_key_authenticator},
+    )
+
+    assert isinstance(authenticator, CompositeRequestAuthenticatorAdapter)
+    assert built == ['api-key']
+
+    url = 'https://example.com/path'
+    result = authenticator.authenticate(make_request('GET', url, {
+        'authorization': make_oauth10a_authorization('GET', url),
+    }))
+    assert (result.consumer_key, result.driver) == ('wotAQOwTUXZrkZqfOMrpEAtTC362SJi8', 'oauth10a')
+    authenticator.authenticate(make_request('GET', url, {'x-api-key': 'key'}))
+    assert calls == ['api-key']
+
+    with pytest.raises(HTTPException):
+        authenticator.authenticate(make_request('GET', url))
+
+
+def test_async_provider_should_build_composite_request_authenticator_from_config(
+        make_async_credential_repository,
+        make_logger,
+        make_request,
+):
+    config = {
+        REQUEST_AUTH_DRIVER: 'composite',
+        REQUEST_AUTH_COMPOSITE_SCHEMES: 'OAuth:oauth10a',
+        REQUEST_AUTH_COMPOSITE_FALLBACK: 'unauthorized',
+    }
+    authenticator = provide_async_request_authenticator(config, make_logger(), make_async_credential_repository())
+
+    assert isinstance(authenticator, AsyncCompositeRequestAuthenticatorAdapter)
+    with pytest.raises(HTTPException):
+        asyncio.run(authenticator.authenticate(make_request('GET', 'https://example.com/path')))
+
+
+@pytest.mark.parametrize('config', [
+    {REQUEST_AUTH_COMPOSITE_SCHEMES: ''},
+    {REQUEST_AUTH_COMPOSITE_SCHEMES: 'OAuth'},
+    {REQUEST_AUTH_COMPOSITE_SCHEMES: 'OAuth:unknown'},
+    {REQUEST_AUTH_COMPOSITE_SCHEMES: 'OAuth:composite'},
+    {REQUEST_AUTH_COMPOSITE_SCHEMES: 'OAuth:oauth10a', REQUEST_AUTH_COMPOSITE_FALLBACK: 'unknown'},
+])
+def test_provider_should_return_unauthorized_request_authenticator_on_invalid_composite_config(
+        make_credential_repository,
+        make_logger,
+        config,
+):
+    errors = []
+    config = {REQUEST_AUTH_DRIVER: 'composite', **config}
+    authenticator = provide_request_authenticator(
+        config,
+        make_logger({'error': errors.append}),
+        make_credential_repository(),
+    )
+
+    assert isinstance(authenticator, UnauthorizedRequestAuthenticatorAdapter)
+    assert len(errors) == 1
@@ -0,0 +1,88 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import asyncio
+from typing import Dict
+
+import anyio
+import pytest
+from rndi.authentication.starlette.contract import AsyncCredentialsRepository, CredentialsRepository
+from rndi.authentication.starlette.repositories.bridges import (
+    AsyncToSyncCredentialsRepository,
+    SyncToAsyncCredentialsRepository,
+)
+
+CREDENTIALS = {'key': {'client_key': 'key', 'client_secret': 'secret', 'resource_owner_secret': ''}}
+
+
+class InMemoryCredentialsRepository(CredentialsRepository):
+    def get(self, key: str) -> Dict[str, str]:
+        return CREDENTIALS.get(key, {})
+
+
+@pytest.mark.parametrize('blocking', [True, False])
+def test_sync_to_async_credentials_repository_should_return_credentials(blocking):
+    repository = SyncToAsyncCredentialsRepository(InMemoryCredentialsRepository(), blocking=blocking)
+
+    assert asyncio.run(repository.get('key')) == CREDENTIALS['key']
+    assert asyncio.run(repository.get('unknown')) == {}
+
+
+def test_async_to_sync_credentials_repository_should_return_credentials_outside_event_loop(
+        make_async_credential_repository,
+):
+    repository = AsyncToSyncCredentialsRepository(make_async_credential_repository(CREDENTIALS))
+
+    assert repository.get('key') == CREDENTIALS['key']
+
+
+def test_async_to_sync_credentials_repository_should_return_credentials_from_worker_thread(
+        make_async_credential_repository,
+):
+    repository = AsyncToSyncCredentialsRepository(make_async_credential_repository(CREDENTIALS))
+
+    async def main():
+        return await anyio.to_thread.run_sync(repository.get, 'key')
+
+    assert anyio.run(main) == CREDENTIALS['key']
+
+
+def test_async_to_sync_credentials_repository_should_reject_calls_from_the_event_loop_thread(
+        make_async_credential_repository,
+):
+    repository = AsyncToSyncCredentialsRepository(make_async_credential_repository(CREDENTIALS))
+
+    async def main():
+        return repository.get('key')
+
+    with pytest.raises(RuntimeError, match='provide_async_request_authenticator'):
+        asyncio.run(main())
+
+
+def test_async_to_sync_credentials_repository_should_propagate_repository_errors():
+    class FailingAsyncCredentialsRepository(AsyncCredentialsRepository):
+        async def get(self, key: str) -> Dict[str, str]:
+            raise RuntimeError('backend down')
+
+    repository = AsyncToSyncCredentialsRepository(FailingAsyncCredentialsRepository())
+
+    async def main():
+        return await anyio.to_thread.run_sync(repository.get, 'key')
+
+    with pytest.raises(RuntimeError, match='backend down'):
+        anyio.run(main)
+
+
+@pytest.mark.parametrize('blocking', [True, False])
+def test_sync_to_async_credentials_repository_should_return_many_credentials(blocking):
+    repository = SyncToAsyncCredentialsRepository(InMemoryCredentialsRepository(), blocking=blocking)
+
+    assert asyncio.run(repository.get_many(['key', 'unknown'])) == {'key': CREDENTIALS['key'], 'unknown': {}}
+
+
+def test_async_to_sync_credentials_repository_should_return_many_credentials(make_async_credential_repository):
+    repository = AsyncToSyncCredentialsRepository(make_async_credential_repository(CREDENTIALS))
+
+    assert repository.get_many(iter(['key', 'unknown', 'key'])) == {'key': CREDENTIALS['key'], 'unknown': {}}
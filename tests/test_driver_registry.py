@@ -0,0 +1,200 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import subprocess
+import sys
+from importlib.metadata import EntryPoint
+from logging import LoggerAdapter
+
+import pytest
+from starlette.exceptions import HTTPException
+from starlette.requests import Request
+from rndi.authentication.starlette import provider, registry
+from rndi.authentication.starlette.adapters.oauth10a import OAuth10aRequestAuthenticatorAdapter
+from rndi.authentication.starlette.adapters.unauthorized import UnauthorizedRequestAuthenticatorAdapter
+from rndi.authentication.starlette.contract import CredentialsRepository, RequestAuthenticator
+from rndi.authentication.starlette.provider import provide_request_authenticator, REQUEST_AUTH_DRIVER
+from rndi.authentication.starlette.ratelimit import REQUEST_AUTH_RATE_LIMIT, REQUEST_AUTH_RATE_LIMIT_BURST
+from rndi.authentication.starlette.registry import (
+    AuthenticatorCache,
+    BUILTIN_DRIVERS,
+    DriverRegistry,
+    ENTRY_POINT_GROUP,
+    fingerprint,
+)
+
+AUTHORIZATION = (
+    'OAuth oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8",oauth_signature_method="HMAC-SHA1",'
+    'oauth_timestamp="1686919540",oauth_nonce="RZQd4m3S0Iu",oauth_version="1.0",'
+    'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"'
+)
+
+
+class PluginRequestAuthenticator(RequestAuthenticator):
+    def authenticate(self, request: Request):
+        pass
+
+
+def provide_plugin_request_authenticator(config: dict, logger: LoggerAdapter, _: CredentialsRepository):
+    return PluginRequestAuthenticator()
+
+
+@pytest.fixture
+def plugin_entry_points(monkeypatch):
+    calls = []
+
+    def entry_points(group: str):
+        calls.append(group)
+        return [EntryPoint('plugin', f'{__name__}:provide_plugin_request_authenticator', group)]
+
+    monkeypatch.setattr(registry, '_entry_points', entry_points)
+    return calls
+
+
+def test_driver_registry_should_resolve_drivers_lazily_by_name():
+    drivers = DriverRegistry(BUILTIN_DRIVERS)
+
+    assert 'oauth10a' in drivers
+    assert list(drivers.loaded()) == []
+
+    assert drivers['unauthorized'].__name__ == 'provide_unauthorized_request_authenticator'
+    assert list(drivers.loaded()) == ['unauthorized']
+
+    with pytest.raises(KeyError):
+        drivers['unknown']
+
+
+def test_driver_registry_should_discover_entry_points_once(plugin_entry_points):
+    drivers = DriverRegistry(BUILTIN_DRIVERS, ENTRY_POINT_GROUP)
+
+    assert drivers['oauth10a'] is not None
+    assert plugin_entry_points == []
+
+    assert drivers['plugin'] is provide_plugin_request_authenticator
+    assert 'unknown' not in drivers
+    assert set(drivers) == {'oauth10a', 'unauthorized', 'composite', 'jwt', 'plugin'}
+    assert plugin_entry_points == [ENTRY_POINT_GROUP]
+
+
+def test_driver_registry_should_prefer_registered_drivers(plugin_entry_points):
+    drivers = DriverRegistry(BUILTIN_DRIVERS, ENTRY_POINT_GROUP)
+    drivers.register('plugin', provide_plugin_request_authenticator)
+    drivers.register('unauthorized', f'{__name__}:provide_plugin_request_authenticator')
+
+    assert drivers['plugin'] is provide_plugin_request_authenticator
+    assert drivers['unauthorized'] is provide_plugin_request_authenticator
+
+
+def test_provider_should_build_entry_point_drivers(
+        make_credential_repository,
+        make_logger,
+        monkeypatch,
+        plugin_entry_points,
+):
+    monkeypatch.setattr(provider, 'sync_registry', DriverRegistry(BUILTIN_DRIVERS, ENTRY_POINT_GROUP))
+
+    authenticator = provide_request_authenticator(
+        {REQUEST_AUTH_DRIVER: 'plugin'},
+        make_logger(),
+        make_credential_repository(),
+    )
+
+    assert isinstance(authenticator, PluginRequestAuthenticator)
+
+
+def test_provider_should_memoize_the_authenticators(make_credential_repository, make_logger):
+    logger = make_logger()
+    repository = make_credential_repository()
+    config = {REQUEST_AUTH_DRIVER: 'oauth10a', 'OTHER': 'value'}
+
+    authenticator = provide_request_authenticator(config, logger, repository, cache=True)
+
+    assert isinstance(authenticator, OAuth10aRequestAuthenticatorAdapter)
+    assert provide_request_authenticator(
+        {'OTHER': 'value', REQUEST_AUTH_DRIVER: 'oauth10a'},
+        logger,
+        repository,
+        cache=True,
+    ) is authenticator
+    assert provide_request_authenticator({**config, 'OTHER': 'changed'}, logger, repository, cache=True) \
+        is not authenticator
+    assert provide_request_authenticator(config, logger, make_credential_repository(), cache=True) \
+        is not authenticator
+    assert provide_request_authenticator(config, logger, repository) is not authenticator
+
+
+def test_provider_should_not_share_state_by_default(make_credential_repository, make_logger, make_request):
+    config = {REQUEST_AUTH_DRIVER: 'oauth10a', REQUEST_AUTH_RATE_LIMIT: '0.1', REQUEST_AUTH_RATE_LIMIT_BURST: '1'}
+    logger = make_logger()
+    repository = make_credential_repository({'get': lambda _: {}})
+    first = provide_request_authenticator(config, logger, repository)
+    second = provide_request_authenticator(config, logger, repository)
+    other = provide_request_authenticator(config, logger, make_credential_repository({'get': lambda _: {}}))
+    assert first is not second and other is not first
+
+    # the rate limit of each provided authenticator is its own.
+    for authenticator in (first, second, other):
+        with pytest.raises(HTTPException) as e:
+            authenticator.authenticate(make_request('GET', 'https://example.com/', {'authorization': AUTHORIZATION}))
+        assert e.value.reason == 'invalid_credentials'
+
+
+def test_provider_should_retry_the_failures_after_an_interval(make_credential_repository, make_logger, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(provider, 'authenticator_cache', AuthenticatorCache(clock=lambda: now[0]))
+    errors = []
+    logger = make_logger({'error': errors.append})
+    repository = make_credential_repository()
+
+    fallbacks = [
+        provide_request_authenticator({REQUEST_AUTH_DRIVER: 'unknown'}, logger, repository, cache=True)
+        for _ in range(3)
+    ]
+    assert isinstance(fallbacks[0], UnauthorizedRequestAuthenticatorAdapter)
+    assert fallbacks[1] is fallbacks[0] and fallbacks[2] is fallbacks[0]
+    assert len(errors) == 1
+
+    now[0] = provider.FAILURE_RETRY_INTERVAL
+    assert provide_request_authenticator({REQUEST_AUTH_DRIVER: 'unknown'}, logger, repository, cache=True) \
+        is not fallbacks[0]
+    assert len(errors) == 2
+
+
+def test_authenticator_cache_should_evict_the_least_recently_used_entries():
+    cache = AuthenticatorCache(max_size=2)
+    references = (object(),)
+
+    cache.put('a', references, 'A')
+    cache.put('b', references, 'B')
+    assert cache.get('a', references) == 'A'
+    cache.put('c', references, 'C')
+
+    assert len(cache) == 2
+    assert cache.get('b', references) is None
+    assert cache.get('a', (object(),)) is None
+    assert cache.get('c', references) == 'C'
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_fingerprint_should_ignore_the_configuration_order():
+    assert fingerprint({'a': '1', 'b': 2}) == fingerprint({'b': 2, 'a': '1'})
+    assert fingerprint({'a': '1'}) != fingerprint({'a': 1})
+
+
+def test_provider_should_not_import_unused_drivers():
+    code = (
+        'import sys\n'
+        'from unittest.mock import MagicMock\n'
+        'from rndi.authentication.starlette.provider import provide_request_authenticator\n'
+        'assert not any(name.startswith("rndi.authentication.starlette.adapters.") for name in sys.modules)\n'
+        'provide_request_authenticator({}, MagicMock(), MagicMock())\n'
+        'assert "rndi.authentication.starlette.adapters.unauthorized" in sys.modules\n'
+        'assert "rndi.authentication.starlette.adapters.oauth10a" not in sys.modules\n'
+        'assert "oauthlib" not in sys.modules\n'
+    )
+
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,66 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from rndi.authentication.starlette.instrumentation import (
+    HistogramAuthenticationObserver,
+    NullAuthenticationObserver,
+    StageTimer,
+    start_timer,
+)
+
+
+def test_histogram_observer_should_export_prometheus_text():
+    observer = HistogramAuthenticationObserver(buckets=(0.001, 0.01))
+
+    observer.stage('oauth10a', 'parse', 0.0005)
+    observer.stage('oauth10a', 'parse', 0.001)
+    observer.stage('oauth10a', 'parse', 0.5)
+    observer.outcome('oauth10a', 'accepted', 0.005)
+
+    assert observer.export() == '\n'.join([
+        '# HELP rndi_authentication_stage_seconds Time spent in each authentication stage.',
+        '# TYPE rndi_authentication_stage_seconds histogram',
+        'rndi_authentication_stage_seconds_bucket{driver="oauth10a",stage="parse",le="0.001"} 2',
+        'rndi_authentication_stage_seconds_bucket{driver="oauth10a",stage="parse",le="0.01"} 2',
+        'rndi_authentication_stage_seconds_bucket{driver="oauth10a",stage="parse",le="+Inf"} 3',
+        'rndi_authentication_stage_seconds_sum{driver="oauth10a",stage="parse"} 0.5015',
+        'rndi_authentication_stage_seconds_count{driver="oauth10a",stage="parse"} 3',
+        '# HELP rndi_authentication_seconds Time spent authenticating requests.',
+        '# TYPE rndi_authentication_seconds histogram',
+        'rndi_authentication_seconds_bucket{driver="oauth10a",outcome="accepted",le="0.001"} 0',
+        'rndi_authentication_seconds_bucket{driver="oauth10a",outcome="accepted",le="0.01"} 1',
+        'rndi_authentication_seconds_bucket{driver="oauth10a",outcome="accepted",le="+Inf"} 1',
+        'rndi_authentication_seconds_sum{driver="oauth10a",outcome="accepted"} 0.005',
+        'rndi_authentication_seconds_count{driver="oauth10a",outcome="accepted"} 1',
+    ]) + '\n'
+
+
+def test_histogram_observer_should_escape_label_values():
+    observer = HistogramAuthenticationObserver(buckets=(1.0,))
+
+    observer.outcome('custom', 'bad "reason"\n', 0.1)
+
+    assert 'outcome="bad \\"reason\\"\\n"' in observer.export()
+
+
+def test_stage_timer_should_report_consecutive_stages_and_outcome(mocker):
+    observer = mocker.Mock()
+    timer = StageTimer(observer, 'oauth10a')
+
+    timer.lap('parse')
+    timer.lap('signature')
+    timer.done('accepted')
+
+    assert [c.args[:2] for c in observer.stage.call_args_list] == [('oauth10a', 'parse'), ('oauth10a', 'signature')]
+    assert observer.outcome.call_args.args[:2] == ('oauth10a', 'accepted')
+    assert observer.outcome.call_args.args[2] >= sum(c.args[2] for c in observer.stage.call_args_list)
+
+
+def test_start_timer_should_skip_timing_without_observer():
+    assert start_timer(None, 'oauth10a') is None
+    assert isinstance(start_timer(NullAuthenticationObserver(), 'oauth10a'), StageTimer)
+
+    NullAuthenticationObserver().stage('oauth10a', 'parse', 0.1)
+    NullAuthenticationObserver().outcome('oauth10a', 'accepted', 0.1)
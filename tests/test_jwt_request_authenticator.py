@@ -0,0 +1,327 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import asyncio
+from time import time
+
+import pytest
+from starlette.exceptions import HTTPException
+from rndi.authentication.starlette.adapters.composite import REQUEST_AUTH_COMPOSITE_SCHEMES
+from rndi.authentication.starlette.adapters.jwt import (
+    AsyncJWTRequestAuthenticatorAdapter,
+    JWTRequestAuthenticatorAdapter,
+    REQUEST_AUTH_JWT_ALGORITHMS,
+    REQUEST_AUTH_JWT_AUDIENCE,
+    REQUEST_AUTH_JWT_CACHE_SIZE,
+    REQUEST_AUTH_JWT_KEY_PREFIX,
+)
+from rndi.authentication.starlette.jwt.token import VerifiedTokenCache
+from rndi.authentication.starlette.provider import (
+    provide_async_request_authenticator,
+    provide_request_authenticator,
+    REQUEST_AUTH_DRIVER,
+)
+from rndi.authentication.starlette.ratelimit import TokenBucketRateLimiter
+from rndi.authentication.starlette.result import AuthResult
+
+LOCATION = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+NOW = 1686919540
+SECRET = 'Ylh2oDiCXh5ITeKXWGUvpWmgNDXJU0tC'
+CLAIMS = {'iss': 'https://issuer.example.com', 'sub': 'subscription-1', 'aud': 'connector', 'exp': NOW + 60}
+
+
+@pytest.fixture
+def lookups():
+    return []
+
+
+@pytest.fixture
+def repository(make_credential_repository, lookups):
+    def get(key: str):
+        lookups.append(key)
+        return {'jwt:key-1': {'client_secret': SECRET, 'tier': 'gold'}}.get(key)
+
+    return make_credential_repository({'get': get})
+
+
+def test_jwt_request_authenticator_should_authenticate_given_request(make_jwt, make_logger, make_request, repository):
+    request = make_request('GET', LOCATION, {
+        'authorization': f"Bearer {make_jwt(CLAIMS, header={'kid': 'key-1'})}",
+    })
+
+    authenticator = JWTRequestAuthenticatorAdapter(make_logger(), repository, clock=lambda: NOW)
+    result = authenticator.authenticate(request)
+
+    assert result == AuthResult('key-1', 'jwt', {'tier': 'gold', 'claims': CLAIMS})
+    assert request.state.auth_result is result
+
+
+def test_jwt_request_authenticator_should_skip_verification_of_verified_tokens(
+        make_jwt,
+        make_logger,
+        make_request,
+        mocker,
+        repository,
+        lookups,
+):
+    token = make_jwt(CLAIMS, header={'kid': 'key-1'})
+    observer = mocker.Mock()
+    now = [NOW]
+    authenticator = JWTRequestAuthenticatorAdapter(
+        make_logger(),
+        repository,
+        token_cache=VerifiedTokenCache(clock=lambda: now[0]),
+        observer=observer,
+        clock=lambda: now[0],
+    )
+
+    first = authenticator.authenticate(make_request('GET', LOCATION, {'authorization': f'Bearer {token}'}))
+    assert [c.args[1] for c in observer.stage.call_args_list] == [
+        'token_cache', 'parse', 'claims', 'credentials', 'signature',
+    ]
+
+    observer.reset_mock()
+    assert authenticator.authenticate(make_request('GET', LOCATION, {'authorization': f'Bearer {token}'})) is first
+    assert [c.args[1] for c in observer.stage.call_args_list] == ['token_cache']
+    assert observer.outcome.call_args.args[:2] == ('jwt', 'accepted')
+    assert lookups == ['jwt:key-1']
+
+    # the token is not accepted once expired.
+    now[0] = NOW + 60
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(make_request('GET', LOCATION, {'authorization': f'Bearer {token}'}))
+    assert e.value.reason == 'expired_token'
+
+
+@pytest.mark.parametrize('authorization, reason', [
+    (None, 'missing_token'),
+    ('OAuth oauth_consumer_key="key"', 'missing_token'),
+    ('Bearer not-a-token', 'malformed_token'),
+    ('Bearer eyJhbGciOiJub25lIn0.e30.c2ln', 'unsupported_algorithm'),
+])
+def test_jwt_request_authenticator_should_reject_malformed_tokens(
+        make_logger,
+        make_request,
+        repository,
+        lookups,
+        authorization,
+        reason,
+):
+    headers = {} if authorization is None else {'authorization': authorization}
+
+    with pytest.raises(HTTPException) as e:
+        JWTRequestAuthenticatorAdapter(make_logger(), repository).authenticate(make_request('GET', LOCATION, headers))
+
+    assert e.value.status_code == 401
+    assert e.value.reason == reason
+    assert e.value.headers['WWW-Authenticate'].startswith('Bearer')
+    assert lookups == []
+
+
+@pytest.mark.parametrize('claims, header, secret, reason', [
+    ({**CLAIMS, 'exp': NOW}, {'kid': 'key-1'}, SECRET, 'expired_token'),
+    ({**CLAIMS, 'aud': 'other'}, {'kid': 'key-1'}, SECRET, 'invalid_audience'),
+    ({'sub': 'subscription-1', 'exp': NOW + 60}, {}, SECRET, 'missing_key_id'),
+    (CLAIMS, {'kid': 'unknown'}, SECRET, 'invalid_credentials'),
+    (CLAIMS, {'kid': 'key-1'}, 'other', 'invalid_signature'),
+])
+def test_jwt_request_authenticator_should_reject_invalid_tokens(
+        make_jwt,
+        make_logger,
+        make_request,
+        repository,
+        claims,
+        header,
+        secret,
+        reason,
+):
+    request = make_request('GET', LOCATION, {'authorization': f'Bearer {make_jwt(claims, secret, header=header)}'})
+    authenticator = JWTRequestAuthenticatorAdapter(
+        make_logger(),
+        repository,
+        token_cache=VerifiedTokenCache(),
+        audience='connector',
+        clock=lambda: NOW,
+    )
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(request)
+
+    assert e.value.reason == reason
+    assert e.value.headers['WWW-Authenticate'] == 'Bearer error="invalid_token"'
+
+
+def test_jwt_request_authenticator_should_rate_limit_by_key_id(
+        make_jwt,
+        make_logger,
+        make_request,
+        repository,
+        lookups,
+):
+    token = make_jwt(CLAIMS, header={'kid': 'key-1'})
+    authenticator = JWTRequestAuthenticatorAdapter(
+        make_logger(),
+        repository,
+        token_cache=VerifiedTokenCache(clock=lambda: NOW),
+        rate_limiter=TokenBucketRateLimiter(rate=0.1, burst=1),
+        clock=lambda: NOW,
+    )
+
+    assert authenticator.authenticate(make_request('GET', LOCATION, {'authorization': f'Bearer {token}'}))
+
+    # the already verified tokens are rate limited too.
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(make_request('GET', LOCATION, {'authorization': f'Bearer {token}'}))
+
+    assert e.value.status_code == 429
+    assert e.value.reason == 'rate_limited'
+    assert e.value.headers == {'Retry-After': '10'}
+
+    # a new token of the same key is rejected before the key lookup.
+    other = make_jwt({**CLAIMS, 'sub': 'subscription-2'}, header={'kid': 'key-1'})
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(make_request('GET', LOCATION, {'authorization': f'Bearer {other}'}))
+
+    assert e.value.reason == 'rate_limited'
+    assert lookups == ['jwt:key-1']
+
+
+def test_jwt_request_authenticator_should_authenticate_rsa_tokens_by_issuer(
+        make_credential_repository,
+        make_jwt,
+        make_logger,
+        make_request,
+        make_rsa_key,
+):
+    key = make_rsa_key()
+    credentials = {f"jwt:{CLAIMS['iss']}": {'rsa_key': key.certificate}}
+    authenticator = JWTRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({'get': credentials.get}),
+        clock=lambda: NOW,
+    )
+
+    for algorithm in ('RS256', 'RS512'):
+        request = make_request('GET', LOCATION, {
+            'authorization': f'Bearer {make_jwt(CLAIMS, algorithm=algorithm, sign=key.sign)}',
+        })
+        assert authenticator.authenticate(request).consumer_key == CLAIMS['iss']
+
+    # the public key is never used as an HMAC secret.
+    request = make_request('GET', LOCATION, {'authorization': f'Bearer {make_jwt(CLAIMS, key.certificate)}'})
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(request)
+    assert e.value.reason == 'invalid_signature'
+
+
+def test_async_jwt_request_authenticator_should_authenticate_given_request(
+        make_async_credential_repository,
+        make_jwt,
+        make_logger,
+        make_request,
+):
+    request = make_request('GET', LOCATION, {
+        'authorization': f"Bearer {make_jwt(CLAIMS, header={'kid': 'key-1'})}",
+    })
+    authenticator = AsyncJWTRequestAuthenticatorAdapter(
+        make_logger(),
+        make_async_credential_repository({'jwt:key-1': {'client_secret': SECRET}}),
+        clock=lambda: NOW,
+    )
+
+    result = asyncio.run(authenticator.authenticate(request))
+
+    assert result.consumer_key == 'key-1'
+    assert result.attributes == {'claims': CLAIMS}
+
+
+def test_provider_should_build_the_jwt_driver_from_configuration(
+        make_async_credential_repository,
+        make_jwt,
+        make_logger,
+        make_request,
+        repository,
+        lookups,
+):
+    claims = {**CLAIMS, 'exp': int(time()) + 60}
+    config = {
+        REQUEST_AUTH_DRIVER: 'composite',
+        REQUEST_AUTH_COMPOSITE_SCHEMES: 'OAuth:oauth10a, Bearer:jwt',
+        REQUEST_AUTH_JWT_ALGORITHMS: 'HS256, HS512',
+        REQUEST_AUTH_JWT_AUDIENCE: 'connector',
+        REQUEST_AUTH_JWT_CACHE_SIZE: '0',
+    }
+    authenticator = provide_request_authenticator(config, make_logger(), repository, cache=False)
+    token = make_jwt(claims, header={'kid': 'key-1'})
+
+    for _ in range(2):
+        result = authenticator.authenticate(make_request('GET', LOCATION, {'authorization': f'Bearer {token}'}))
+        assert result.driver == 'jwt'
+    assert lookups == ['jwt:key-1', 'jwt:key-1']
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(make_request('GET', LOCATION, {
+            'authorization': f"Bearer {make_jwt(claims, header={'kid': 'key-1'}, algorithm='HS384')}",
+        }))
+    assert e.value.reason == 'unsupported_algorithm'
+
+    async_authenticator = provide_async_request_authenticator(
+        {REQUEST_AUTH_DRIVER: 'jwt', REQUEST_AUTH_JWT_AUDIENCE: 'connector'},
+        make_logger(),
+        make_async_credential_repository({'jwt:key-1': {'client_secret': SECRET}}),
+        cache=False,
+    )
+    assert isinstance(async_authenticator, AsyncJWTRequestAuthenticatorAdapter)
+    request = make_request('GET', LOCATION, {'authorization': f'Bearer {token}'})
+    assert asyncio.run(async_authenticator.authenticate(request)).consumer_key == 'key-1'
+
+
+def test_jwt_request_authenticator_should_not_use_the_oauth10a_consumer_secrets(
+        make_credential_repository,
+        make_jwt,
+        make_logger,
+        make_request,
+):
+    # the same repository holds the OAuth 1.0a consumer secret of key-1.
+    credentials = {'key-1': {'client_secret': SECRET}}
+    request = make_request('GET', LOCATION, {
+        'authorization': f"Bearer {make_jwt(CLAIMS, header={'kid': 'key-1'})}",
+    })
+
+    with pytest.raises(HTTPException) as e:
+        JWTRequestAuthenticatorAdapter(
+            make_logger(),
+            make_credential_repository({'get': credentials.get}),
+            clock=lambda: NOW,
+        ).authenticate(request)
+
+    assert e.value.reason == 'invalid_credentials'
+
+    # an empty prefix shares the keys on purpose.
+    authenticator = JWTRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({'get': credentials.get}),
+        key_prefix='',
+        clock=lambda: NOW,
+    )
+    assert authenticator.authenticate(request).consumer_key == 'key-1'
+
+
+def test_provider_should_require_the_jwt_audience(make_jwt, make_logger, make_request, repository, lookups):
+    errors = []
+    authenticator = provide_request_authenticator(
+        {REQUEST_AUTH_DRIVER: 'jwt', REQUEST_AUTH_JWT_KEY_PREFIX: 'jwt:'},
+        make_logger({'error': errors.append}),
+        repository,
+        cache=False,
+    )
+
+    assert not isinstance(authenticator, JWTRequestAuthenticatorAdapter)
+    assert 'REQUEST_AUTH_JWT_AUDIENCE' in errors[0]
+    with pytest.raises(HTTPException):
+        authenticator.authenticate(make_request('GET', LOCATION, {
+            'authorization': f"Bearer {make_jwt(CLAIMS, header={'kid': 'key-1'})}",
+        }))
+    assert lookups == []
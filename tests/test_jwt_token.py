@@ -0,0 +1,159 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from base64 import urlsafe_b64encode
+
+import pytest
+from rndi.authentication.starlette.jwt.signature import provide_jwt_signature_verifiers
+from rndi.authentication.starlette.jwt.token import (
+    bearer_token,
+    EXPIRED_TOKEN,
+    IMMATURE_TOKEN,
+    INVALID_AUDIENCE,
+    INVALID_CLAIM,
+    INVALID_ISSUER,
+    JWTError,
+    MALFORMED_TOKEN,
+    MAX_TOKEN_LENGTH,
+    MISSING_CLAIM,
+    MISSING_TOKEN,
+    parse_token,
+    TOKEN_TOO_LONG,
+    validate_claims,
+    VerifiedTokenCache,
+)
+from rndi.authentication.starlette.oauth10a.signature import Credential
+from rndi.authentication.starlette.result import AuthResult
+
+
+def test_parse_token_should_decode_header_and_claims(make_jwt):
+    token = parse_token(make_jwt({'iss': 'issuer', 'exp': 1686919540}, header={'kid': 'key-1'}))
+
+    assert token.algorithm == 'HS256'
+    assert token.key_id == 'key-1'
+    assert token.claims == {'iss': 'issuer', 'exp': 1686919540}
+    assert token.signing_input.count(b'.') == 1
+    assert len(token.signature) == 32
+
+
+def test_parse_token_should_use_the_issuer_as_key_id_without_kid(make_jwt):
+    assert parse_token(make_jwt({'iss': 'issuer'})).key_id == 'issuer'
+    assert parse_token(make_jwt({'sub': 'subject'})).key_id is None
+
+
+@pytest.mark.parametrize('token, reason', [
+    ('a' * (MAX_TOKEN_LENGTH + 1), TOKEN_TOO_LONG),
+    ('not-a-token', MALFORMED_TOKEN),
+    ('eyJhbGciOiJIUzI1NiJ9.e30', MALFORMED_TOKEN),
+    ('eyJhbGciOiJIUzI1NiJ9.e30.', MALFORMED_TOKEN),
+    ('eyJhbGciOiJIUzI1NiJ9.e30=.c2ln', MALFORMED_TOKEN),
+    ('eyJhbGciOiJIUzI1NiJ9.W10.c2ln', MALFORMED_TOKEN),
+    ('e30.e30.c2ln', MALFORMED_TOKEN),
+    ('eyJhbGciOiJIUzI1NiJ9.bm90IGpzb24.c2ln', MALFORMED_TOKEN),
+    ('eyJhbGciOiJIUzI1NiJ9.e30.c2lnb', MALFORMED_TOKEN),
+])
+def test_parse_token_should_reject_malformed_tokens(token, reason):
+    with pytest.raises(JWTError) as e:
+        parse_token(token)
+
+    assert e.value.reason == reason
+    assert e.value.detail == 'malformed bearer token'
+
+
+@pytest.mark.parametrize('claims', [b'{"exp": NaN}', b'{"exp": Infinity}', b'{"exp": 1000, "nbf": NaN}'])
+def test_validate_claims_should_reject_non_finite_json_numeric_dates(claims):
+    token = parse_token(f"eyJhbGciOiJIUzI1NiJ9.{urlsafe_b64encode(claims).decode('ascii').rstrip('=')}.c2ln")
+
+    with pytest.raises(JWTError) as e:
+        validate_claims(token.claims, 900)
+
+    assert e.value.reason == INVALID_CLAIM
+
+
+@pytest.mark.parametrize('authorization, token', [
+    ('Bearer abc.def.ghi', 'abc.def.ghi'),
+    ('bearer  abc.def.ghi ', 'abc.def.ghi'),
+])
+def test_bearer_token_should_extract_the_token(authorization, token):
+    assert bearer_token(authorization) == token
+
+
+@pytest.mark.parametrize('authorization', [None, 'OAuth oauth_consumer_key="key"', 'Bearer'])
+def test_bearer_token_should_reject_other_schemes(authorization):
+    with pytest.raises(JWTError) as e:
+        bearer_token(authorization)
+
+    assert e.value.reason == MISSING_TOKEN
+
+
+def test_validate_claims_should_return_the_expiration_with_leeway():
+    assert validate_claims({'exp': 1000}, 900) == 1000
+    assert validate_claims({'exp': 1000, 'nbf': 950}, 940, leeway=30) == 1030
+    assert validate_claims({'exp': 1000, 'aud': ['a', 'b'], 'iss': 'i'}, 900, audience='b', issuer='i') == 1000
+
+
+@pytest.mark.parametrize('claims, now, reason', [
+    ({}, 900, MISSING_CLAIM),
+    ({'exp': '1000'}, 900, INVALID_CLAIM),
+    ({'exp': True}, 0, INVALID_CLAIM),
+    ({'exp': float('nan')}, 900, INVALID_CLAIM),
+    ({'exp': float('inf')}, 900, INVALID_CLAIM),
+    ({'exp': 1000, 'nbf': float('nan')}, 900, INVALID_CLAIM),
+    ({'exp': 1000, 'nbf': float('-inf')}, 900, INVALID_CLAIM),
+    ({'exp': 1000}, 1000, EXPIRED_TOKEN),
+    ({'exp': 1000, 'nbf': 950}, 900, IMMATURE_TOKEN),
+    ({'exp': 1000, 'aud': 'other'}, 900, INVALID_AUDIENCE),
+    ({'exp': 1000, 'aud': 'audience', 'iss': 'other'}, 900, INVALID_ISSUER),
+])
+def test_validate_claims_should_reject_invalid_claims(claims, now, reason):
+    with pytest.raises(JWTError) as e:
+        validate_claims(claims, now, audience='audience', issuer='issuer')
+
+    assert e.value.reason == reason
+
+
+def test_verified_token_cache_should_expire_and_evict_tokens():
+    now = [1000.0]
+    cache = VerifiedTokenCache(max_size=2, max_ttl=60, clock=lambda: now[0])
+    result = AuthResult('key', 'jwt')
+
+    cache.put('a', 1030, result)
+    cache.put('b', 2000, result)
+    assert cache.get('a') is result
+    cache.put('c', 2000, result)
+
+    assert len(cache) == 2
+    assert cache.get('b') is None
+
+    now[0] = 1030
+    assert cache.get('a') is None
+    assert cache.get('c') is result
+
+    # the entries never outlive max_ttl.
+    now[0] = 1060
+    assert cache.get('c') is None
+    assert len(cache) == 0
+
+
+def test_verified_token_cache_should_reject_invalid_configuration():
+    with pytest.raises(ValueError):
+        VerifiedTokenCache(max_size=0)
+
+
+@pytest.mark.parametrize('algorithm', ['HS256', 'HS384', 'HS512'])
+def test_jwt_hmac_signature_verifier_should_verify_with_the_raw_secret(make_jwt, algorithm):
+    token = parse_token(make_jwt({'iss': 'issuer'}, secret='secret', algorithm=algorithm))
+    verifier = provide_jwt_signature_verifiers()[algorithm]
+
+    assert verifier.verify_digest(Credential('issuer', 'secret'), token.signing_input, token.signature)
+    assert not verifier.verify_digest(Credential('issuer', 'other'), token.signing_input, token.signature)
+    assert not verifier.verify_digest(Credential('issuer', rsa_key='secret'), token.signing_input, token.signature)
+
+
+def test_provide_jwt_signature_verifiers_should_reject_unavailable_algorithms():
+    assert list(provide_jwt_signature_verifiers(['HS512'])) == ['HS512']
+
+    with pytest.raises(ValueError):
+        provide_jwt_signature_verifiers(['HS256', 'none'])
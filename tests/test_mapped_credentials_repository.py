@@ -0,0 +1,93 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import mmap
+
+import pytest
+from rndi.authentication.starlette.repositories import mapped
+from rndi.authentication.starlette.repositories.mapped import dump_credentials, MappedJSONCredentialsRepository
+
+CREDENTIALS = [
+    {'client_key': 'key-1', 'client_secret': 'secret-1', 'resource_owner_secret': ''},
+    {'client_key': 'key-2', 'client_secret': 'sécret-2', 'resource_owner_secret': ''},
+]
+
+
+def test_mapped_json_credentials_repository_should_get_credentials(tmp_path):
+    path = str(tmp_path / 'credentials.jsonl')
+    dump_credentials(path, CREDENTIALS)
+
+    repository = MappedJSONCredentialsRepository(path)
+
+    assert len(repository) == 2
+    assert repository.get('key-1') == CREDENTIALS[0]
+    assert repository.get('key-2') == CREDENTIALS[1]
+    assert repository.get('unknown') == {}
+    assert repository.get_many(['key-2', 'unknown']) == {'key-2': CREDENTIALS[1], 'unknown': {}}
+
+    repository.close()
+
+
+def test_mapped_json_credentials_repository_should_reload_replaced_files(tmp_path):
+    path = str(tmp_path / 'credentials.jsonl')
+    dump_credentials(path, CREDENTIALS)
+    repository = MappedJSONCredentialsRepository(path)
+
+    dump_credentials(path, [{'client_key': 'key-3', 'client_secret': 'secret-3'}])
+    assert repository.get('key-1') == CREDENTIALS[0]
+
+    repository.reload()
+    assert repository.get('key-1') == {}
+    assert repository.get('key-3') == {'client_key': 'key-3', 'client_secret': 'secret-3'}
+
+
+def test_mapped_json_credentials_repository_should_close_the_previous_mapping_on_reload(tmp_path, monkeypatch):
+    mappings = []
+    reloads = []
+
+    class RecordingMap(mmap.mmap):
+        def __new__(cls, *args, **kwargs):
+            mappings.append(super().__new__(cls, *args, **kwargs))
+            return mappings[-1]
+
+        def __getitem__(self, index):
+            # a reload closes the mapping of a lookup in progress.
+            while reloads:
+                reloads.pop()()
+            return super().__getitem__(index)
+
+    monkeypatch.setattr(mapped.mmap, 'mmap', RecordingMap)
+    path = str(tmp_path / 'credentials.jsonl')
+    dump_credentials(path, CREDENTIALS)
+    repository = MappedJSONCredentialsRepository(path)
+
+    repository.reload()
+    assert [mapping.closed for mapping in mappings] == [True, False]
+
+    dump_credentials(path, [{**CREDENTIALS[0], 'client_secret': 'rotated'}])
+    reloads.append(repository.reload)
+    assert repository.get('key-1')['client_secret'] == 'rotated'
+    assert [mapping.closed for mapping in mappings] == [True, True, False]
+
+    repository.close()
+    assert mappings[-1].closed
+
+
+def test_mapped_json_credentials_repository_should_accept_empty_files_and_blank_lines(tmp_path):
+    empty = tmp_path / 'empty.jsonl'
+    empty.write_bytes(b'')
+    assert len(MappedJSONCredentialsRepository(str(empty))) == 0
+
+    blank = tmp_path / 'blank.jsonl'
+    blank.write_bytes(b'\n{"id": "key-1", "client_secret": "s"}\n\n')
+    assert MappedJSONCredentialsRepository(str(blank), key='id').get('key-1') == {'id': 'key-1', 'client_secret': 's'}
+
+
+def test_mapped_json_credentials_repository_should_reject_invalid_files(tmp_path):
+    path = tmp_path / 'invalid.jsonl'
+    path.write_bytes(b'{"client_key": "key-1"}\n{"client_secret": "no key"}\n')
+
+    with pytest.raises(ValueError, match='byte 24'):
+        MappedJSONCredentialsRepository(str(path))
@@ -0,0 +1,304 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import asyncio
+import json
+from typing import List, Optional
+
+import pytest
+from oauthlib import oauth1
+from starlette.exceptions import HTTPException
+from starlette.requests import HTTPConnection, Request
+from rndi.authentication.starlette.adapters.oauth10a import (
+    AsyncOAuth10aRequestAuthenticatorAdapter,
+    OAuth10aRequestAuthenticatorAdapter,
+)
+from rndi.authentication.starlette.contract import AsyncRequestAuthenticator, RequestAuthenticator
+from rndi.authentication.starlette.middleware import RequestAuthenticatorMiddleware
+from rndi.authentication.starlette.oauth10a.body import body_request, DeferredRequest
+
+AUTHORIZATION = (
+    'OAuth '
+    'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+    'oauth_signature_method="HMAC-SHA1", '
+    'oauth_timestamp="1686919540", '
+    'oauth_nonce="RZQd4m3S0Iu", '
+    'oauth_version="1.0",'
+    'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"'
+)
+
+CREDENTIALS = {
+    'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8': {
+        'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                         'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+        'resource_owner_secret': '',
+    },
+}
+
+
+async def application(scope, receive, send):
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': b'OK'})
+
+
+def call(app, path: str, authorization: Optional[str] = None, scope_type: str = 'http') -> List[dict]:
+    headers = [(b'host', b'cosmopolitan.aks.int.zone')]
+    if authorization is not None:
+        headers.append((b'authorization', authorization.encode('latin-1')))
+
+    scope = {
+        'type': scope_type,
+        'method': 'GET',
+        'scheme': 'https',
+        'path': path,
+        'query_string': b'',
+        'headers': headers,
+        'server': ('cosmopolitan.aks.int.zone', 443),
+    }
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+@pytest.mark.parametrize('threadpool', [True, False])
+def test_middleware_should_pass_authenticated_request_to_app(
+        make_credential_repository,
+        make_logger,
+        threadpool,
+):
+    middleware = RequestAuthenticatorMiddleware(
+        application,
+        OAuth10aRequestAuthenticatorAdapter(
+            make_logger(),
+            make_credential_repository({'get': lambda key: CREDENTIALS.get(key, {})}),
+        ),
+        threadpool=threadpool,
+    )
+
+    messages = call(middleware, '/aps/2/collections/service-plans', AUTHORIZATION)
+
+    assert messages[0]['status'] == 200
+
+
+def test_middleware_should_support_async_authenticators(
+        make_async_credential_repository,
+        make_logger,
+):
+    middleware = RequestAuthenticatorMiddleware(
+        application,
+        AsyncOAuth10aRequestAuthenticatorAdapter(make_logger(), make_async_credential_repository(CREDENTIALS)),
+    )
+
+    assert call(middleware, '/aps/2/collections/service-plans', AUTHORIZATION)[0]['status'] == 200
+    assert call(middleware, '/aps/2/collections/service-plans')[0]['status'] == 401
+
+
+def test_middleware_should_respond_401_on_unauthenticated_request(
+        make_async_credential_repository,
+        make_logger,
+):
+    middleware = RequestAuthenticatorMiddleware(
+        application,
+        AsyncOAuth10aRequestAuthenticatorAdapter(make_logger(), make_async_credential_repository()),
+    )
+
+    messages = call(middleware, '/aps/2/collections/service-plans', AUTHORIZATION)
+
+    assert messages[0]['status'] == 401
+    assert (b'content-type', b'application/json') in messages[0]['headers']
+    assert json.loads(messages[1]['body']) == {'detail': 'Unauthenticated, invalid client/consumer key.'}
+
+
+def test_middleware_should_forward_exception_headers():
+    class ThrottledRequestAuthenticator(AsyncRequestAuthenticator):
+        async def authenticate(self, _: HTTPConnection):
+            raise HTTPException(status_code=429, detail='Too Many Requests', headers={'Retry-After': '1'})
+
+    messages = call(RequestAuthenticatorMiddleware(application, ThrottledRequestAuthenticator()), '/')
+
+    assert messages[0]['status'] == 429
+    assert (b'retry-after', b'1') in messages[0]['headers']
+
+
+@pytest.mark.parametrize('path, include, exclude, status', [
+    ('/api/items', None, None, 401),
+    ('/api/items', ['/api'], None, 401),
+    ('/health', ['/api'], None, 200),
+    ('/api/public/items', ['/api'], ['/api/public'], 200),
+    ('/docs', None, ['/docs', '/openapi.json'], 200),
+    ('/apiary', ['/api'], None, 200),
+    ('/api', ['/api/'], None, 401),
+    ('/api/', ['/api'], None, 401),
+    ('/docsearch', None, ['/docs'], 401),
+    ('/docs/oauth2-redirect', None, ['/docs/'], 200),
+    ('/anything', ['/'], None, 401),
+])
+def test_middleware_should_apply_include_and_exclude_rules(path, include, exclude, status):
+    class DenyRequestAuthenticator(RequestAuthenticator):
+        def authenticate(self, _: HTTPConnection):
+            raise HTTPException(status_code=401, detail='Unauthenticated.')
+
+    middleware = RequestAuthenticatorMiddleware(
+        application,
+        DenyRequestAuthenticator(),
+        include=include,
+        exclude=exclude,
+        threadpool=False,
+    )
+
+    assert call(middleware, path)[0]['status'] == status
+
+
+def test_middleware_should_only_build_the_request_to_read_the_body():
+    connections = []
+
+    class RecordingRequestAuthenticator(AsyncRequestAuthenticator):
+        async def authenticate(self, connection: HTTPConnection):
+            connections.append(connection)
+
+    middleware = RequestAuthenticatorMiddleware(application, RecordingRequestAuthenticator())
+    call(middleware, '/aps/2/collections/service-plans')
+    call(middleware, '/ws', scope_type='websocket')
+
+    assert type(connections[0]) is DeferredRequest
+    assert type(connections[1]) is HTTPConnection
+    request = body_request(connections[0])
+    assert isinstance(request, Request) and body_request(connections[0]) is request
+    assert body_request(connections[1]) is None
+
+
+def test_middleware_should_close_unauthenticated_websocket():
+    class DenyRequestAuthenticator(AsyncRequestAuthenticator):
+        async def authenticate(self, _: HTTPConnection):
+            raise HTTPException(status_code=401, detail='Unauthenticated.')
+
+    middleware = RequestAuthenticatorMiddleware(application, DenyRequestAuthenticator())
+
+    assert call(middleware, '/ws', scope_type='websocket') == [{'type': 'websocket.close', 'code': 1008}]
+
+
+async def echo_application(scope, receive, send):
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+    await send({'type': 'http.response.start', 'status': 200, 'headers': []})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def call_form(app, body: bytes, signed_body: Optional[bytes] = None) -> List[dict]:
+    url = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    client = oauth1.Client(
+        'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        client_secret=CREDENTIALS['wotAQOwTUXZrkZqfOMrpEAtTC362SJi8']['client_secret'],
+    )
+    _, headers, _ = client.sign(
+        url,
+        http_method='POST',
+        body=(body if signed_body is None else signed_body).decode(),
+        headers={'Content-Type': 'application/x-www-form-urlencoded'},
+    )
+
+    scope = {
+        'type': 'http',
+        'method': 'POST',
+        'scheme': 'https',
+        'path': '/aps/2/collections/service-plans',
+        'query_string': b'',
+        'headers': [
+            (b'host', b'cosmopolitan.aks.int.zone'),
+            (b'content-type', b'application/x-www-form-urlencoded'),
+            (b'authorization', headers['Authorization'].encode('latin-1')),
+        ],
+        'server': ('cosmopolitan.aks.int.zone', 443),
+    }
+    # the body is streamed in small chunks.
+    chunks = [body[i:i + 8] for i in range(0, len(body), 8)] or [b'']
+    received = [{'type': 'http.request', 'body': chunk, 'more_body': True} for chunk in chunks[:-1]]
+    received.append({'type': 'http.request', 'body': chunks[-1], 'more_body': False})
+    messages = []
+
+    async def receive():
+        return received.pop(0) if received else {'type': 'http.disconnect'}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+@pytest.mark.parametrize('asynchronous', [True, False])
+def test_middleware_should_verify_form_body_and_replay_it_to_the_app(
+        make_async_credential_repository,
+        make_credential_repository,
+        make_logger,
+        asynchronous,
+):
+    if asynchronous:
+        authenticator = AsyncOAuth10aRequestAuthenticatorAdapter(
+            make_logger(),
+            make_async_credential_repository(CREDENTIALS),
+        )
+    else:
+        authenticator = OAuth10aRequestAuthenticatorAdapter(
+            make_logger(),
+            make_credential_repository({'get': lambda key: CREDENTIALS.get(key, {})}),
+        )
+    middleware = RequestAuthenticatorMiddleware(echo_application, authenticator)
+    body = b'name=some+value&plan=premium&unicode=caf%C3%A9&empty='
+
+    messages = call_form(middleware, body)
+    assert messages[0]['status'] == 200
+    assert messages[1]['body'] == body
+
+    messages = call_form(middleware, body, signed_body=b'name=other+value&plan=premium&unicode=caf%C3%A9&empty=')
+    assert messages[0]['status'] == 401
+
+
+def test_middleware_should_reject_form_bodies_over_the_limit(make_async_credential_repository, make_logger):
+    middleware = RequestAuthenticatorMiddleware(
+        echo_application,
+        AsyncOAuth10aRequestAuthenticatorAdapter(
+            make_logger(),
+            make_async_credential_repository(CREDENTIALS),
+            max_body_size=64,
+        ),
+    )
+
+    messages = call_form(middleware, b'name=' + b'x' * 128)
+
+    assert messages[0]['status'] == 413
+    assert json.loads(messages[1]['body']) == {'detail': 'Unauthenticated, the request body is too large.'}
+
+
+def test_middleware_should_reject_unread_form_bodies_of_sync_authenticators_without_threadpool(
+        make_credential_repository,
+        make_logger,
+):
+    middleware = RequestAuthenticatorMiddleware(
+        echo_application,
+        OAuth10aRequestAuthenticatorAdapter(
+            make_logger(),
+            make_credential_repository({'get': lambda key: CREDENTIALS.get(key, {})}),
+        ),
+        threadpool=False,
+    )
+
+    messages = call_form(middleware, b'name=some+value&plan=premium')
+
+    assert messages[0]['status'] == 400
+    assert json.loads(messages[1]['body']) == {'detail': 'Unauthenticated, unable to read the request body.'}
@@ -0,0 +1,98 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from urllib.parse import parse_qsl, urlencode
+
+import pytest
+from oauthlib.oauth1.rfc5849 import signature as oauth
+from rndi.authentication.starlette.oauth10a.base_string import (
+    base_string_uri,
+    escape,
+    normalize_parameters,
+    signature_base_string,
+)
+
+PROTOCOL_PARAMETERS = {
+    'oauth_consumer_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+    'oauth_signature_method': 'HMAC-SHA1',
+    'oauth_timestamp': '1686919540',
+    'oauth_nonce': 'RZQd4m3S0Iu',
+    'oauth_version': '1.0',
+}
+
+
+@pytest.mark.parametrize('value', [
+    '',
+    'abcXYZ019-._~',
+    'a b+c/d=e&f%g',
+    '!*\'();:@&=+$,/?#[]',
+    'café ñ 日本',
+    '\x00\x7f',
+])
+def test_escape_should_match_oauthlib_reference(value):
+    assert escape(value) == oauth.utils.escape(value)
+
+
+@pytest.mark.parametrize('scheme, host, path, expected', [
+    ('https', 'cosmopolitan.aks.int.zone', '/aps/2', 'https://cosmopolitan.aks.int.zone/aps/2'),
+    ('HTTPS', 'Cosmopolitan.AKS.int.zone:443', '/aps/2', 'https://cosmopolitan.aks.int.zone/aps/2'),
+    ('http', 'example.com:80', '', 'http://example.com/'),
+    ('http', 'example.com:8080', '/a%20b', 'http://example.com:8080/a%20b'),
+    ('https', 'example.com:8443', '/', 'https://example.com:8443/'),
+    ('https', '[::1]:443', '/', 'https://[::1]/'),
+])
+def test_base_string_uri_should_match_oauthlib_reference(scheme, host, path, expected):
+    assert base_string_uri(scheme, host, path) == expected
+    assert oauth.base_string_uri(f'{scheme}://{host}{path}') == expected
+
+
+@pytest.mark.parametrize('scheme, host, expected', [
+    ('https', '443', 'https://443/'),
+    ('http', '80', 'http://80/'),
+    ('https', '', 'https:///'),
+])
+def test_base_string_uri_should_keep_hosts_equal_to_the_default_port(scheme, host, expected):
+    assert base_string_uri(scheme, host, '/') == expected
+
+
+@pytest.mark.parametrize('query', [
+    {},
+    {'limit': '10', 'offset': '0'},
+    {'filter': 'name eq "some value"', 'b': 'x/y?z', 'empty': ''},
+    {'unicode': 'café', 'plus': 'a+b', 'a': 'z'},
+    {f'key{i}': f'value {i}' for i in range(200)},
+])
+def test_signature_base_string_should_match_oauthlib_reference(query):
+    query_string = urlencode(query)
+    uri = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+
+    parameters = oauth.collect_parameters(uri_query=query_string)
+    parameters.extend(PROTOCOL_PARAMETERS.items())
+    expected = oauth.signature_base_string('get', uri, oauth.normalize_parameters(parameters))
+
+    assert signature_base_string('get', uri, query_string, PROTOCOL_PARAMETERS) == expected
+
+
+def test_signature_base_string_should_include_form_body_parameters():
+    uri = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    body = urlencode({'name': 'some value', 'offset': '1', 'unicode': 'café'})
+
+    parameters = oauth.collect_parameters(uri_query='offset=0', body=body)
+    parameters.extend(PROTOCOL_PARAMETERS.items())
+    expected = oauth.signature_base_string('post', uri, oauth.normalize_parameters(parameters))
+
+    assert signature_base_string(
+        'post',
+        uri,
+        'offset=0',
+        PROTOCOL_PARAMETERS,
+        parse_qsl(body, keep_blank_values=True),
+    ) == expected
+
+
+def test_normalize_parameters_should_sort_repeated_names_by_value():
+    parameters = [('a', '2'), ('a', '1'), ('c', ''), ('b', 'x y')]
+
+    assert normalize_parameters(parameters) == oauth.normalize_parameters(parameters) == 'a=1&a=2&b=x%20y&c='
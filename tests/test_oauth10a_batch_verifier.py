@@ -0,0 +1,206 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+import pytest
+from oauthlib import oauth1
+from rndi.authentication.starlette.adapters.oauth10a import (
+    INVALID_CREDENTIALS,
+    INVALID_DESCRIPTOR,
+    INVALID_SIGNATURE,
+    OAuth10aBatchVerifier,
+)
+from rndi.authentication.starlette.batch import descriptor_scope, RequestDescriptor
+from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.oauth10a.body import BODY_TOO_LARGE
+from rndi.authentication.starlette.oauth10a.prevalidation import MISSING_HEADER
+
+URL = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+
+CREDENTIALS = {
+    'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8': {
+        'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                         'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+        'resource_owner_secret': '',
+    },
+    'other-key': {
+        'client_key': 'other-key',
+        'client_secret': 'other-secret',
+        'resource_owner_secret': '',
+    },
+}
+
+
+class InMemoryCredentialsRepository(CredentialsRepository):
+    def __init__(self):
+        self.lookups: List[List[str]] = []
+
+    def get(self, key: str) -> Dict[str, str]:
+        raise AssertionError('the credentials should be recovered with get_many')
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, str]]:
+        self.lookups.append(sorted(keys))
+        return {key: CREDENTIALS[key] for key in keys if key in CREDENTIALS}
+
+
+@pytest.fixture
+def make_descriptors(make_oauth10a_authorization):
+    def __():
+        return [
+            RequestDescriptor('GET', f'{URL}?offset=0', {
+                'Authorization': make_oauth10a_authorization('GET', f'{URL}?offset=0'),
+            }),
+            RequestDescriptor('GET', f'{URL}?offset=1', {
+                'Authorization': make_oauth10a_authorization('GET', f'{URL}?offset=2'),
+            }),
+            RequestDescriptor('GET', URL),
+            RequestDescriptor('POST', URL, {
+                'Authorization': make_oauth10a_authorization(
+                    'POST',
+                    URL,
+                    client_key='other-key',
+                    client_secret='other-secret',
+                ),
+            }),
+            RequestDescriptor('GET', URL, {
+                'Authorization': make_oauth10a_authorization('GET', URL, client_key='unknown-key'),
+            }),
+            RequestDescriptor('GET', f'{URL}?offset=3', {
+                'Authorization': make_oauth10a_authorization('GET', f'{URL}?offset=3'),
+            }),
+        ]
+
+    return __
+
+
+def _assert_results(results):
+    assert [result.valid for result in results] == [True, False, False, True, False, True]
+    assert [result.reason for result in results] == [
+        None,
+        INVALID_SIGNATURE,
+        MISSING_HEADER,
+        None,
+        INVALID_CREDENTIALS,
+        None,
+    ]
+    assert [result.status_code for result in results] == [200, 401, 401, 200, 401, 200]
+    assert results[1].consumer_key == 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8'
+    assert results[1].detail == 'Unauthenticated, the provided signature is not valid.'
+    assert results[2].consumer_key is None
+
+
+def test_oauth10a_batch_verifier_should_return_per_item_results_fetching_credentials_once(
+        make_logger,
+        make_descriptors,
+):
+    repository = InMemoryCredentialsRepository()
+    verifier = OAuth10aBatchVerifier(make_logger(), repository)
+
+    _assert_results(verifier.verify(make_descriptors()))
+    assert repository.lookups == [['other-key', 'unknown-key', 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8']]
+
+
+def test_oauth10a_batch_verifier_should_verify_in_thread_pool_chunks(
+        make_logger,
+        make_descriptors,
+):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        verifier = OAuth10aBatchVerifier(
+            make_logger(),
+            InMemoryCredentialsRepository(),
+            executor=executor,
+            chunk_size=1,
+        )
+
+        _assert_results(verifier.verify(make_descriptors()))
+
+
+def test_oauth10a_batch_verifier_should_verify_in_process_pool(
+        make_logger,
+        make_descriptors,
+):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        verifier = OAuth10aBatchVerifier(
+            make_logger(),
+            InMemoryCredentialsRepository(),
+            executor=executor,
+        )
+
+        _assert_results(verifier.verify(make_descriptors()))
+
+
+def test_oauth10a_batch_verifier_should_accept_empty_batches(make_logger):
+    repository = InMemoryCredentialsRepository()
+    verifier = OAuth10aBatchVerifier(make_logger(), repository)
+
+    assert verifier.verify([]) == []
+    assert repository.lookups == []
+
+
+def test_oauth10a_batch_verifier_should_include_form_bodies_in_the_signature(make_logger):
+    client = oauth1.Client('other-key', client_secret='other-secret')
+    form = {'Content-Type': 'application/x-www-form-urlencoded'}
+    _, headers, _ = client.sign(URL, http_method='POST', body='plan=premium&seats=10', headers=form)
+
+    verifier = OAuth10aBatchVerifier(make_logger(), InMemoryCredentialsRepository(), max_body_size=24)
+    results = verifier.verify([
+        RequestDescriptor('POST', URL, headers, body=b'plan=premium&seats=10'),
+        RequestDescriptor('POST', URL, headers, body=b'plan=premium&seats=99'),
+        RequestDescriptor('POST', URL, headers, body=b'plan=premium&seats=10&extra=1'),
+    ])
+
+    assert [result.valid for result in results] == [True, False, False]
+    assert [result.reason for result in results] == [None, INVALID_SIGNATURE, BODY_TOO_LARGE]
+    assert results[2].status_code == 413
+
+
+def test_oauth10a_batch_verifier_should_reject_descriptors_not_latin_1_encodable(
+        make_logger,
+        make_oauth10a_authorization,
+):
+    verifier = OAuth10aBatchVerifier(make_logger(), InMemoryCredentialsRepository())
+    results = verifier.verify([
+        RequestDescriptor('GET', f'{URL}/€', {'Authorization': make_oauth10a_authorization('GET', URL)}),
+        RequestDescriptor('GET', URL, {'Authorization': make_oauth10a_authorization('GET', URL)}),
+        RequestDescriptor('GET', URL, {'Authorization': make_oauth10a_authorization('GET', URL), 'X-Name': '日本'}),
+    ])
+
+    assert [result.valid for result in results] == [False, True, False]
+    assert [result.reason for result in results] == [INVALID_DESCRIPTOR, None, INVALID_DESCRIPTOR]
+    assert [result.status_code for result in results] == [400, 200, 400]
+
+
+def test_oauth10a_batch_verifier_should_sign_the_path_as_sent_by_the_client(
+        make_logger,
+        make_oauth10a_authorization,
+):
+    verifier = OAuth10aBatchVerifier(make_logger(), InMemoryCredentialsRepository())
+    locations = [f'https://example.com{path}' for path in ('/caf%C3%A9', '/a%2Fb', '/100%25', '/a+b')]
+    results = verifier.verify([
+        RequestDescriptor('GET', location, {'Authorization': make_oauth10a_authorization('GET', location)})
+        for location in locations
+    ])
+
+    assert [result.valid for result in results] == [True, True, True, True]
+
+
+def test_descriptor_scope_should_build_the_server_scope():
+    scope = descriptor_scope(RequestDescriptor('get', 'https://example.com/a%20b?x=1', {'X-Custom': 'value'}))
+
+    assert scope['method'] == 'GET'
+    assert scope['scheme'] == 'https'
+    assert scope['path'] == '/a b'
+    assert scope['raw_path'] == b'/a%20b'
+    assert scope['query_string'] == b'x=1'
+    assert scope['headers'] == [(b'x-custom', b'value'), (b'host', b'example.com')]
+
+    scope = descriptor_scope(RequestDescriptor('GET', 'http://example.com', {'Host': 'proxy.com'}, query='y=2'))
+
+    assert scope['path'] == '/'
+    assert scope['query_string'] == b'y=2'
+    assert scope['headers'] == [(b'host', b'proxy.com')]
@@ -0,0 +1,158 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import asyncio
+from typing import List, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import anyio
+import pytest
+from starlette.requests import Request
+from rndi.authentication.starlette.oauth10a.body import (
+    BODY_SCOPE_KEY,
+    BODY_TOO_LARGE,
+    FormParser,
+    is_form_content_type,
+    OAuth10aBodyError,
+    read_form,
+    read_form_from_thread,
+    replay_body,
+    UNREADABLE_BODY,
+)
+
+BODY = urlencode({'name': 'some value', 'empty': '', 'unicode': 'café', 'plus': 'a+b', 'list': 'x'}).encode()
+
+
+def make_form_request(chunks: List[bytes], content_length: Optional[int] = None, disconnect: bool = False) -> Request:
+    headers = [(b'content-type', b'application/x-www-form-urlencoded')]
+    if content_length is not None:
+        headers.append((b'content-length', str(content_length).encode()))
+    messages = [{'type': 'http.request', 'body': chunk, 'more_body': True} for chunk in chunks]
+    messages.append({'type': 'http.disconnect'} if disconnect else {'type': 'http.request', 'body': b''})
+
+    async def receive():
+        return messages.pop(0)
+
+    return Request({'type': 'http', 'method': 'POST', 'path': '/', 'headers': headers}, receive)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 1024])
+def test_form_parser_should_decode_chunked_bodies_as_a_whole(chunk_size):
+    parser = FormParser()
+    for start in range(0, len(BODY), chunk_size):
+        parser.feed(BODY[start:start + chunk_size])
+
+    assert parser.close() == parse_qsl(BODY.decode(), keep_blank_values=True)
+
+
+def test_form_parser_should_decode_long_pairs_streamed_in_small_chunks():
+    body = b'a=1&data=' + b'x' * 65536 + b'&b=2&c=3'
+    parser = FormParser()
+    for start in range(0, len(body), 16):
+        parser.feed(body[start:start + 16])
+
+    assert parser.close() == [('a', '1'), ('data', 'x' * 65536), ('b', '2'), ('c', '3')]
+
+
+@pytest.mark.parametrize('content_type, expected', [
+    ('application/x-www-form-urlencoded', True),
+    ('Application/X-WWW-Form-Urlencoded; charset=utf-8', True),
+    ('application/json', False),
+    ('multipart/form-data; boundary=x', False),
+    (None, False),
+])
+def test_is_form_content_type_should_only_accept_form_encoding(content_type, expected):
+    assert is_form_content_type(content_type) is expected
+
+
+def test_read_form_should_cache_the_body_on_the_scope():
+    request = make_form_request([BODY[:10], BODY[10:]])
+
+    parameters = asyncio.run(read_form(request, 1024))
+
+    assert parameters == parse_qsl(BODY.decode(), keep_blank_values=True)
+    assert request.scope[BODY_SCOPE_KEY] == BODY
+    assert not hasattr(request, '_body')
+    assert asyncio.run(read_form(request, 1024)) == parameters
+
+
+def test_read_form_should_leave_bodies_with_content_length_readable_by_the_application():
+    request = make_form_request([BODY[:10], BODY[10:]], content_length=len(BODY))
+
+    assert asyncio.run(read_form(request, 1024)) == parse_qsl(BODY.decode(), keep_blank_values=True)
+    assert request.scope[BODY_SCOPE_KEY] == BODY
+    assert asyncio.run(request.body()) == BODY
+
+
+def test_read_form_should_reject_large_content_length_before_reading():
+    request = make_form_request([b'never read'], content_length=2048)
+
+    with pytest.raises(OAuth10aBodyError) as e:
+        asyncio.run(read_form(request, 1024))
+
+    assert e.value.reason == BODY_TOO_LARGE
+    assert e.value.status_code == 413
+    assert BODY_SCOPE_KEY not in request.scope
+
+
+def test_read_form_should_stop_reading_once_the_body_is_too_large():
+    request = make_form_request([b'a=' + b'x' * 600, b'&b=' + b'y' * 600, b'&c=never read'])
+
+    with pytest.raises(OAuth10aBodyError) as e:
+        asyncio.run(read_form(request, 1024))
+
+    assert e.value.reason == BODY_TOO_LARGE
+
+
+def test_read_form_should_reject_disconnected_clients():
+    with pytest.raises(OAuth10aBodyError) as e:
+        asyncio.run(read_form(make_form_request([b'a=1'], disconnect=True), 1024))
+
+    assert e.value.reason == UNREADABLE_BODY
+    assert e.value.status_code == 400
+
+
+def test_read_form_from_thread_should_read_from_worker_threads():
+    request = make_form_request([BODY])
+
+    async def authenticate():
+        return await anyio.to_thread.run_sync(read_form_from_thread, request, 1024)
+
+    assert asyncio.run(authenticate()) == parse_qsl(BODY.decode(), keep_blank_values=True)
+
+
+def test_read_form_from_thread_should_use_already_read_bodies_outside_worker_threads():
+    parameters = parse_qsl(BODY.decode(), keep_blank_values=True)
+
+    request = make_form_request([b'never read'])
+    request.scope[BODY_SCOPE_KEY] = BODY
+    assert read_form_from_thread(request, 1024) == parameters
+
+    request = make_form_request([BODY], content_length=len(BODY))
+    asyncio.run(request.body())
+    assert read_form_from_thread(request, 1024) == parameters
+
+
+def test_read_form_from_thread_should_reject_unread_bodies_outside_worker_threads():
+    with pytest.raises(OAuth10aBodyError) as e:
+        read_form_from_thread(make_form_request([BODY]), 1024)
+
+    assert e.value.reason == UNREADABLE_BODY
+    assert e.value.status_code == 400
+    assert 'provide_async_request_authenticator' in str(e.value)
+
+
+def test_replay_body_should_deliver_the_body_once_then_delegate():
+    async def receive():
+        return {'type': 'http.disconnect'}
+
+    async def run():
+        replay = replay_body(BODY, receive)
+        return [await replay(), await replay()]
+
+    assert asyncio.run(run()) == [
+        {'type': 'http.request', 'body': BODY, 'more_body': False},
+        {'type': 'http.disconnect'},
+    ]
@@ -0,0 +1,67 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import pytest
+from rndi.authentication.starlette.oauth10a.nonce import InMemoryNonceStore
+
+NOW = 1686919540
+
+
+def test_in_memory_nonce_store_should_reject_replayed_nonces(make_clock):
+    store = InMemoryNonceStore(clock=make_clock(NOW))
+
+    assert store.remember('key-1', NOW, 'nonce')
+    assert not store.remember('key-1', NOW, 'nonce')
+    assert store.remember('key-2', NOW, 'nonce')
+    assert store.remember('key-1', NOW + 1, 'nonce')
+    assert len(store) == 3
+
+
+def test_in_memory_nonce_store_should_only_accept_timestamps_inside_the_skew_window(make_clock):
+    store = InMemoryNonceStore(skew=60, clock=make_clock(NOW))
+
+    assert store.is_fresh(NOW - 60)
+    assert store.is_fresh(NOW + 60)
+    assert not store.is_fresh(NOW - 61)
+    assert not store.is_fresh(NOW + 61)
+    assert not store.remember('key-1', NOW - 61, 'nonce')
+    assert not store.remember('key-1', NOW + 61, 'nonce')
+
+
+def test_in_memory_nonce_store_should_drop_expired_buckets(make_clock):
+    clock = make_clock(NOW)
+    store = InMemoryNonceStore(skew=60, bucket_size=10, clock=clock)
+
+    for i in range(10):
+        assert store.remember('key', NOW - 55 + i, f'nonce-{i}')
+    assert len(store) == 10
+
+    clock.now += 60
+    assert store.remember('key', NOW + 60, 'nonce')
+    assert len(store) == 1
+
+    clock.now += 1e6
+    assert store.remember('key', int(clock.now), 'nonce')
+    assert len(store) == 1
+
+
+def test_in_memory_nonce_store_should_be_bounded_without_allowing_replays(make_clock):
+    store = InMemoryNonceStore(skew=60, bucket_size=10, max_size=3, clock=make_clock(NOW))
+
+    assert store.remember('key', NOW - 50, 'old-1')
+    assert store.remember('key', NOW - 50, 'old-2')
+    assert store.remember('key', NOW, 'new-1')
+    assert store.remember('key', NOW, 'new-2')
+
+    # the oldest bucket was dropped, its timestamps are no longer accepted.
+    assert len(store) == 2
+    assert not store.is_fresh(NOW - 50)
+    assert not store.remember('key', NOW - 50, 'old-1')
+    assert not store.remember('key', NOW, 'new-1')
+
+
+def test_in_memory_nonce_store_should_reject_invalid_configuration():
+    with pytest.raises(ValueError):
+        InMemoryNonceStore(skew=0)
@@ -0,0 +1,92 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import pytest
+from rndi.authentication.starlette.oauth10a.parser import OAuth10aParseError, parse_authorization_header
+
+
+def test_parser_should_parse_authorization_header():
+    parameters = parse_authorization_header(
+        'OAuth realm="Example",'
+        'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+        'oauth_token="kkk9d7dh3k39sjv7",'
+        'oauth_signature_method="HMAC-SHA1",  '
+        'oauth_timestamp="1686919540",\t'
+        'oauth_nonce="RZQd4m3S0Iu", '
+        'oauth_version="1.0", '
+        'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"',
+    )
+
+    assert parameters.oauth_consumer_key == 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8'
+    assert parameters.oauth_token == 'kkk9d7dh3k39sjv7'
+    assert parameters.oauth_signature_method == 'HMAC-SHA1'
+    assert parameters.oauth_timestamp == '1686919540'
+    assert parameters.oauth_nonce == 'RZQd4m3S0Iu'
+    assert parameters.oauth_version == '1.0'
+    assert parameters.oauth_signature == 'XcvHhpsvfYz2/1PiI19axOJNe0E='
+    assert parameters.realm == 'Example'
+    assert parameters.parameters == {
+        'oauth_consumer_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'oauth_token': 'kkk9d7dh3k39sjv7',
+        'oauth_signature_method': 'HMAC-SHA1',
+        'oauth_timestamp': '1686919540',
+        'oauth_nonce': 'RZQd4m3S0Iu',
+        'oauth_version': '1.0',
+    }
+
+
+def test_parser_should_keep_equal_and_coma_characters_inside_values():
+    parameters = parse_authorization_header(
+        'oauth oauth_consumer_key="a=b,c", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", '
+        'oauth_nonce="n", oauth_signature="abc=="',
+    )
+
+    assert parameters.oauth_consumer_key == 'a=b,c'
+    assert parameters.oauth_signature == 'abc=='
+    assert parameters.oauth_version is None
+
+
+def test_parser_should_percent_decode_names_and_values():
+    parameters = parse_authorization_header(
+        'OAuth oauth_consumer_key="caf%C3%A9%20%22key%22", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", '
+        'oauth_nonce="n", oauth_signature="a%2Bb%2Fc%3D", x%5Fextra="50%25"',
+    )
+
+    assert parameters.oauth_consumer_key == 'café "key"'
+    assert parameters.oauth_signature == 'a+b/c='
+    assert parameters.parameters['x_extra'] == '50%'
+
+
+@pytest.mark.parametrize('header', [
+    'Bearer some-token',
+    'OAuth',
+    'OAuthoauth_consumer_key="k"',
+    'OAuth oauth_consumer_key=k, oauth_signature_method="HMAC-SHA1"',
+    'OAuth oauth_consumer_key="k" oauth_signature_method="HMAC-SHA1"',
+    'OAuth oauth_consumer_key="k", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", oauth_nonce="n", '
+    'oauth_signature="s", ="x"',
+    'OAuth oauth_consumer_key="k", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", oauth_nonce="n", '
+    'oauth_signature="s", a=b="x"',
+    'OAuth oauth_consumer_key="k", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", oauth_nonce="n", '
+    'oauth_signature="s", "x"',
+    'OAuth oauth_consumer_key="k", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", oauth_nonce="n", '
+    'oauth_signature="s" trailing',
+    'OAuth oauth_consumer_key="k, oauth_signature_method="HMAC-SHA1"',
+    'OAuth oauth_consumer_key="k", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", oauth_nonce="n"',
+    'OAuth oauth_consumer="k", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", oauth_nonce="n", '
+    'oauth_signature="s"',
+    'OAuth oauth_consumer_key="k", oauth_consumer_key="x", oauth_signature_method="HMAC-SHA1", '
+    'oauth_timestamp="1", oauth_nonce="n", oauth_signature="s"',
+    'OAuth oauth_consumer_key="k", oauth_signature_method="HMAC-SHA1", oauth_timestamp="1", oauth_nonce="n", '
+    'oauth_version="2.0", oauth_signature="s"',
+])
+def test_parser_should_reject_malformed_headers(header):
+    with pytest.raises(OAuth10aParseError):
+        parse_authorization_header(header)
+
+
+def test_parser_should_reject_headers_exceeding_max_length():
+    with pytest.raises(OAuth10aParseError, match='maximum length'):
+        parse_authorization_header('OAuth ' + 'a' * 100, max_length=64)
@@ -0,0 +1,94 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import pytest
+from rndi.authentication.starlette.oauth10a.nonce import InMemoryNonceStore
+from rndi.authentication.starlette.oauth10a.parser import OAuth10aParameters
+from rndi.authentication.starlette.oauth10a.prevalidation import (
+    check_signature_encoding,
+    OAuth10aPreValidationError,
+    OAuth10aPreValidator,
+    provide_pre_checks,
+)
+
+HEADER = (
+    'OAuth oauth_consumer_key="key",oauth_signature_method="{method}",oauth_timestamp="{timestamp}",'
+    'oauth_nonce="nonce",oauth_signature="{signature}"'
+)
+SIGNATURE = 'XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D'
+
+
+def make_header(method: str = 'HMAC-SHA1', timestamp: str = '1686919540', signature: str = SIGNATURE) -> str:
+    return HEADER.format(method=method, timestamp=timestamp, signature=signature)
+
+
+@pytest.mark.parametrize('header, reason', [
+    (None, 'missing_header'),
+    ('OAuth ' + 'a' * 5000, 'header_too_long'),
+    ('Basic dXNlcjpwYXNz', 'malformed_header'),
+    ('OAuth oauth_consumer_key="key"', 'missing_parameter'),
+    (make_header(method='PLAINTEXT'), 'unsupported_signature_method'),
+    (make_header(signature='short'), 'invalid_signature_encoding'),
+    (make_header(timestamp='1000'), 'invalid_timestamp'),
+    (make_header(timestamp='soon'), 'invalid_timestamp'),
+])
+def test_oauth10a_pre_validator_should_reject_and_count_by_reason(header, reason):
+    validator = OAuth10aPreValidator(provide_pre_checks(['HMAC-SHA1'], InMemoryNonceStore(clock=lambda: 1686919540)))
+
+    with pytest.raises(OAuth10aPreValidationError) as e:
+        validator.validate(header)
+
+    assert e.value.reason == reason
+    assert validator.rejections == {reason: 1}
+
+
+def test_oauth10a_pre_validator_should_return_parsed_parameters():
+    validator = OAuth10aPreValidator(provide_pre_checks(['HMAC-SHA1']))
+
+    authorization = validator.validate(make_header(timestamp='1000'))
+
+    assert authorization.oauth_consumer_key == 'key'
+    assert validator.rejections == {}
+
+
+def test_oauth10a_pre_validator_should_run_checks_in_order():
+    calls = []
+
+    def make_check(name: str, result: bool):
+        def check(_: OAuth10aParameters) -> bool:
+            calls.append(name)
+            return result
+
+        return check
+
+    validator = OAuth10aPreValidator([
+        ('first', make_check('first', True)),
+        ('custom_reason', make_check('second', False)),
+        ('third', make_check('third', False)),
+    ])
+
+    with pytest.raises(OAuth10aPreValidationError) as e:
+        validator.validate(make_header())
+
+    assert calls == ['first', 'second']
+    assert e.value.detail == 'custom reason'
+    assert validator.rejections == {'custom_reason': 1}
+
+
+@pytest.mark.parametrize('method, signature, valid', [
+    ('HMAC-SHA1', 'XcvHhpsvfYz2/1PiI19axOJNe0E=', True),
+    ('HMAC-SHA1', 'XcvHhpsvfYz2/1PiI19axOJNe0E', False),
+    ('HMAC-SHA1', 'XcvHhpsvfYz2/1PiI19axOJNe0!', False),
+    ('HMAC-SHA256', 'XcvHhpsvfYz2/1PiI19axOJNe0E=', False),
+    ('HMAC-SHA256', 'a' * 43 + '=', True),
+    ('RSA-SHA1', 'a' * 344, True),
+    ('RSA-SHA1', 'a' * 341 + '===', False),
+    ('RSA-SHA1', 'a' * 2000, False),
+    ('RSA-SHA1', '', False),
+])
+def test_check_signature_encoding_should_validate_length_and_alphabet(method, signature, valid):
+    authorization = OAuth10aParameters('key', method, '1686919540', 'nonce', signature)
+
+    assert check_signature_encoding(authorization) is valid
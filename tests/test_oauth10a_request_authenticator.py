@@ -3,9 +3,23 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
+import asyncio
+import logging
+from urllib.parse import quote
+
 import pytest
+from oauthlib import oauth1
 from starlette.exceptions import HTTPException
-from rndi.authentication.starlette.adapters.oauth10a import OAuth10aRequestAuthenticatorAdapter
+from starlette.requests import Request
+from rndi.authentication.starlette.adapters.oauth10a import (
+    AsyncOAuth10aRequestAuthenticatorAdapter,
+    OAuth10aRequestAuthenticatorAdapter,
+)
+from rndi.authentication.starlette.log import TRACE
+from rndi.authentication.starlette.oauth10a.body import FORM_CONTENT_TYPE
+from rndi.authentication.starlette.oauth10a.nonce import InMemoryNonceStore
+from rndi.authentication.starlette.ratelimit import TokenBucketRateLimiter
+from rndi.authentication.starlette.result import AuthResult
 
 
 def test_oauth10a_request_authenticator_should_authenticate_given_request(
@@ -35,7 +49,40 @@ def test_oauth10a_request_authenticator_should_authenticate_given_request(
         }),
     )
 
-    assert authenticator.authenticate(request) is None
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+
+def test_oauth10a_request_authenticator_should_pass_extra_credential_attributes_to_the_result(
+        make_credential_repository,
+        make_logger,
+        make_request,
+):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth '
+                         'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+                         'oauth_signature_method="HMAC-SHA1", '
+                         'oauth_timestamp="1686919540", '
+                         'oauth_nonce="RZQd4m3S0Iu", '
+                         'oauth_version="1.0",'
+                         'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"',
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+                'tenant': 'tenant-1',
+            },
+        }),
+    )
+
+    result = authenticator.authenticate(request)
+
+    assert result.attributes == {'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8', 'tenant': 'tenant-1'}
 
 
 def test_oauth10a_request_authenticator_should_authenticate_given_request_with_x_forwarded_headers(
@@ -67,7 +114,132 @@ def test_oauth10a_request_authenticator_should_authenticate_given_request_with_x
         }),
     )
 
-    assert authenticator.authenticate(request) is None
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+
+def test_oauth10a_request_authenticator_should_authenticate_given_request_with_query_string(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans?limit=10&filter=a%20b&empty='
+    request = make_request('GET', location, {
+        'authorization': make_oauth10a_authorization('GET', location),
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+
+@pytest.mark.parametrize('path', ['/caf%C3%A9', '/a%2Fb', '/100%25', '/a+b', '/a%2Bb', '/a%20b;c=1'])
+def test_oauth10a_request_authenticator_should_sign_the_path_as_sent_by_the_client(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+        path,
+):
+    location = f'https://cosmopolitan.aks.int.zone{path}'
+    headers = {'authorization': make_oauth10a_authorization('GET', location)}
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    assert isinstance(authenticator.authenticate(make_request('GET', location, headers)), AuthResult)
+
+    # without raw_path, the decoded path is encoded again, except for the
+    # encoded reserved characters the decoding cannot tell apart.
+    request = make_request('GET', location, headers)
+    del request.scope['raw_path']
+    if '%2F' in path or '%2B' in path:
+        with pytest.raises(HTTPException):
+            authenticator.authenticate(request)
+    else:
+        assert isinstance(authenticator.authenticate(request), AuthResult)
+
+
+def test_oauth10a_request_authenticator_should_sign_the_root_path_stripped_by_a_proxy(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+):
+    location = 'https://cosmopolitan.aks.int.zone/api/caf%C3%A9'
+    headers = {'authorization': make_oauth10a_authorization('GET', location)}
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/caf%C3%A9', headers)
+    request.scope['root_path'] = '/api'
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+    # a mounted application gets the root path in raw_path already.
+    request = make_request('GET', location, headers)
+    request.scope['root_path'] = '/api'
+    request.scope['path'] = '/café'
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+
+def test_oauth10a_request_authenticator_should_authenticate_given_request_with_extra_parameters(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    request = make_request('GET', location, {
+        'authorization': make_oauth10a_authorization(
+            'GET',
+            location,
+            resource_owner_key='kkk9d7dh3k39sjv7',
+            realm='Example',
+        ),
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
 
 
 def test_oauth10a_request_authenticator_should_throw_exception_for_unauthorized_request(
@@ -117,6 +289,41 @@ def test_oauth10a_request_authenticator_should_throw_exception_on_missing_author
         authenticator.authenticate(request)
 
 
+@pytest.mark.parametrize('headers', [
+    {'host': '443'},
+    {'x-forwarded-proto': 'https', 'x-forwarded-host': '443'},
+])
+def test_oauth10a_request_authenticator_should_reject_port_only_hosts(
+        make_credential_repository,
+        make_logger,
+        make_oauth10a_authorization,
+        make_request,
+        headers,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    request = make_request('GET', location, {
+        **headers,
+        'authorization': make_oauth10a_authorization('GET', location),
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(request)
+
+    assert e.value.status_code == 401
+
+
 def test_oauth10a_request_authenticator_should_throw_exception_on_invalid_consumer_key(
         make_credential_repository,
         make_logger,
@@ -163,3 +370,508 @@ def test_oauth10a_request_authenticator_should_throw_exception_on_malformed_sign
 
     with pytest.raises(HTTPException):
         authenticator.authenticate(request)
+
+
+@pytest.mark.parametrize('signature_method', ['HMAC-SHA256', 'HMAC-SHA512'])
+def test_oauth10a_request_authenticator_should_authenticate_given_request_with_other_hmac_methods(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+        signature_method,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans?limit=10'
+    request = make_request('GET', location, {
+        'authorization': make_oauth10a_authorization('GET', location, signature_method=signature_method),
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+
+def test_oauth10a_request_authenticator_should_authenticate_given_request_with_rsa_signature(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_rsa_key,
+):
+    from rndi.authentication.starlette.oauth10a.base_string import signature_base_string
+
+    key = make_rsa_key()
+    parameters = {
+        'oauth_consumer_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'oauth_signature_method': 'RSA-SHA256',
+        'oauth_timestamp': '1686919540',
+        'oauth_nonce': 'RZQd4m3S0Iu',
+        'oauth_version': '1.0',
+    }
+    signature = key.sign(signature_base_string(
+        'GET',
+        'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans',
+        '',
+        parameters,
+    ), 'SHA256')
+
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth ' + ','.join(
+            [f'{name}="{value}"' for name, value in parameters.items()]
+            + [f'oauth_signature="{quote(signature, safe="")}"'],
+        ),
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'rsa_key': key.public_key,
+            },
+        }),
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+
+def test_oauth10a_request_authenticator_should_throw_exception_on_unsupported_signature_method(
+        make_logger,
+        make_request,
+        mocker,
+):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth '
+                         'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8",'
+                         'oauth_signature_method="PLAINTEXT",'
+                         'oauth_timestamp="1686919540",'
+                         'oauth_nonce="RZQd4m3S0Iu",'
+                         'oauth_version="1.0",'
+                         'oauth_signature="secret%26"',
+    })
+
+    repository = mocker.Mock()
+    authenticator = OAuth10aRequestAuthenticatorAdapter(make_logger(), repository)
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(request)
+
+    assert e.value.status_code == 401
+    assert 'unsupported signature method' in e.value.detail
+    repository.get.assert_not_called()
+
+
+def test_oauth10a_request_authenticator_should_throw_exception_on_replayed_nonce(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    request = make_request('GET', location, {
+        'authorization': make_oauth10a_authorization('GET', location),
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+        nonce_store=InMemoryNonceStore(),
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(make_request('GET', location, {'authorization': request.headers['authorization']}))
+
+    assert e.value.status_code == 401
+    assert 'nonce' in e.value.detail
+
+
+@pytest.mark.parametrize('timestamp', ['1686919540', 'invalid', '+1686919540'])
+def test_oauth10a_request_authenticator_should_reject_stale_timestamps_before_credentials_lookup(
+        make_logger,
+        make_request,
+        mocker,
+        timestamp,
+):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth '
+                         'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8",'
+                         'oauth_signature_method="HMAC-SHA1",'
+                         f'oauth_timestamp="{timestamp}",'
+                         'oauth_nonce="RZQd4m3S0Iu",'
+                         'oauth_version="1.0",'
+                         'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"',
+    })
+
+    repository = mocker.Mock()
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        repository,
+        nonce_store=InMemoryNonceStore(skew=300),
+    )
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(request)
+
+    assert e.value.status_code == 401
+    assert 'timestamp' in e.value.detail
+    repository.get.assert_not_called()
+
+
+def test_oauth10a_request_authenticator_should_shed_invalid_signatures_before_credentials_lookup(
+        make_logger,
+        make_request,
+        mocker,
+):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth '
+                         'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8",'
+                         'oauth_signature_method="HMAC-SHA1",'
+                         'oauth_timestamp="1686919540",'
+                         'oauth_nonce="RZQd4m3S0Iu",'
+                         'oauth_version="1.0",'
+                         'oauth_signature="garbage"',
+    })
+
+    repository = mocker.Mock()
+    authenticator = OAuth10aRequestAuthenticatorAdapter(make_logger(), repository)
+
+    for _ in range(3):
+        with pytest.raises(HTTPException):
+            authenticator.authenticate(request)
+
+    repository.get.assert_not_called()
+    assert authenticator.rejections == {'invalid_signature_encoding': 3}
+
+
+def test_oauth10a_request_authenticator_should_rate_limit_before_credentials_lookup(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        mocker,
+):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth '
+                         'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8",'
+                         'oauth_signature_method="HMAC-SHA1",'
+                         'oauth_timestamp="1686919540",'
+                         'oauth_nonce="RZQd4m3S0Iu",'
+                         'oauth_version="1.0",'
+                         'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"',
+    })
+
+    get = mocker.Mock(return_value={
+        'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                         'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+        'resource_owner_secret': '',
+    })
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({'get': get}),
+        rate_limiter=TokenBucketRateLimiter(rate=0.1, burst=1),
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+
+    with pytest.raises(HTTPException) as e:
+        authenticator.authenticate(make_request('GET', str(request.url), {
+            'authorization': request.headers['authorization'],
+        }))
+
+    assert e.value.status_code == 429
+    assert e.value.headers == {'Retry-After': '10'}
+    assert get.call_count == 1
+
+
+@pytest.mark.parametrize('level, logged', [(logging.INFO, False), (logging.DEBUG, False), (TRACE, True)])
+def test_oauth10a_request_authenticator_should_only_log_request_detail_in_trace_mode(
+        caplog,
+        make_credential_repository,
+        make_request,
+        make_oauth10a_authorization,
+        level,
+        logged,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    request = make_request('GET', location, {
+        'authorization': make_oauth10a_authorization('GET', location),
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        logging.LoggerAdapter(logging.getLogger('test-trace'), {}),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    with caplog.at_level(level, logger='test-trace'):
+        assert isinstance(authenticator.authenticate(request), AuthResult)
+
+    assert any('base string' in message for message in caplog.messages) is logged
+    assert any('authenticating request' in message for message in caplog.messages) is (level <= logging.DEBUG)
+
+
+def test_oauth10a_request_authenticator_should_throttle_failure_logs(caplog, make_request, mocker):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8"',
+    })
+
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        logging.LoggerAdapter(logging.getLogger('test-failures'), {}),
+        mocker.Mock(),
+        throttle_interval=60,
+    )
+
+    with caplog.at_level(logging.DEBUG, logger='test-failures'):
+        for _ in range(10):
+            with pytest.raises(HTTPException):
+                authenticator.authenticate(request)
+
+    assert len([message for message in caplog.messages if 'rejected' in message]) == 1
+    assert len([message for message in caplog.messages if 'authenticating' in message]) == 10
+
+
+def test_oauth10a_request_authenticator_should_report_stage_timings_and_outcome(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_oauth10a_authorization,
+        mocker,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    request = make_request('GET', location, {
+        'authorization': make_oauth10a_authorization('GET', location),
+    })
+
+    observer = mocker.Mock()
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({
+            'get': lambda _: {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+        nonce_store=InMemoryNonceStore(),
+        observer=observer,
+    )
+
+    assert isinstance(authenticator.authenticate(request), AuthResult)
+    assert [c.args[1] for c in observer.stage.call_args_list] == [
+        'parse', 'credentials', 'uri', 'base_string', 'signature', 'nonce',
+    ]
+    assert observer.outcome.call_args.args[:2] == ('oauth10a', 'accepted')
+
+    with pytest.raises(HTTPException):
+        authenticator.authenticate(make_request('GET', location, {'authorization': request.headers['authorization']}))
+    assert observer.outcome.call_args.args[:2] == ('oauth10a', 'replayed_nonce')
+
+
+@pytest.mark.parametrize('authorization, outcome', [
+    (None, 'missing_header'),
+    ('OAuth oauth_consumer_key="key"', 'missing_parameter'),
+    (
+        'OAuth oauth_consumer_key="key",oauth_signature_method="HMAC-SHA1",oauth_timestamp="1686919540",'
+        'oauth_nonce="RZQd4m3S0Iu",oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"',
+        'invalid_credentials',
+    ),
+])
+def test_oauth10a_request_authenticator_should_report_rejection_reason(
+        make_async_credential_repository,
+        make_logger,
+        make_request,
+        mocker,
+        authorization,
+        outcome,
+):
+    headers = {} if authorization is None else {'authorization': authorization}
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', headers)
+
+    observer = mocker.Mock()
+    authenticator = AsyncOAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_async_credential_repository({}),
+        observer=observer,
+    )
+
+    with pytest.raises(HTTPException):
+        asyncio.run(authenticator.authenticate(request))
+    assert observer.outcome.call_args.args[:2] == ('oauth10a', outcome)
+
+
+def test_async_oauth10a_request_authenticator_should_authenticate_given_request(
+        make_async_credential_repository,
+        make_logger,
+        make_request,
+):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth '
+                         'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8", '
+                         'oauth_signature_method="HMAC-SHA1", '
+                         'oauth_timestamp="1686919540", '
+                         'oauth_nonce="RZQd4m3S0Iu", '
+                         'oauth_version="1.0",'
+                         'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"',
+    })
+
+    authenticator = AsyncOAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_async_credential_repository({
+            'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8': {
+                'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+                'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                                 'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+                'resource_owner_secret': '',
+            },
+        }),
+    )
+
+    assert isinstance(asyncio.run(authenticator.authenticate(request)), AuthResult)
+
+
+def test_async_oauth10a_request_authenticator_should_throw_exception_on_invalid_consumer_key(
+        make_async_credential_repository,
+        make_logger,
+        make_request,
+):
+    request = make_request('GET', 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans', {
+        'authorization': 'OAuth '
+                         'oauth_consumer_key="wotAQOwTUXZrkZqfOMrpEAtTC362SJi8",'
+                         'oauth_signature_method="HMAC-SHA1",'
+                         'oauth_timestamp="1686919540",'
+                         'oauth_nonce="RZQd4m3S0Iu",'
+                         'oauth_version="1.0",'
+                         'oauth_signature="XcvHhpsvfYz2%2F1PiI19axOJNe0E%3D"',
+    })
+
+    authenticator = AsyncOAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_async_credential_repository(),
+    )
+
+    with pytest.raises(HTTPException):
+        asyncio.run(authenticator.authenticate(request))
+
+
+def test_oauth10a_request_authenticator_should_return_and_memoize_the_principal(
+        make_credential_repository,
+        make_logger,
+        make_request,
+        make_async_credential_repository,
+        make_oauth10a_authorization,
+        mocker,
+):
+    location = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    request = make_request('GET', location, {
+        'authorization': make_oauth10a_authorization('GET', location),
+    })
+
+    get = mocker.Mock(return_value={
+        'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'client_secret': '4oV1gtQxZxjxkl0jYqfd0FukNADAu0NmTML9Xm6KCA0n1CcEOSEaGAUC9nca8Do2'
+                         'W6GocxO1RYJvbpDsFbZ5pvxZIISlycvbIE2F6OLRNMQld8uJE9eVNNxKu72xxrTI',
+        'resource_owner_secret': '',
+    })
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({'get': get}),
+        nonce_store=InMemoryNonceStore(),
+    )
+
+    result = authenticator.authenticate(request)
+
+    assert result == AuthResult(
+        'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8',
+        'oauth10a',
+        {'client_key': 'wotAQOwTUXZrkZqfOMrpEAtTC362SJi8'},
+    )
+    assert request.state.auth_result is result
+
+    # another Request object of the same request, like the one of a dependency.
+    same_request = Request(request.scope)
+    assert authenticator.authenticate(same_request) is result
+    assert get.call_count == 1
+
+    # another authenticator of the same driver may trust other credentials.
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(AsyncOAuth10aRequestAuthenticatorAdapter(
+            make_logger(),
+            make_async_credential_repository(),
+        ).authenticate(same_request))
+    assert e.value.reason == 'invalid_credentials'
+
+
+def test_oauth10a_request_authenticator_should_use_bodies_already_read_on_the_event_loop_thread(
+        make_credential_repository,
+        make_logger,
+):
+    url = 'https://cosmopolitan.aks.int.zone/aps/2/collections/service-plans'
+    body = b'plan=premium&seats=10'
+    client = oauth1.Client('other-key', client_secret='other-secret')
+    _, headers, _ = client.sign(
+        url,
+        http_method='POST',
+        body=body.decode(),
+        headers={'Content-Type': FORM_CONTENT_TYPE},
+    )
+    authenticator = OAuth10aRequestAuthenticatorAdapter(
+        make_logger(),
+        make_credential_repository({'get': lambda key: {'client_key': key, 'client_secret': 'other-secret'}}),
+    )
+
+    def make_request() -> Request:
+        async def receive():
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        return Request({
+            'type': 'http',
+            'method': 'POST',
+            'scheme': 'https',
+            'path': '/aps/2/collections/service-plans',
+            'query_string': b'',
+            'headers': [
+                (b'host', b'cosmopolitan.aks.int.zone'),
+                (b'content-type', FORM_CONTENT_TYPE.encode('latin-1')),
+                (b'content-length', str(len(body)).encode('latin-1')),
+                (b'authorization', headers['Authorization'].encode('latin-1')),
+            ],
+        }, receive)
+
+    async def authenticate(read: bool):
+        # a dependency of an async endpoint, called on the event loop thread.
+        request = make_request()
+        if read:
+            await request.body()
+        return authenticator.authenticate(request)
+
+    assert asyncio.run(authenticate(True)).consumer_key == 'other-key'
+
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(authenticate(False))
+
+    assert e.value.status_code == 400
+    assert e.value.reason == 'unreadable_body'
@@ -0,0 +1,157 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import pytest
+from oauthlib.oauth1.rfc5849 import signature as oauth
+from rndi.authentication.starlette.oauth10a.signature import (
+    Credential,
+    HMAC_SHA1,
+    HMAC_SHA256,
+    HMAC_SHA512,
+    HmacSignatureVerifier,
+    provide_signature_verifiers,
+    RSA_SHA1,
+    RSA_SHA256,
+)
+
+BASE_STRING = 'GET&https%3A%2F%2Fcosmopolitan.aks.int.zone%2Faps&oauth_consumer_key%3Dkey%26oauth_nonce%3Dn'
+
+
+def test_hmac_signature_verifier_should_match_oauthlib_reference():
+    credential = Credential('key', 'secret with spaces & symbols', 'owner-secret')
+    verifier = HmacSignatureVerifier()
+
+    signature = oauth.sign_hmac_sha1_with_client(BASE_STRING, credential)
+
+    assert verifier.verify(credential, BASE_STRING, signature)
+    assert verifier.verify(credential, BASE_STRING, signature)
+
+
+def test_hmac_signature_verifier_should_reject_invalid_signatures():
+    credential = Credential('key', 'secret', '')
+    verifier = HmacSignatureVerifier()
+
+    signature = oauth.sign_hmac_sha1_with_client(BASE_STRING, credential)
+
+    assert not verifier.verify(credential, BASE_STRING + 'x', signature)
+    assert not verifier.verify(credential, BASE_STRING, 'not base64 !')
+    assert not verifier.verify(credential, BASE_STRING, 'café')
+    assert not verifier.verify(credential, BASE_STRING, '')
+
+
+def test_hmac_signature_verifier_should_rebuild_prepared_hmac_when_secret_changes():
+    verifier = HmacSignatureVerifier()
+    old = Credential('key', 'old-secret', '')
+    new = Credential('key', 'new-secret', '')
+
+    assert verifier.verify(old, BASE_STRING, oauth.sign_hmac_sha1_with_client(BASE_STRING, old))
+    assert not verifier.verify(new, BASE_STRING, oauth.sign_hmac_sha1_with_client(BASE_STRING, old))
+    assert verifier.verify(new, BASE_STRING, oauth.sign_hmac_sha1_with_client(BASE_STRING, new))
+
+
+def test_hmac_signature_verifier_should_be_bounded():
+    verifier = HmacSignatureVerifier(max_size=2)
+    credentials = [Credential(f'key-{i}', f'secret-{i}', '') for i in range(5)]
+
+    for credential in credentials:
+        signature = oauth.sign_hmac_sha1_with_client(BASE_STRING, credential)
+        assert verifier.verify(credential, BASE_STRING, signature)
+
+    verifier.invalidate('key-4')
+    verifier.invalidate()
+
+    signature = oauth.sign_hmac_sha1_with_client(BASE_STRING, credentials[0])
+    assert verifier.verify(credentials[0], BASE_STRING, signature)
+
+
+@pytest.mark.parametrize('method, sign', [
+    (HMAC_SHA1, oauth.sign_hmac_sha1_with_client),
+    (HMAC_SHA256, oauth.sign_hmac_sha256_with_client),
+    (HMAC_SHA512, oauth.sign_hmac_sha512_with_client),
+])
+def test_provided_hmac_signature_verifiers_should_match_oauthlib_reference(method, sign):
+    credential = Credential('key', 'secret', '')
+    verifier = provide_signature_verifiers()[method]
+
+    assert verifier.verify(credential, BASE_STRING, sign(BASE_STRING, credential))
+    assert not verifier.verify(credential, BASE_STRING + 'x', sign(BASE_STRING, credential))
+
+
+def test_hmac_signature_verifier_should_reject_credentials_without_client_secret():
+    verifier = HmacSignatureVerifier()
+    credential = Credential('key', 'secret')
+
+    signature = oauth.sign_hmac_sha1_with_client(BASE_STRING, Credential('key', 'secret', ''))
+
+    assert verifier.verify(credential, BASE_STRING, signature)
+    assert not verifier.verify(Credential('key'), BASE_STRING, signature)
+
+
+@pytest.mark.parametrize('method, algorithm', [
+    (RSA_SHA1, 'SHA1'),
+    (RSA_SHA256, 'SHA256'),
+])
+def test_rsa_signature_verifier_should_verify_pkcs1_v15_signatures(method, algorithm, make_rsa_key):
+    key = make_rsa_key()
+    verifier = provide_signature_verifiers()[method]
+
+    signature = key.sign(BASE_STRING, algorithm)
+
+    assert verifier.verify(Credential('key', rsa_key=key.public_key), BASE_STRING, signature)
+    assert verifier.verify(Credential('key', rsa_key=key.public_key), BASE_STRING, signature)
+    assert not verifier.verify(Credential('key', rsa_key=key.public_key), BASE_STRING + 'x', signature)
+
+
+def test_rsa_signature_verifier_should_accept_certificates(make_rsa_key):
+    key = make_rsa_key()
+    verifier = provide_signature_verifiers()[RSA_SHA1]
+
+    assert verifier.verify(Credential('key', rsa_key=key.certificate), BASE_STRING, key.sign(BASE_STRING))
+
+
+def test_rsa_signature_verifier_should_parse_public_key_once(mocker, make_rsa_key):
+    from rndi.authentication.starlette.oauth10a import rsa
+
+    key = make_rsa_key()
+    verifier = rsa.RsaSignatureVerifier()
+    load = mocker.spy(rsa, 'load_rsa_public_key')
+
+    signature = key.sign(BASE_STRING)
+
+    for _ in range(3):
+        assert verifier.verify(Credential('key', rsa_key=key.public_key), BASE_STRING, signature)
+    assert load.call_count == 1
+
+    other = make_rsa_key()
+    assert not verifier.verify(Credential('key', rsa_key=other.public_key), BASE_STRING, signature)
+    assert load.call_count == 2
+
+
+def test_rsa_signature_verifier_should_reject_unusable_keys(make_rsa_key):
+    from rndi.authentication.starlette.oauth10a import rsa
+
+    verifier = rsa.RsaSignatureVerifier()
+    signature = make_rsa_key().sign(BASE_STRING)
+
+    assert not verifier.verify(Credential('key'), BASE_STRING, signature)
+    assert not verifier.verify(Credential('key', rsa_key='not a pem'), BASE_STRING, signature)
+    with pytest.raises(ValueError):
+        rsa.load_rsa_public_key('not a pem')
+
+
+def test_signature_verifiers_should_be_picklable_without_prepared_state():
+    import pickle
+
+    credential = Credential('key', 'secret', '')
+    verifier = HmacSignatureVerifier()
+    signature = oauth.sign_hmac_sha1_with_client(BASE_STRING, credential)
+    assert verifier.verify(credential, BASE_STRING, signature)
+
+    for method, restored in pickle.loads(pickle.dumps(provide_signature_verifiers())).items():
+        assert restored.verify(credential, BASE_STRING, signature) == (method == HMAC_SHA1)
+
+    restored = pickle.loads(pickle.dumps(verifier))
+    restored.invalidate()
+    assert restored.verify(credential, BASE_STRING, signature)
@@ -3,11 +3,26 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
+import pytest
+from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from rndi.authentication.starlette.adapters.oauth10a import OAuth10aRequestAuthenticatorAdapter
-from rndi.authentication.starlette.adapters.unauthorized import UnauthorizedRequestAuthenticatorAdapter
+from rndi.authentication.starlette.adapters.oauth10a import (
+    AsyncOAuth10aRequestAuthenticatorAdapter,
+    OAuth10aRequestAuthenticatorAdapter,
+    provide_oauth10a_nonce_store,
+    REQUEST_AUTH_OAUTH10A_TIMESTAMP_SKEW,
+)
+from rndi.authentication.starlette.adapters.unauthorized import (
+    AsyncUnauthorizedRequestAuthenticatorAdapter,
+    UnauthorizedRequestAuthenticatorAdapter,
+)
 from rndi.authentication.starlette.contract import RequestAuthenticator
-from rndi.authentication.starlette.provider import provide_request_authenticator, REQUEST_AUTH_DRIVER
+from rndi.authentication.starlette.oauth10a.nonce import InMemoryNonceStore
+from rndi.authentication.starlette.provider import (
+    provide_async_request_authenticator,
+    provide_request_authenticator,
+    REQUEST_AUTH_DRIVER,
+)
 
 
 def test_provider_should_return_unauthorized_request_authenticator_by_driver(
@@ -30,6 +45,12 @@ def test_provider_should_return_correct_request_authenticator_by_driver(
     assert isinstance(authenticator, OAuth10aRequestAuthenticatorAdapter)
 
 
+def test_provider_should_configure_oauth10a_nonce_store_from_config():
+    assert provide_oauth10a_nonce_store({}) is None
+    assert provide_oauth10a_nonce_store({REQUEST_AUTH_OAUTH10A_TIMESTAMP_SKEW: '0'}) is None
+    assert isinstance(provide_oauth10a_nonce_store({REQUEST_AUTH_OAUTH10A_TIMESTAMP_SKEW: '300'}), InMemoryNonceStore)
+
+
 def test_provider_should_return_unauthorized_request_authenticator_on_error(
         make_credential_repository,
         make_logger,
@@ -59,3 +80,71 @@ def test_provider_should_return_request_authenticator_from_extra_drivers(
     })
 
     assert isinstance(authenticator, CustomRequestAuthenticator)
+
+
+def test_async_provider_should_return_async_request_authenticator_by_driver(
+        make_async_credential_repository,
+        make_logger,
+):
+    config = {REQUEST_AUTH_DRIVER: 'oauth10a'}
+    authenticator = provide_async_request_authenticator(config, make_logger(), make_async_credential_repository())
+
+    assert isinstance(authenticator, AsyncOAuth10aRequestAuthenticatorAdapter)
+
+
+def test_async_provider_should_return_async_unauthorized_request_authenticator_on_error(
+        make_credential_repository,
+        make_logger,
+):
+    config = {REQUEST_AUTH_DRIVER: 'this-driver-does-not-exists'}
+    authenticator = provide_async_request_authenticator(config, make_logger(), make_credential_repository())
+
+    assert isinstance(authenticator, AsyncUnauthorizedRequestAuthenticatorAdapter)
+
+
+def test_provider_should_bridge_async_credentials_repository(
+        make_async_credential_repository,
+        make_logger,
+):
+    config = {REQUEST_AUTH_DRIVER: 'oauth10a'}
+    authenticator = provide_request_authenticator(config, make_logger(), make_async_credential_repository())
+
+    assert isinstance(authenticator, OAuth10aRequestAuthenticatorAdapter)
+
+
+def test_provider_should_pass_observer_to_drivers_accepting_it(
+        make_credential_repository,
+        make_logger,
+        mocker,
+):
+    class CustomRequestAuthenticator(RequestAuthenticator):
+        DRIVER = 'custom'
+
+        def authenticate(self, _: Request):
+            """ just for test """
+
+    def provide_custom_authenticator(_, __, ___) -> RequestAuthenticator:
+        return CustomRequestAuthenticator()
+
+    observer = mocker.Mock()
+    drivers = {CustomRequestAuthenticator.DRIVER: provide_custom_authenticator}
+
+    authenticator = provide_request_authenticator(
+        {REQUEST_AUTH_DRIVER: 'this-driver-does-not-exists'},
+        make_logger(),
+        make_credential_repository(),
+        drivers,
+        observer=observer,
+    )
+    with pytest.raises(HTTPException):
+        authenticator.authenticate(Request({'type': 'http'}))
+    assert observer.outcome.call_args.args[:2] == ('unauthorized', 'rejected')
+
+    authenticator = provide_request_authenticator(
+        {REQUEST_AUTH_DRIVER: 'custom'},
+        make_logger(),
+        make_credential_repository(),
+        drivers,
+        observer=observer,
+    )
+    assert isinstance(authenticator, CustomRequestAuthenticator)
@@ -0,0 +1,67 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import pytest
+from rndi.authentication.starlette.ratelimit import (
+    provide_rate_limiter,
+    REQUEST_AUTH_RATE_LIMIT,
+    REQUEST_AUTH_RATE_LIMIT_BURST,
+    TokenBucketRateLimiter,
+)
+
+
+def test_token_bucket_rate_limiter_should_allow_bursts_and_refill_over_time(make_clock):
+    clock = make_clock()
+    limiter = TokenBucketRateLimiter(rate=2, burst=3, clock=clock)
+
+    assert [limiter.acquire('key') for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire('key') == pytest.approx(0.5)
+    assert limiter.acquire('other') == 0.0
+
+    clock.now = 0.5
+    assert limiter.acquire('key') == 0.0
+    assert limiter.acquire('key') > 0
+
+
+def test_token_bucket_rate_limiter_should_evict_idle_buckets(make_clock):
+    clock = make_clock()
+    limiter = TokenBucketRateLimiter(rate=1, burst=2, clock=clock)
+
+    for key in ('key-1', 'key-2', 'key-3'):
+        limiter.acquire(key)
+    assert len(limiter) == 3
+
+    clock.now = 2.0
+    limiter.acquire('key-4')
+    assert len(limiter) == 1
+
+
+def test_token_bucket_rate_limiter_should_be_bounded(make_clock):
+    limiter = TokenBucketRateLimiter(rate=1, burst=1, max_size=2, clock=make_clock())
+
+    for key in ('key-1', 'key-2', 'key-1', 'key-3'):
+        limiter.acquire(key)
+
+    assert len(limiter) == 2
+    # key-2 was the least recently used one.
+    assert limiter.acquire('key-1') > 0
+    assert limiter.acquire('key-2') == 0.0
+
+
+def test_token_bucket_rate_limiter_should_reject_invalid_configuration():
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(rate=0, burst=1)
+
+
+def test_provide_rate_limiter_should_build_limiter_from_config():
+    assert provide_rate_limiter({}) is None
+    assert provide_rate_limiter({REQUEST_AUTH_RATE_LIMIT: '0'}) is None
+
+    limiter = provide_rate_limiter({REQUEST_AUTH_RATE_LIMIT: '0.5', REQUEST_AUTH_RATE_LIMIT_BURST: '2'})
+
+    assert isinstance(limiter, TokenBucketRateLimiter)
+    assert limiter.acquire('key') == 0.0
+    assert limiter.acquire('key') == 0.0
+    assert limiter.acquire('key') > 0
@@ -0,0 +1,216 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import multiprocessing
+import threading
+from multiprocessing import shared_memory
+from unittest.mock import create_autospec
+from uuid import uuid4
+
+import pytest
+from rndi.authentication.starlette.contract import CredentialsRepository
+from rndi.authentication.starlette.repositories.shared import SharedMemoryCredentialsRepository
+
+CREDENTIALS = {
+    'key-1': {'client_key': 'key-1', 'client_secret': 'secret-1', 'resource_owner_secret': ''},
+    'key-2': {'client_key': 'key-2', 'client_secret': 'secret-2', 'resource_owner_secret': ''},
+    'key-3': {'client_key': 'key-3', 'client_secret': 'secret-3', 'resource_owner_secret': ''},
+}
+
+
+@pytest.fixture
+def make_shared_repository():
+    name = f'rndi-test-{uuid4().hex[:12]}'
+    repositories = []
+
+    def __(repository: CredentialsRepository, **kwargs) -> SharedMemoryCredentialsRepository:
+        shared = SharedMemoryCredentialsRepository(repository, name=name, **kwargs)
+        repositories.append(shared)
+        return shared
+
+    yield __
+
+    repositories[0].unlink()
+    for repository in repositories:
+        repository.close()
+
+
+def test_shared_memory_credentials_repository_should_share_entries_between_instances(
+        make_shared_repository,
+        make_counting_credential_repository,
+):
+    first_backend = make_counting_credential_repository(CREDENTIALS)
+    second_backend = make_counting_credential_repository(CREDENTIALS)
+    first = make_shared_repository(first_backend)
+    second = make_shared_repository(second_backend)
+
+    assert first.get('key-1') == CREDENTIALS['key-1']
+    assert first.get('unknown') == {}
+    assert second.get('key-1') == CREDENTIALS['key-1']
+    assert second.get('unknown') == {}
+
+    assert first_backend.calls == 2
+    assert second_backend.calls == 0
+
+
+def test_shared_memory_credentials_repository_should_invalidate_all_workers_with_generation(
+        make_shared_repository,
+        make_counting_credential_repository,
+):
+    first_backend = make_counting_credential_repository(CREDENTIALS)
+    first = make_shared_repository(first_backend)
+    second = make_shared_repository(make_counting_credential_repository(CREDENTIALS))
+
+    first.get('key-1')
+    first.get('key-2')
+    second.invalidate('key-1')
+    first.get('key-1')
+    first.get('key-2')
+    assert first_backend.calls == 3
+
+    generation = first.generation
+    second.invalidate()
+    assert first.generation == generation + 1
+
+    first.get('key-2')
+    assert first_backend.calls == 4
+
+
+def test_shared_memory_credentials_repository_should_expire_entries(
+        make_shared_repository,
+        make_clock,
+        make_counting_credential_repository,
+):
+    clock = make_clock(1000.0)
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = make_shared_repository(backend, ttl=10, negative_ttl=1, clock=clock)
+
+    repository.get('key-1')
+    repository.get('unknown')
+    clock.now += 1
+    repository.get('key-1')
+    repository.get('unknown')
+    assert backend.calls == 3
+
+    clock.now += 10
+    repository.get('key-1')
+    assert backend.calls == 4
+
+
+def test_shared_memory_credentials_repository_should_handle_collisions_and_large_entries(
+        make_shared_repository,
+        make_counting_credential_repository,
+):
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = make_shared_repository(backend, slots=1, slot_size=128)
+
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert repository.get('key-2') == CREDENTIALS['key-2']
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert backend.calls == 3
+
+    backend.get = lambda key: {'client_key': key, 'client_secret': 'x' * 200}
+    assert repository.get('large')['client_secret'] == 'x' * 200
+    assert repository.get('large')['client_secret'] == 'x' * 200
+
+
+def test_shared_memory_credentials_repository_should_get_many(
+        make_shared_repository,
+        make_counting_credential_repository,
+):
+    backend = make_counting_credential_repository(CREDENTIALS)
+    repository = make_shared_repository(backend)
+
+    repository.get('key-1')
+    assert repository.get_many(['key-1', 'key-2', 'unknown']) == {
+        'key-1': CREDENTIALS['key-1'],
+        'key-2': CREDENTIALS['key-2'],
+        'unknown': {},
+    }
+    assert repository.get_many(['key-2', 'unknown'])['key-2'] == CREDENTIALS['key-2']
+    assert backend.calls == 3
+
+
+def test_shared_memory_credentials_repository_should_reject_different_layouts(
+        make_shared_repository,
+        make_counting_credential_repository,
+):
+    make_shared_repository(make_counting_credential_repository(CREDENTIALS), slots=8)
+
+    with pytest.raises(ValueError):
+        make_shared_repository(make_counting_credential_repository(CREDENTIALS), slots=16)
+    with pytest.raises(ValueError):
+        SharedMemoryCredentialsRepository(make_counting_credential_repository(CREDENTIALS), slots=0)
+
+
+def test_shared_memory_credentials_repository_should_serialize_the_writers(
+        make_shared_repository,
+        make_counting_credential_repository,
+):
+    second = make_shared_repository(make_counting_credential_repository(CREDENTIALS), slots=1)
+    writer = threading.Thread(target=second.get, args=('key-2',))
+    blocked = []
+
+    def clock() -> float:
+        # called by the first writer while holding the slot.
+        if not writer.is_alive() and not blocked:
+            writer.start()
+            writer.join(0.2)
+            blocked.append(writer.is_alive())
+        return 1000.0
+
+    first = make_shared_repository(make_counting_credential_repository(CREDENTIALS), slots=1, clock=clock)
+    first.get('key-1')
+    writer.join(5)
+
+    assert blocked == [True]
+    assert second.get('key-2') == CREDENTIALS['key-2']
+    assert second.get('key-1') == CREDENTIALS['key-1']
+
+
+def _lookup(name: str, key: str, queue):
+    # the spawned process cannot use the fixtures.
+    backend = create_autospec(CredentialsRepository, instance=True)
+    repository = SharedMemoryCredentialsRepository(backend, name=name)
+    queue.put((repository.get(key), len(backend.method_calls)))
+    repository.close()
+
+
+def test_shared_memory_credentials_repository_should_be_warmed_by_other_processes(
+        make_shared_repository,
+        make_counting_credential_repository,
+):
+    repository = make_shared_repository(make_counting_credential_repository(CREDENTIALS))
+    repository.get('key-3')
+
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_lookup, args=(repository.name, 'key-3', queue))
+    process.start()
+    process.join(30)
+
+    assert queue.get(timeout=5) == (CREDENTIALS['key-3'], 0)
+
+
+def _create(name: str, unlink_at_exit: bool):
+    backend = create_autospec(CredentialsRepository, instance=True)
+    SharedMemoryCredentialsRepository(backend, name=name, slots=8, unlink_at_exit=unlink_at_exit).close()
+
+
+@pytest.mark.parametrize('unlink_at_exit', [True, False])
+def test_shared_memory_credentials_repository_should_be_unlinked_when_the_creator_exits(unlink_at_exit):
+    name = f'rndi-test-{uuid4().hex[:12]}'
+
+    process = multiprocessing.get_context('spawn').Process(target=_create, args=(name, unlink_at_exit))
+    process.start()
+    process.join(30)
+
+    if unlink_at_exit:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+    else:
+        repository = SharedMemoryCredentialsRepository(create_autospec(CredentialsRepository), name=name, slots=8)
+        repository.unlink()
+        repository.close()
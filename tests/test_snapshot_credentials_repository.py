@@ -0,0 +1,81 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+from threading import Event
+
+import pytest
+from rndi.authentication.starlette.repositories.snapshot import SnapshotCredentialsRepository
+
+CREDENTIALS = {
+    'key-1': {'client_key': 'key-1', 'client_secret': 'secret-1', 'resource_owner_secret': ''},
+    'key-2': {'client_key': 'key-2', 'client_secret': 'secret-2', 'resource_owner_secret': ''},
+}
+
+
+def test_snapshot_credentials_repository_should_serve_credentials_from_memory():
+    calls = []
+    repository = SnapshotCredentialsRepository(lambda: calls.append(1) or CREDENTIALS)
+
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert repository.get('unknown') == {}
+    assert repository.get_many(['key-2', 'unknown']) == {'key-2': CREDENTIALS['key-2'], 'unknown': {}}
+    assert len(repository) == 2
+    assert len(calls) == 1
+
+    with pytest.raises(TypeError):
+        repository.snapshot['key-3'] = {}
+
+
+def test_snapshot_credentials_repository_should_fail_fast_at_startup():
+    def loader():
+        raise ConnectionError('unreachable')
+
+    with pytest.raises(ConnectionError):
+        SnapshotCredentialsRepository(loader)
+
+
+def test_snapshot_credentials_repository_should_keep_previous_snapshot_on_failed_refresh(make_logger):
+    snapshots = [CREDENTIALS, ConnectionError('unreachable'), {'key-3': {'client_key': 'key-3'}}]
+    warnings = []
+
+    def loader():
+        snapshot = snapshots.pop(0)
+        if isinstance(snapshot, Exception):
+            raise snapshot
+        return snapshot
+
+    logger = make_logger({'warning': lambda *args: warnings.append(args)})
+    repository = SnapshotCredentialsRepository(loader, logger=logger)
+    previous = repository.snapshot
+
+    assert not repository.refresh()
+    assert repository.snapshot is previous
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert len(warnings) == 1
+
+    assert repository.refresh()
+    assert repository.get('key-1') == {}
+    assert repository.get('key-3') == {'client_key': 'key-3'}
+    assert repository.age >= 0
+
+
+def test_snapshot_credentials_repository_should_refresh_in_background():
+    refreshed = Event()
+    loads = []
+
+    def loader():
+        loads.append(1)
+        if len(loads) > 1:
+            refreshed.set()
+            return {'key-2': CREDENTIALS['key-2']}
+        return {'key-1': CREDENTIALS['key-1']}
+
+    repository = SnapshotCredentialsRepository(loader, refresh_interval=0.01)
+    try:
+        assert refreshed.wait(5)
+    finally:
+        repository.close(timeout=5)
+
+    assert repository.get('key-2') == CREDENTIALS['key-2']
@@ -0,0 +1,81 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from rndi.authentication.starlette.repositories.sqlite import SQLiteCredentialsRepository
+
+CREDENTIALS = {
+    f'key-{i}': {'client_key': f'key-{i}', 'client_secret': f'secret-{i}', 'resource_owner_secret': ''}
+    for i in range(1200)
+}
+
+
+def test_sqlite_credentials_repository_should_store_and_get_credentials(tmp_path):
+    repository = SQLiteCredentialsRepository(str(tmp_path / 'credentials.db'))
+    repository.put_many(CREDENTIALS)
+
+    assert repository.get('key-1') == CREDENTIALS['key-1']
+    assert repository.get('unknown') == {}
+
+    repository.put('key-1', {'client_key': 'key-1', 'client_secret': 'rotated'})
+    assert repository.get('key-1')['client_secret'] == 'rotated'
+
+    repository.delete('key-1')
+    assert repository.get('key-1') == {}
+
+    repository.close()
+
+
+def test_sqlite_credentials_repository_should_get_many_credentials_in_chunks(tmp_path):
+    repository = SQLiteCredentialsRepository(str(tmp_path / 'credentials.db'))
+    repository.put_many(CREDENTIALS)
+
+    keys = list(CREDENTIALS) + ['unknown', 'key-0']
+    credentials = repository.get_many(keys)
+
+    assert len(credentials) == 1201
+    assert credentials['key-1100'] == CREDENTIALS['key-1100']
+    assert credentials['unknown'] == {}
+
+
+def test_sqlite_credentials_repository_should_use_wal_and_a_connection_per_thread(tmp_path):
+    path = str(tmp_path / 'credentials.db')
+    writer = SQLiteCredentialsRepository(path)
+    writer.put_many(CREDENTIALS)
+
+    assert sqlite3.connect(path).execute('PRAGMA journal_mode').fetchone() == ('wal',)
+
+    reader = SQLiteCredentialsRepository(path, read_only=True)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(reader.get, CREDENTIALS))
+    assert results == list(CREDENTIALS.values())
+
+    with pytest.raises(sqlite3.OperationalError):
+        reader.put('key-1', {})
+
+    reader.close()
+    writer.close()
+
+
+def test_sqlite_credentials_repository_should_reject_invalid_table_names(tmp_path):
+    with pytest.raises(ValueError):
+        SQLiteCredentialsRepository(str(tmp_path / 'credentials.db'), table='credentials; DROP TABLE x')
+
+
+@pytest.mark.parametrize('name', ['what?.db', 'hash#1.db', '100%25.db', 'café.db'])
+def test_sqlite_credentials_repository_should_open_read_only_paths_with_uri_characters(tmp_path, name):
+    path = str(tmp_path / name)
+    writer = SQLiteCredentialsRepository(path)
+    writer.put('key-1', CREDENTIALS['key-1'])
+
+    reader = SQLiteCredentialsRepository(path, read_only=True)
+    assert reader.get('key-1') == CREDENTIALS['key-1']
+    assert sorted(p.name for p in tmp_path.iterdir() if p.suffix == '.db') == [name]
+
+    reader.close()
+    writer.close()
@@ -0,0 +1,122 @@
+#
+# This file is part of the Ingram Micro CloudBlue RnD Integration Connectors SDK.
+#
+# Copyright (c) 2023 Ingram Micro. All Rights Reserved.
+#
+import logging
+
+from rndi.authentication.starlette.log import (
+    provide_log_throttle_interval,
+    REQUEST_AUTH_LOG_THROTTLE_INTERVAL,
+    throttle,
+    ThrottledLoggerAdapter,
+)
+
+
+def make_logger(name: str) -> logging.LoggerAdapter:
+    return logging.LoggerAdapter(logging.getLogger(name), {})
+
+
+def no_schedule(delay: float, callback):
+    pass
+
+
+def test_throttled_logger_should_log_first_occurrence_and_periodic_summary(caplog, make_clock):
+    clock = make_clock()
+    logger = ThrottledLoggerAdapter(make_logger('test-throttle'), interval=10, clock=clock, schedule=no_schedule)
+
+    with caplog.at_level(logging.WARNING, logger='test-throttle'):
+        for i in range(5):
+            logger.warning('unauthorized request %d', i)
+        logger.error('another message')
+
+        clock.now = 10.0
+        logger.warning('unauthorized request %d', 5)
+
+    assert caplog.messages == [
+        'unauthorized request 0',
+        'another message',
+        'unauthorized request 5 (4 similar messages suppressed in the last 10 seconds)',
+    ]
+
+
+def test_throttled_logger_should_flush_pending_counts(caplog, make_clock):
+    clock = make_clock()
+    logger = ThrottledLoggerAdapter(make_logger('test-flush'), interval=60, clock=clock, schedule=no_schedule)
+
+    with caplog.at_level(logging.WARNING, logger='test-flush'):
+        for i in range(3):
+            logger.warning('unauthorized request %d', i)
+        clock.now = 5.0
+        logger.flush()
+        logger.flush()
+
+    assert caplog.messages == [
+        'unauthorized request 0',
+        'unauthorized request 2 (repeated 2 times in the last 5 seconds)',
+    ]
+
+
+def test_throttled_logger_should_ignore_disabled_levels_and_bound_keys(caplog, make_clock):
+    logger = ThrottledLoggerAdapter(
+        make_logger('test-bound'),
+        interval=60,
+        max_keys=2,
+        clock=make_clock(),
+        schedule=no_schedule,
+    )
+
+    with caplog.at_level(logging.WARNING, logger='test-bound'):
+        logger.debug('disabled')
+        for i in range(3):
+            logger.warning(f'message {i}')
+        logger.warning('message 0')
+
+    assert caplog.messages == ['message 0', 'message 1', 'message 2', 'message 0']
+
+
+def test_throttled_logger_should_report_the_count_when_the_interval_elapses(caplog, make_clock):
+    clock = make_clock()
+    scheduled = []
+    logger = ThrottledLoggerAdapter(
+        make_logger('test-elapsed'),
+        interval=10,
+        clock=clock,
+        schedule=lambda delay, callback: scheduled.append((delay, callback)),
+    )
+
+    with caplog.at_level(logging.WARNING, logger='test-elapsed'):
+        logger.warning('unauthorized request %d', 0)
+        clock.now = 4.0
+        logger.warning('another message')
+        logger.warning('unauthorized request %d', 1)
+        logger.warning('another message')
+        logger.warning('unauthorized request %d', 2)
+
+        # a single timer is pending, for the end of the first interval.
+        assert [delay for delay, _ in scheduled] == [6.0]
+        clock.now = 10.0
+        scheduled.pop()[1]()
+
+        assert [delay for delay, _ in scheduled] == [4.0]
+        clock.now = 14.0
+        scheduled.pop()[1]()
+
+    assert scheduled == []
+    assert caplog.messages == [
+        'unauthorized request 0',
+        'another message',
+        'unauthorized request 2 (repeated 2 times in the last 10 seconds)',
+        'another message (repeated 1 times in the last 10 seconds)',
+    ]
+
+
+def test_provide_log_throttle_interval_should_read_config():
+    assert provide_log_throttle_interval({}) is None
+    assert provide_log_throttle_interval({}, 60.0) == 60.0
+    assert provide_log_throttle_interval({REQUEST_AUTH_LOG_THROTTLE_INTERVAL: '0'}, 60.0) is None
+    assert provide_log_throttle_interval({REQUEST_AUTH_LOG_THROTTLE_INTERVAL: '5'}) == 5.0
+
+    logger = make_logger('test-provide')
+    assert throttle(logger, None) is logger
+    assert isinstance(throttle(logger, 5.0), ThrottledLoggerAdapter)
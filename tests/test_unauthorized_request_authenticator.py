@@ -3,10 +3,16 @@
 #
 # Copyright (c) 2023 Ingram Micro. All Rights Reserved.
 #
+import asyncio
+import logging
+
 import pytest
 from starlette.exceptions import HTTPException
 from starlette.requests import Request
-from rndi.authentication.starlette.adapters.unauthorized import UnauthorizedRequestAuthenticatorAdapter
+from rndi.authentication.starlette.adapters.unauthorized import (
+    AsyncUnauthorizedRequestAuthenticatorAdapter,
+    UnauthorizedRequestAuthenticatorAdapter,
+)
 
 
 def test_unauthorized_request_authenticator_should_authenticate_given_request(make_logger):
@@ -18,3 +24,31 @@ def test_unauthorized_request_authenticator_should_authenticate_given_request(ma
 
     with pytest.raises(HTTPException):
         authenticator.authenticate(request)
+
+
+def test_async_unauthorized_request_authenticator_should_authenticate_given_request(make_logger):
+    request = Request({
+        'type': 'http',
+    })
+
+    authenticator = AsyncUnauthorizedRequestAuthenticatorAdapter(make_logger())
+
+    with pytest.raises(HTTPException):
+        asyncio.run(authenticator.authenticate(request))
+
+
+def test_unauthorized_request_authenticator_should_aggregate_warnings(caplog):
+    request = Request({
+        'type': 'http',
+    })
+
+    authenticator = UnauthorizedRequestAuthenticatorAdapter(
+        logging.LoggerAdapter(logging.getLogger('test-unauthorized'), {}),
+    )
+
+    with caplog.at_level(logging.WARNING, logger='test-unauthorized'):
+        for _ in range(100):
+            with pytest.raises(HTTPException):
+                authenticator.authenticate(request)
+
+    assert len(caplog.messages) == 1